@@ -21,7 +21,10 @@ if config.config_file_name is not None:
 from app.db.session import Base  # noqa: E402
 from app.models.user import User  # noqa: F401, E402
 from app.models.group import Group, GroupMember  # noqa: F401, E402
-from app.models.expense import Expense  # noqa: F401, E402
+from app.models.expense import Expense, ExpenseSplit  # noqa: F401, E402
+from app.models.refresh_token import RefreshToken  # noqa: F401, E402
+from app.models.revoked_token import RevokedToken  # noqa: F401, E402
+from app.models.group_balance import GroupBalance  # noqa: F401, E402
 
 target_metadata = Base.metadata
 
@@ -0,0 +1,69 @@
+"""Indexes for the expense and membership lookups.
+
+Built with CREATE INDEX CONCURRENTLY on PostgreSQL, so the tables stay
+writable while this runs. IF NOT EXISTS lets this apply to databases that
+were bootstrapped with create_all. A concurrent build that fails leaves an
+INVALID index behind, which IF NOT EXISTS would then skip: drop it before
+re-running the upgrade.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 04:02:11.204118
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Duplicate memberships would make the unique index build fail; keep the oldest
+    op.execute(
+        "DELETE FROM group_members WHERE id NOT IN "
+        "(SELECT MIN(id) FROM group_members GROUP BY group_id, user_id)"
+    )
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_expenses_group_id_created_at_id',
+            'expenses',
+            ['group_id', sa.text('created_at DESC'), 'id'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            op.f('ix_expenses_paid_by_user_id'),
+            'expenses',
+            ['paid_by_user_id'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'uq_group_members_group_id_user_id',
+            'group_members',
+            ['group_id', 'user_id'],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_group_members_user_id_group_id',
+            'group_members',
+            ['user_id', 'group_id'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_group_members_user_id_group_id', table_name='group_members', postgresql_concurrently=True)
+        op.drop_index('uq_group_members_group_id_user_id', table_name='group_members', postgresql_concurrently=True)
+        op.drop_index(op.f('ix_expenses_paid_by_user_id'), table_name='expenses', postgresql_concurrently=True)
+        op.drop_index('ix_expenses_group_id_created_at_id', table_name='expenses', postgresql_concurrently=True)
@@ -0,0 +1,56 @@
+"""Per-member balance ledger, backfilled from existing expenses.
+
+Shares are the group total split equally between current members, rounded
+to four places like the application does. Run
+python -m app.utils.rebuild_balances afterwards to confirm there is no drift.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 04:01:45.194183
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('group_balances',
+    sa.Column('group_id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('paid_total', sa.Numeric(precision=14, scale=2), nullable=False),
+    sa.Column('share_total', sa.Numeric(precision=16, scale=4), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['group_id'], ['groups.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('group_id', 'user_id')
+    )
+
+    op.execute(
+        "INSERT INTO group_balances (group_id, user_id, paid_total, share_total, updated_at) "
+        "SELECT group_id, paid_by_user_id, SUM(amount), 0, CURRENT_TIMESTAMP "
+        "FROM expenses GROUP BY group_id, paid_by_user_id"
+    )
+    op.execute(
+        "INSERT INTO group_balances (group_id, user_id, paid_total, share_total, updated_at) "
+        "SELECT m.group_id, m.user_id, 0, 0, CURRENT_TIMESTAMP FROM group_members m "
+        "WHERE NOT EXISTS (SELECT 1 FROM group_balances b "
+        "WHERE b.group_id = m.group_id AND b.user_id = m.user_id)"
+    )
+    op.execute(
+        "UPDATE group_balances SET share_total = ROUND("
+        "(SELECT SUM(b.paid_total) FROM group_balances b WHERE b.group_id = group_balances.group_id) "
+        "/ (SELECT COUNT(*) FROM group_members m WHERE m.group_id = group_balances.group_id), 4) "
+        "WHERE EXISTS (SELECT 1 FROM group_members m "
+        "WHERE m.group_id = group_balances.group_id AND m.user_id = group_balances.user_id)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('group_balances')
@@ -0,0 +1,69 @@
+"""Per-member expense splits; ledger shares become the sum of a member's splits.
+
+Existing expenses are split equally, in whole cents, between the group's
+current members, which is what the ledger assumed so far. Leftover cents go
+to the lowest user ids, as in app.core.splits.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 04:08:34.549847
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('expense_splits',
+    sa.Column('expense_id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('share_cents', sa.BigInteger(), nullable=False),
+    sa.ForeignKeyConstraint(['expense_id'], ['expenses.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('expense_id', 'user_id')
+    )
+
+    op.execute(
+        "INSERT INTO expense_splits (expense_id, user_id, share_cents) "
+        "SELECT id, user_id, base + CASE WHEN position <= leftover THEN 1 ELSE 0 END FROM ("
+        "SELECT e.id, m.user_id, "
+        "CAST(ROUND(e.amount * 100) AS BIGINT) / c.members AS base, "
+        "CAST(ROUND(e.amount * 100) AS BIGINT) % c.members AS leftover, "
+        "ROW_NUMBER() OVER (PARTITION BY e.id ORDER BY m.user_id) AS position "
+        "FROM expenses e "
+        "JOIN group_members m ON m.group_id = e.group_id "
+        "JOIN (SELECT group_id, COUNT(*) AS members FROM group_members GROUP BY group_id) c "
+        "ON c.group_id = e.group_id"
+        ") shares"
+    )
+    op.execute(
+        "INSERT INTO group_balances (group_id, user_id, paid_total, share_total, updated_at) "
+        "SELECT DISTINCT e.group_id, s.user_id, 0, 0, CURRENT_TIMESTAMP "
+        "FROM expense_splits s JOIN expenses e ON e.id = s.expense_id "
+        "WHERE NOT EXISTS (SELECT 1 FROM group_balances b "
+        "WHERE b.group_id = e.group_id AND b.user_id = s.user_id)"
+    )
+    op.execute(
+        "UPDATE group_balances SET share_total = COALESCE(("
+        "SELECT SUM(s.share_cents) FROM expense_splits s JOIN expenses e ON e.id = s.expense_id "
+        "WHERE e.group_id = group_balances.group_id AND s.user_id = group_balances.user_id"
+        "), 0) / 100.0"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('expense_splits')
+    # Back to the group total split equally between current members (see 0003)
+    op.execute(
+        "UPDATE group_balances SET share_total = CASE WHEN EXISTS (SELECT 1 FROM group_members m "
+        "WHERE m.group_id = group_balances.group_id AND m.user_id = group_balances.user_id) THEN ROUND("
+        "(SELECT SUM(b.paid_total) FROM group_balances b WHERE b.group_id = group_balances.group_id) "
+        "/ (SELECT COUNT(*) FROM group_members m WHERE m.group_id = group_balances.group_id), 4) ELSE 0 END"
+    )
@@ -0,0 +1,27 @@
+"""groups.version, bumped by every write to a group; keys cached group reads.
+
+Adding a column with a constant default does not rewrite the table on
+PostgreSQL 11+.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17 04:12:05.029510
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('groups', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('groups', 'version')
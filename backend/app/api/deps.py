@@ -1,44 +1,110 @@
+import time
 from typing import AsyncGenerator
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
 
-from app.db.session import get_db_session
+from app.db.session import get_db_session, get_read_db_session
 from app.core.security import verify_token
+from app.core.principal_cache import get_cached_principal, cache_principal
+from app.core.revocation import revocation_list
 from app.repositories.user_repository import UserRepository
+from app.models.user import User
 
 security = HTTPBearer()
 
+# Set after successful writes; reads carrying it go to the primary until it expires
+PRIMARY_PIN_COOKIE = "primary_pin"
+PRIMARY_PIN_HEADER = "X-Read-Primary"
+
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     async for session in get_db_session():
         yield session
 
 
+def is_pinned_to_primary(request: Request) -> bool:
+    if request.headers.get(PRIMARY_PIN_HEADER):
+        return True
+    pinned_until = request.cookies.get(PRIMARY_PIN_COOKIE)
+    try:
+        return pinned_until is not None and float(pinned_until) > time.time()
+    except ValueError:
+        return False
+
+
+async def get_read_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Session for read-only routes: the replica unless the client just wrote."""
+    sessions = get_db_session() if is_pinned_to_primary(request) else get_read_db_session()
+    async for session in sessions:
+        yield session
+
+
+# Identity columns routes read from current_user; the password hash is never cached
+_PRINCIPAL_COLUMNS = ("id", "email", "full_name", "created_at", "updated_at")
+
+
+def _snapshot_user(user: User) -> dict:
+    return {column: getattr(user, column) for column in _PRINCIPAL_COLUMNS}
+
+
+async def _restore_user(session: AsyncSession, snapshot: dict) -> User:
+    # Rebuild the identity as a detached instance and attach it without a SELECT
+    user = User(**snapshot)
+    make_transient_to_detached(user)
+    return await session.merge(user, load=False)
+
+
+async def _release_connection(session: AsyncSession) -> None:
+    # Write routes run on their own primary session; ending the read-only
+    # transaction here hands its connection back before the route takes one,
+    # instead of holding two per request (from one pool without a replica).
+    # expire_on_commit=False keeps the principal loaded.
+    await session.commit()
+
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    session: AsyncSession = Depends(get_session)
+    session: AsyncSession = Depends(get_read_session)
 ) -> "User":
     """Get the current authenticated user."""
     token = credentials.credentials
     payload = verify_token(token)
     user_id = payload.get("sub")
-    
+
     if user_id is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    
+
+    jti = payload.get("jti")
+    if jti is not None and await revocation_list.is_revoked(session, jti):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has been revoked",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    user_id = int(user_id)
+    snapshot = get_cached_principal(user_id)
+    if snapshot is not None:
+        user = await _restore_user(session, snapshot)
+        await _release_connection(session)
+        return user
+
     repo = UserRepository(session)
-    user = await repo.get_by_id(int(user_id))
-    
+    user = await repo.get_by_id(user_id)
+
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    
+
+    cache_principal(user_id, _snapshot_user(user))
+    await _release_connection(session)
     return user
@@ -0,0 +1,36 @@
+import hashlib
+from typing import Optional
+
+from fastapi import Request, Response, status
+
+# Clients may keep the response but must revalidate it before every use
+CACHE_CONTROL = "private, no-cache"
+
+
+def group_etag(kind: str, group_id: int, version: int, *parts: object) -> str:
+    """Strong ETag for a read of ``group_id`` at ``version``.
+
+    ``parts`` are whatever else shapes the response (the caller's id, paging
+    parameters); they are hashed so the tag stays short.
+    """
+    digest = hashlib.sha256(repr((kind, parts)).encode()).hexdigest()[:16]
+    return f'"g{group_id}.v{version}.{digest}"'
+
+
+def set_etag(response: Response, etag: str) -> None:
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+
+
+def not_modified(request: Request, etag: str) -> Optional[Response]:
+    """A 304 response if the request's If-None-Match matches ``etag``, else None."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return None
+    # If-None-Match uses the weak comparison, so W/"x" matches "x"
+    tags = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    if "*" not in tags and etag not in tags:
+        return None
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    set_etag(response, etag)
+    return response
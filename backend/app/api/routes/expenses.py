@@ -1,13 +1,29 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from typing import Optional, Union
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_session, get_current_user
-from app.schemas.expense import ExpenseCreate, ExpenseUpdate, ExpenseRead, ExpenseSummary, BalanceSummary
+from app.api.deps import get_session, get_read_session, get_current_user, is_pinned_to_primary
+from app.api.etag import group_etag, not_modified, set_etag
+from app.schemas.expense import (
+    ExpenseCreate, ExpenseUpdate, ExpenseRead, ExpensePage, ExpenseSummary, BalanceSummary, SettlementPlan,
+    ExpenseBulkCreate, ExpenseBulkCreateResult, ExpenseBulkDelete, ExpenseBulkDeleteResult, ExpenseImportResult,
+)
+from app.core.expense_import import ImportFormat, iter_rows
+from app.core.expense_export import ExportFormat, MEDIA_TYPES
 from app.services.expense_service import ExpenseService
 from app.models.user import User
 
 router = APIRouter(prefix="/expenses", tags=["expenses"])
 
+CURSOR_QUERY = Query(
+    None,
+    description=(
+        "Keyset pagination: pass next_cursor from the previous page, or an empty "
+        "value for the first page. Returns a page object instead of a list."
+    ),
+)
+
 
 @router.post("/", response_model=ExpenseRead, status_code=status.HTTP_201_CREATED)
 async def create_expense(
@@ -22,23 +38,57 @@ async def create_expense(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
-@router.get("/", response_model=list[ExpenseRead])
+@router.post("/bulk", response_model=ExpenseBulkCreateResult)
+async def create_expenses(
+    payload: ExpenseBulkCreate,
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session)
+) -> ExpenseBulkCreateResult:
+    """Create many expenses paid by the current user in one transaction; invalid items are reported per index"""
+    service = ExpenseService(session)
+    try:
+        return await service.create_expenses(payload.expenses, current_user.id, payload.atomic)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.post("/bulk/delete", response_model=ExpenseBulkDeleteResult)
+async def delete_expenses(
+    payload: ExpenseBulkDelete,
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session)
+) -> ExpenseBulkDeleteResult:
+    """Delete many of the current user's expenses in one transaction; failures are reported per index"""
+    service = ExpenseService(session)
+    try:
+        return await service.delete_expenses(payload.expense_ids, current_user.id, payload.atomic)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.get("/", response_model=Union[list[ExpenseRead], ExpensePage])
 async def get_all_expenses(
     current_user: User = Depends(get_current_user),
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
     limit: int = Query(100, ge=1, le=1000),
-    offset: int = Query(0, ge=0)
-) -> list[ExpenseRead]:
+    offset: int = Query(0, ge=0),
+    cursor: Optional[str] = CURSOR_QUERY
+) -> Union[list[ExpenseRead], ExpensePage]:
     """Get all expenses for the current user across all groups they're a member of"""
     service = ExpenseService(session)
-    return await service.get_user_expenses(current_user.id, limit, offset)
+    if cursor is None:
+        return await service.get_user_expenses(current_user.id, limit, offset)
+    try:
+        return await service.get_user_expenses_page(current_user.id, limit, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
 @router.get("/{expense_id}", response_model=ExpenseRead)
 async def get_expense(
     expense_id: int,
     current_user: User = Depends(get_current_user),
-    session: AsyncSession = Depends(get_session)
+    session: AsyncSession = Depends(get_read_session)
 ) -> ExpenseRead:
     service = ExpenseService(session)
     expense = await service.get_expense(expense_id)
@@ -79,42 +129,136 @@ async def delete_expense(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
-@router.get("/groups/{group_id}", response_model=list[ExpenseRead])
+@router.get("/groups/{group_id}", response_model=Union[list[ExpenseRead], ExpensePage])
 async def get_group_expenses(
     group_id: int,
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
     limit: int = Query(100, ge=1, le=1000),
-    offset: int = Query(0, ge=0)
-) -> list[ExpenseRead]:
+    offset: int = Query(0, ge=0),
+    cursor: Optional[str] = CURSOR_QUERY
+) -> Union[list[ExpenseRead], ExpensePage, Response]:
     service = ExpenseService(session)
     try:
-        return await service.get_group_expenses(group_id, current_user.id, limit, offset)
+        # The version is read before the rows, so the tag is never newer than the page it labels
+        version = await service.get_group_version(group_id, current_user.id, "view expenses")
+        etag = group_etag("expenses", group_id, version, current_user.id, limit, offset, cursor)
+        if unchanged := not_modified(request, etag):
+            return unchanged
+
+        if cursor is not None:
+            page = await service.get_group_expenses_page(group_id, current_user.id, limit, cursor)
+        else:
+            page = await service.get_group_expenses(group_id, current_user.id, limit, offset)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    set_etag(response, etag)
+    return page
 
 
 @router.get("/groups/{group_id}/summary", response_model=ExpenseSummary)
 async def get_group_expense_summary(
     group_id: int,
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
-    session: AsyncSession = Depends(get_session)
-) -> ExpenseSummary:
+    session: AsyncSession = Depends(get_read_session)
+) -> Union[ExpenseSummary, Response]:
     service = ExpenseService(session)
     try:
-        return await service.get_group_expense_summary(group_id, current_user.id)
+        version = await service.get_group_version(group_id, current_user.id, "view expense summary")
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if unchanged := not_modified(request, group_etag("summary", group_id, version, current_user.id)):
+        return unchanged
+
+    # Clients that just wrote must see their write, not the previous cached version
+    served_version, summary = await service.read_group_expense_summary(
+        group_id, version, allow_stale=not is_pinned_to_primary(request)
+    )
+    set_etag(response, group_etag("summary", group_id, served_version, current_user.id))
+    return summary
 
 
 @router.get("/groups/{group_id}/balance", response_model=BalanceSummary)
 async def get_group_balance_summary(
     group_id: int,
+    request: Request,
+    response: Response,
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_read_session)
+) -> Union[BalanceSummary, Response]:
+    service = ExpenseService(session)
+    try:
+        version = await service.get_group_version(group_id, current_user.id, "view balance summary")
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if unchanged := not_modified(request, group_etag("balance", group_id, version, current_user.id)):
+        return unchanged
+
+    # Clients that just wrote must see their write, not the previous cached version
+    served_version, balances = await service.read_group_balance_summary(
+        group_id, version, allow_stale=not is_pinned_to_primary(request)
+    )
+    set_etag(response, group_etag("balance", group_id, served_version, current_user.id))
+    return balances
+
+
+@router.post(
+    "/groups/{group_id}/import",
+    response_model=ExpenseImportResult,
+    openapi_extra={"requestBody": {"required": True, "content": {"text/csv": {}, "application/x-ndjson": {}}}},
+)
+async def import_group_expenses(
+    group_id: int,
+    request: Request,
+    format: ImportFormat = Query("csv", description="csv (with a header row) or ndjson"),
+    atomic: bool = Query(False, description="Reject the whole file if any row is invalid"),
     current_user: User = Depends(get_current_user),
     session: AsyncSession = Depends(get_session)
-) -> BalanceSummary:
+) -> ExpenseImportResult:
+    """Import expenses paid by the current user from the request body, read as it streams in"""
+    service = ExpenseService(session)
+    try:
+        return await service.import_expenses(group_id, current_user.id, iter_rows(request.stream(), format), atomic)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.get(
+    "/groups/{group_id}/export",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/csv": {}, "application/x-ndjson": {}}}},
+)
+async def export_group_expenses(
+    group_id: int,
+    format: ExportFormat = Query("csv", description="csv or ndjson"),
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_read_session)
+) -> StreamingResponse:
+    """All of a group's expenses, oldest first, written out as they are read"""
+    service = ExpenseService(session)
+    try:
+        chunks = await service.export_group_expenses(group_id, current_user.id, format)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    filename = f"group-{group_id}-expenses.{format}"
+    return StreamingResponse(
+        chunks, media_type=MEDIA_TYPES[format], headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
+@router.get("/groups/{group_id}/settlements", response_model=SettlementPlan)
+async def get_group_settlements(
+    group_id: int,
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_read_session)
+) -> SettlementPlan:
+    """Who should pay whom so that every member ends up even"""
     service = ExpenseService(session)
     try:
-        return await service.get_group_balance_summary(group_id, current_user.id)
+        return await service.get_group_settlements(group_id, current_user.id)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
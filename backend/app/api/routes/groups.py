@@ -1,8 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from typing import Union
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_session, get_current_user
-from app.schemas.group import GroupCreate, GroupUpdate, GroupRead, GroupWithMembers, GroupMemberCreate, GroupMemberRead
+from app.api.deps import get_session, get_read_session, get_current_user
+from app.api.etag import group_etag, not_modified, set_etag
+from app.schemas.group import GroupCreate, GroupUpdate, GroupRead, GroupWithMembers, GroupMemberCreate, GroupMemberRead, GroupMembersAdd, GroupMembersAddResult
 from app.services.group_service import GroupService
 from app.models.user import User
 
@@ -25,7 +27,7 @@ async def create_group(
 @router.get("/", response_model=list[GroupRead])
 async def get_user_groups(
     current_user: User = Depends(get_current_user),
-    session: AsyncSession = Depends(get_session)
+    session: AsyncSession = Depends(get_read_session)
 ) -> list[GroupRead]:
     service = GroupService(session)
     return await service.get_user_groups(current_user.id)
@@ -34,13 +36,23 @@ async def get_user_groups(
 @router.get("/{group_id}", response_model=GroupWithMembers)
 async def get_group(
     group_id: int,
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
-    session: AsyncSession = Depends(get_session)
-) -> GroupWithMembers:
+    session: AsyncSession = Depends(get_read_session)
+) -> Union[GroupWithMembers, Response]:
     service = GroupService(session)
+    version = await service.get_group_version(group_id)
+    if version is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Group not found")
+    etag = group_etag("group", group_id, version)
+    if unchanged := not_modified(request, etag):
+        return unchanged
+
     group = await service.get_group(group_id)
     if not group:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Group not found")
+    set_etag(response, etag)
     return group
 
 
@@ -93,6 +105,21 @@ async def add_member(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
+@router.post("/{group_id}/members/bulk", response_model=GroupMembersAddResult)
+async def add_members(
+    group_id: int,
+    payload: GroupMembersAdd,
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session)
+) -> GroupMembersAddResult:
+    """Add several users at once; each id is reported as added, already a member or unknown"""
+    service = GroupService(session)
+    try:
+        return await service.add_members(group_id, payload.user_ids, current_user.id)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
 @router.delete("/{group_id}/members/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def remove_member(
     group_id: int,
@@ -113,7 +140,7 @@ async def remove_member(
 async def get_group_members(
     group_id: int,
     current_user: User = Depends(get_current_user),
-    session: AsyncSession = Depends(get_session)
+    session: AsyncSession = Depends(get_read_session)
 ) -> list[GroupMemberRead]:
     service = GroupService(session)
     try:
@@ -0,0 +1,26 @@
+from fastapi import APIRouter
+
+from app.core.admission import login_admission
+from app.core.hashing import password_hash_executor
+from app.core.principal_cache import get_principal_cache_stats
+from app.core.read_cache import group_read_cache
+from app.core.security import verified_token_cache
+from app.core.revocation import revocation_list
+from app.db.pool import pool_status
+from app.db.session import engine
+
+router = APIRouter(prefix="/internal", tags=["internal"])
+
+
+@router.get("/metrics", response_model=dict)
+async def get_metrics() -> dict:
+    """Read-only in-process counters for this worker."""
+    return {
+        "db_pool": pool_status(engine),
+        "principal_cache": get_principal_cache_stats(),
+        "group_read_cache": group_read_cache.stats(),
+        "password_hashing": password_hash_executor.stats(),
+        "token_cache": verified_token_cache.stats(),
+        "revocation": revocation_list.stats(),
+        "login_admission": login_admission.stats(),
+    }
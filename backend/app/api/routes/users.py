@@ -1,29 +1,51 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+import math
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 
-from app.api.deps import get_session, get_current_user
-from app.schemas.user import UserCreate, UserRead, UserUpdate, UserLogin, Token
+from app.api.deps import get_session, get_read_session, get_current_user, security
+from fastapi.security import HTTPAuthorizationCredentials
+from app.core.security import verify_token
+from app.schemas.user import UserCreate, UserRead, UserUpdate, UserLogin, Token, TokenRefresh
 from app.services.user_service import UserService
+from app.core.hashing import HashingSaturatedError
+from app.core.admission import login_admission, AdmissionRejectedError
 from app.models.user import User
 
 router = APIRouter(prefix="/users", tags=["users"]) 
 
 
+def _too_many_requests(e: AdmissionRejectedError) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail=str(e),
+        headers={"Retry-After": str(max(1, math.ceil(e.retry_after)))},
+    )
+
+
 @router.post("/signup", response_model=UserRead, status_code=status.HTTP_201_CREATED)
-async def signup(payload: UserCreate, session: AsyncSession = Depends(get_session)) -> UserRead:
+async def signup(payload: UserCreate, request: Request, session: AsyncSession = Depends(get_session)) -> UserRead:
     service = UserService(session)
     try:
-        return await service.create_user(payload)
+        await login_admission.admit("signup", request.client.host if request.client else None)
+        async with login_admission.verification_slot():
+            return await service.create_user(payload)
+    except AdmissionRejectedError as e:
+        raise _too_many_requests(e)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except HashingSaturatedError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e), headers={"Retry-After": "1"})
 
 
 @router.post("/login", response_model=Token)
-async def login(payload: UserLogin, session: AsyncSession = Depends(get_session)) -> Token:
+async def login(payload: UserLogin, request: Request, session: AsyncSession = Depends(get_session)) -> Token:
     service = UserService(session)
     try:
-        token = await service.authenticate_user(payload)
+        await login_admission.admit("login", request.client.host if request.client else None, payload.email)
+        async with login_admission.verification_slot():
+            token = await service.authenticate_user(payload)
         if not token:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -34,6 +56,10 @@ async def login(payload: UserLogin, session: AsyncSession = Depends(get_session)
     except HTTPException:
         # Re-raise HTTP exceptions as-is
         raise
+    except AdmissionRejectedError as e:
+        raise _too_many_requests(e)
+    except HashingSaturatedError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e), headers={"Retry-After": "1"})
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -42,6 +68,35 @@ async def login(payload: UserLogin, session: AsyncSession = Depends(get_session)
         )
 
 
+@router.post("/token/refresh", response_model=Token)
+async def refresh_token(payload: TokenRefresh, session: AsyncSession = Depends(get_session)) -> Token:
+    service = UserService(session)
+    token = await service.refresh_access_token(payload.refresh_token)
+    if not token:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired refresh token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return token
+
+
+@router.post("/token/revoke", status_code=status.HTTP_204_NO_CONTENT)
+async def revoke_token(payload: TokenRefresh, session: AsyncSession = Depends(get_session)):
+    service = UserService(session)
+    await service.revoke_refresh_token(payload.refresh_token)
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session)
+):
+    service = UserService(session)
+    await service.logout(current_user.id, verify_token(credentials.credentials))
+
+
 @router.get("/me", response_model=UserRead)
 async def get_current_user_profile(current_user: User = Depends(get_current_user)) -> UserRead:
     return UserRead.model_validate(current_user)
@@ -63,14 +118,14 @@ async def update_current_user_profile(
 @router.get("/", response_model=List[UserRead])
 async def get_all_users(
     name_search: Optional[str] = Query(None, description="Search users by name or email"),
-    session: AsyncSession = Depends(get_session)
+    session: AsyncSession = Depends(get_read_session)
 ) -> List[UserRead]:
     service = UserService(session)
     return await service.get_all_users(name_search)
 
 
 @router.get("/{user_id}", response_model=UserRead)
-async def get_user(user_id: int, session: AsyncSession = Depends(get_session)) -> UserRead:
+async def get_user(user_id: int, session: AsyncSession = Depends(get_read_session)) -> UserRead:
     service = UserService(session)
     user = await service.get_user(user_id)
     if not user:
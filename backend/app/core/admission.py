@@ -0,0 +1,170 @@
+import asyncio
+import fcntl
+import os
+import sqlite3
+import threading
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Optional, Tuple
+
+from app.core.config import get_settings
+
+settings = get_settings()
+
+
+class AdmissionRejectedError(Exception):
+    """Raised when a login or signup attempt is over its rate or concurrency limit."""
+
+    def __init__(self, reason: str, retry_after: float) -> None:
+        super().__init__(f"Too many attempts ({reason}), try again later")
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class TokenBucketStore:
+    """Token buckets kept in a local SQLite file shared by every worker on the host.
+
+    Each check runs in one ``BEGIN IMMEDIATE`` transaction, which serialises
+    writers across processes without an external service.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._local = threading.local()
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=OFF")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS buckets (key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)"
+            )
+            self._local.conn = conn
+        return conn
+
+    def try_consume(self, buckets: List[Tuple[str, float, float]]) -> Optional[Tuple[str, float]]:
+        """Take one token from every ``(key, rate_per_second, burst)`` bucket.
+
+        Either all buckets are charged or none is; returns the first key that
+        is empty together with the seconds until it refills, or None.
+        """
+        conn = self._connection()
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            levels = []
+            for key, rate, burst in buckets:
+                row = conn.execute("SELECT tokens, updated FROM buckets WHERE key = ?", (key,)).fetchone()
+                tokens = burst if row is None else min(burst, row[0] + (now - row[1]) * rate)
+                if tokens < 1:
+                    conn.execute("ROLLBACK")
+                    return key, (1 - tokens) / rate
+                levels.append((key, tokens - 1))
+            conn.executemany(
+                "INSERT INTO buckets (key, tokens, updated) VALUES (?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET tokens = excluded.tokens, updated = excluded.updated",
+                [(key, tokens, now) for key, tokens in levels],
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return None
+
+    def prune(self, older_than_seconds: float) -> None:
+        self._connection().execute("DELETE FROM buckets WHERE updated < ?", (time.time() - older_than_seconds,))
+
+
+class ConcurrencySlots:
+    """Host-wide semaphore built from ``flock`` on N slot files.
+
+    Locks die with their process, so a crashed worker never leaks a slot.
+    """
+
+    def __init__(self, directory: str, slots: int) -> None:
+        self.paths = [os.path.join(directory, f"verify-slot-{i}.lock") for i in range(slots)]
+
+    def try_acquire(self) -> Optional[int]:
+        for path in self.paths:
+            fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return fd
+            except BlockingIOError:
+                os.close(fd)
+        return None
+
+    @staticmethod
+    def release(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
+
+
+class LoginAdmission:
+    """Per-IP and per-email rate limits plus a global cap on concurrent password checks."""
+
+    def __init__(self, state_dir: str, max_concurrent: int) -> None:
+        os.makedirs(state_dir, exist_ok=True)
+        self.buckets = TokenBucketStore(os.path.join(state_dir, "buckets.sqlite3"))
+        self.slots = ConcurrencySlots(state_dir, max_concurrent)
+        self._last_prune = time.monotonic()
+        self.admitted = 0
+        self.rejected_ip = 0
+        self.rejected_email = 0
+        self.rejected_concurrency = 0
+
+    async def admit(self, scope: str, ip: Optional[str], email: Optional[str] = None) -> None:
+        if not settings.admission_control_enabled:
+            return
+
+        buckets = [(f"{scope}:ip:{ip or 'unknown'}", settings.login_ip_rate_per_minute / 60, settings.login_ip_burst)]
+        if email:
+            buckets.append(
+                (f"{scope}:email:{email.lower()}", settings.login_email_rate_per_minute / 60, settings.login_email_burst)
+            )
+
+        rejected = await asyncio.to_thread(self.buckets.try_consume, buckets)
+        if time.monotonic() - self._last_prune > 3600:
+            self._last_prune = time.monotonic()
+            await asyncio.to_thread(self.buckets.prune, 3600)
+
+        if rejected is not None:
+            key, retry_after = rejected
+            if ":email:" in key:
+                self.rejected_email += 1
+                raise AdmissionRejectedError("email", retry_after)
+            self.rejected_ip += 1
+            raise AdmissionRejectedError("ip", retry_after)
+        self.admitted += 1
+
+    @asynccontextmanager
+    async def verification_slot(self) -> AsyncIterator[None]:
+        if not settings.admission_control_enabled:
+            yield
+            return
+
+        fd = self.slots.try_acquire()
+        if fd is None:
+            self.rejected_concurrency += 1
+            raise AdmissionRejectedError("concurrency", 1.0)
+        try:
+            yield
+        finally:
+            self.slots.release(fd)
+
+    def stats(self) -> dict:
+        return {
+            "enabled": settings.admission_control_enabled,
+            "admitted": self.admitted,
+            "rejected_ip": self.rejected_ip,
+            "rejected_email": self.rejected_email,
+            "rejected_concurrency": self.rejected_concurrency,
+        }
+
+
+login_admission = LoginAdmission(
+    state_dir=settings.admission_state_dir,
+    max_concurrent=settings.login_max_concurrent_verifications,
+)
@@ -32,11 +32,90 @@ class Settings(BaseSettings):
     database_name: str  # Required - must be set via environment variable
     database_sslmode: str = "disable"
     alembic_script_location: str = "alembic"
+
+    # Read replica used by GET routes (same URL format as database_url). After a
+    # write the client is pinned to the primary for read_your_writes_seconds.
+    database_read_url: str | None = None
+    read_your_writes_seconds: float = 5.0
+
+    # Engine / connection pool (per worker process)
+    db_echo: bool = False
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = True
+
+    # SQL instrumentation: statements slower than this are logged with their
+    # route; per-request X-DB-Queries / X-DB-Time headers unless app_env is
+    # "production"
+    slow_query_threshold_ms: float = 200.0
     
     # JWT settings
     secret_key: str  # Required - must be set via environment variable
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
+    refresh_token_expire_days: int = 14
+
+    # Access-token revocation list (Bloom filter mirror of revoked_tokens)
+    revocation_refresh_seconds: float = 5.0
+    revocation_bloom_capacity: int = 1_000_000
+    revocation_bloom_error_rate: float = 0.001
+    revocation_confirmed_cache_size: int = 10_000
+
+    # Verified-token cache (skips re-checking signatures of reused bearer tokens)
+    token_cache_enabled: bool = True
+    token_cache_max_size: int = 10_000
+
+    # Principal cache (authenticated user lookups in get_current_user).
+    # Entries are per worker: profile updates only invalidate the worker that
+    # served them, and deleted users keep authenticating until their entry
+    # expires, so keep the TTL short.
+    principal_cache_enabled: bool = True
+    principal_cache_ttl_seconds: float = 60.0
+    principal_cache_max_size: int = 10_000
+
+    # Versioned cache of group summaries and balances (per worker). Entries are
+    # valid for one groups.version; for read_cache_stale_seconds after a write
+    # the previous version is still served while it is recomputed in the
+    # background (never to clients pinned to the primary after their own write).
+    read_cache_enabled: bool = True
+    read_cache_max_size: int = 10_000
+    read_cache_ttl_seconds: float = 3600.0
+    read_cache_stale_seconds: float = 2.0
+
+    # Most items accepted by POST /expenses/bulk and /expenses/bulk/delete
+    expense_bulk_max_items: int = 500
+    # Rows per staged batch of an expense import; bounds the import's memory use
+    expense_import_batch_rows: int = 5000
+
+    # bcrypt cost. bcrypt_rounds pins the cost; otherwise calibration (on startup
+    # or via `python -m app.utils.calibrate_hashing`) picks the cost closest to
+    # password_hash_target_ms within the policy bounds. Stored hashes below
+    # bcrypt_min_rounds are rehashed at the configured cost on successful login.
+    bcrypt_rounds: int | None = None
+    bcrypt_min_rounds: int = 10
+    bcrypt_max_rounds: int = 15
+    password_hash_target_ms: float = 250.0
+    password_hash_calibrate_on_startup: bool = False
+
+    # Password hashing executor (bcrypt runs off the event loop)
+    password_hash_workers: int = 2
+    password_hash_max_pending: int = 32  # running + queued; beyond this -> 503
+
+    # Login/signup admission control, shared by all workers on the host through
+    # files in admission_state_dir
+    admission_control_enabled: bool = True
+    admission_state_dir: str = "/tmp/fastproto-admission"
+    login_ip_rate_per_minute: float = 30.0
+    login_ip_burst: int = 10
+    login_email_rate_per_minute: float = 6.0
+    login_email_burst: int = 5
+    login_max_concurrent_verifications: int = 8
+
+    # Internal read-only metrics endpoint. It is unauthenticated, so it is only
+    # mounted when enabled; expose it on an internal bind only
+    internal_metrics_enabled: bool = False
 
 
 @lru_cache
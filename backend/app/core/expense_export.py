@@ -0,0 +1,41 @@
+import csv
+import io
+import json
+from typing import Any, Literal, Sequence
+
+ExportFormat = Literal["csv", "ndjson"]
+
+# The CSV columns are a superset of what the import reads, so an export can be imported elsewhere
+EXPORT_COLUMNS = ["id", "created_at", "paid_by_user_id", "paid_by", "amount", "description", "category", "metadata"]
+
+MEDIA_TYPES = {"csv": "text/csv; charset=utf-8", "ndjson": "application/x-ndjson"}
+
+
+def encode_header(format: ExportFormat) -> bytes:
+    return (",".join(EXPORT_COLUMNS) + "\r\n").encode() if format == "csv" else b""
+
+
+def encode_rows(rows: Sequence[Any], format: ExportFormat) -> bytes:
+    """One chunk of the export; ``rows`` have the attributes named in EXPORT_COLUMNS."""
+    if format == "csv":
+        out = io.StringIO()
+        writer = csv.writer(out)
+        writer.writerows(
+            (row.id, row.created_at.isoformat(), row.paid_by_user_id, row.paid_by, row.amount,
+             row.description, row.category, row.metadata)
+            for row in rows
+        )
+        return out.getvalue().encode()
+    return "".join(
+        json.dumps({
+            "id": row.id,
+            "created_at": row.created_at.isoformat(),
+            "paid_by_user_id": row.paid_by_user_id,
+            "paid_by": row.paid_by,
+            "amount": str(row.amount),
+            "description": row.description,
+            "category": row.category,
+            "metadata": json.loads(row.metadata) if row.metadata else None,
+        }) + "\n"
+        for row in rows
+    ).encode()
@@ -0,0 +1,76 @@
+import codecs
+import csv
+import json
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Literal, NamedTuple, Optional
+
+ImportFormat = Literal["csv", "ndjson"]
+
+
+class ImportRow(NamedTuple):
+    line: int  # 1-based line the record starts on
+    data: Optional[Dict[str, Any]]  # None if the record could not be parsed
+    error: Optional[str] = None
+
+
+async def iter_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[str]:
+    """Decode UTF-8 chunks into lines, holding at most one partial line at a time."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending.rstrip("\r")
+
+
+async def iter_csv(chunks: AsyncIterable[bytes]) -> AsyncIterator[ImportRow]:
+    """Records of a CSV file with a header row; empty cells are left out of ``data``."""
+    header = None
+    record, start = [], 0
+    line_no = 0
+    async for line in iter_lines(chunks):
+        line_no += 1
+        if not record:
+            start = line_no
+        record.append(line)
+        text = "\n".join(record)
+        # An odd number of quotes means a quoted field goes on past this line
+        if text.count('"') % 2:
+            continue
+        record = []
+        if not text.strip():
+            continue
+        values = next(csv.reader([text]))
+        if header is None:
+            header = [name.strip() for name in values]
+        elif len(values) != len(header):
+            yield ImportRow(start, None, f"Expected {len(header)} columns, got {len(values)}")
+        else:
+            yield ImportRow(start, {name: value for name, value in zip(header, values) if value != ""})
+    if record:
+        yield ImportRow(start, None, "Unterminated quoted field")
+
+
+async def iter_ndjson(chunks: AsyncIterable[bytes]) -> AsyncIterator[ImportRow]:
+    """One JSON object per line; blank lines are skipped."""
+    line_no = 0
+    async for line in iter_lines(chunks):
+        line_no += 1
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield ImportRow(line_no, None, f"Invalid JSON: {e.msg}")
+            continue
+        if isinstance(data, dict):
+            yield ImportRow(line_no, data)
+        else:
+            yield ImportRow(line_no, None, "Expected a JSON object")
+
+
+def iter_rows(chunks: AsyncIterable[bytes], format: ImportFormat) -> AsyncIterator[ImportRow]:
+    return iter_csv(chunks) if format == "csv" else iter_ndjson(chunks)
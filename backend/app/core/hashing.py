@@ -0,0 +1,101 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from app.core.config import get_settings
+
+settings = get_settings()
+
+
+class HashingSaturatedError(Exception):
+    """Raised when the password hashing queue is full."""
+
+
+class PasswordHashExecutor:
+    """Bounded thread pool that keeps bcrypt work off the event loop.
+
+    bcrypt releases the GIL while hashing, so threads give real parallelism.
+    Submissions beyond ``max_pending`` (running + queued) are rejected with
+    ``HashingSaturatedError`` instead of queueing without bound.
+    """
+
+    def __init__(self, workers: int, max_pending: int) -> None:
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self.queue_wait_total = 0.0
+        self.queue_wait_max = 0.0
+        self.hash_time_total = 0.0
+        self.hash_time_max = 0.0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="password-hash"
+            )
+        return self._executor
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self.rejected += 1
+                raise HashingSaturatedError("Password hashing is saturated, try again later")
+            self._pending += 1
+
+        submitted_at = time.perf_counter()
+
+        def timed_call() -> tuple[Any, float, float]:
+            started_at = time.perf_counter()
+            result = fn(*args)
+            return result, started_at, time.perf_counter()
+
+        loop = asyncio.get_running_loop()
+        try:
+            result, started_at, finished_at = await loop.run_in_executor(
+                self._get_executor(), timed_call
+            )
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+        queue_wait = started_at - submitted_at
+        hash_time = finished_at - started_at
+        with self._lock:
+            self.completed += 1
+            self.queue_wait_total += queue_wait
+            self.queue_wait_max = max(self.queue_wait_max, queue_wait)
+            self.hash_time_total += hash_time
+            self.hash_time_max = max(self.hash_time_max, hash_time)
+        return result
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> dict:
+        with self._lock:
+            completed = self.completed
+            return {
+                "workers": self.workers,
+                "max_pending": self.max_pending,
+                "pending": self._pending,
+                "completed": completed,
+                "rejected": self.rejected,
+                "queue_wait_avg_ms": self.queue_wait_total / completed * 1000 if completed else 0.0,
+                "queue_wait_max_ms": self.queue_wait_max * 1000,
+                "hash_time_avg_ms": self.hash_time_total / completed * 1000 if completed else 0.0,
+                "hash_time_max_ms": self.hash_time_max * 1000,
+            }
+
+
+password_hash_executor = PasswordHashExecutor(
+    workers=settings.password_hash_workers,
+    max_pending=settings.password_hash_max_pending,
+)
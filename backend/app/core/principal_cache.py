@@ -0,0 +1,32 @@
+from typing import Optional
+
+from app.core.cache import TTLCache
+from app.core.config import get_settings
+
+settings = get_settings()
+
+# Authenticated user identities keyed by the JWT ``sub`` claim (user id).
+# Values are plain column snapshots so they can be shared across sessions.
+principal_cache = TTLCache(
+    max_size=settings.principal_cache_max_size,
+    ttl_seconds=settings.principal_cache_ttl_seconds,
+)
+
+
+def get_cached_principal(user_id: int) -> Optional[dict]:
+    if not settings.principal_cache_enabled:
+        return None
+    return principal_cache.get(user_id)
+
+
+def cache_principal(user_id: int, snapshot: dict) -> None:
+    if settings.principal_cache_enabled:
+        principal_cache.set(user_id, snapshot)
+
+
+def invalidate_principal(user_id: int) -> None:
+    principal_cache.invalidate(user_id)
+
+
+def get_principal_cache_stats() -> dict:
+    return {"enabled": settings.principal_cache_enabled, **principal_cache.stats()}
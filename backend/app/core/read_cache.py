@@ -0,0 +1,151 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Protocol, Tuple
+
+from app.core.cache import TTLCache
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+@dataclass
+class CacheEntry:
+    version: int
+    value: Any
+    stale_since: Optional[float] = None  # first time a newer version was asked for
+
+
+class CacheBackend(Protocol):
+    """Storage for cache entries; a shared store only has to implement these."""
+
+    def get(self, key: Hashable) -> Optional[CacheEntry]: ...
+
+    def set(self, key: Hashable, entry: CacheEntry) -> None: ...
+
+    def clear(self) -> None: ...
+
+    def stats(self) -> dict: ...
+
+
+class LocalCacheBackend:
+    """Per-worker LRU storage, bounded by ``max_size`` entries."""
+
+    def __init__(self, max_size: int, ttl_seconds: float) -> None:
+        self._cache = TTLCache(max_size=max_size, ttl_seconds=ttl_seconds)
+
+    def get(self, key: Hashable) -> Optional[CacheEntry]:
+        return self._cache.get(key)
+
+    def set(self, key: Hashable, entry: CacheEntry) -> None:
+        self._cache.set(key, entry)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> dict:
+        stats = self._cache.stats()
+        return {"size": stats["size"], "max_size": stats["max_size"], "evictions": stats["evictions"]}
+
+
+class VersionedCache:
+    """Cache of values derived from data that carries a version number.
+
+    Each key holds the value computed for one version; a lookup with that
+    version is a hit, a lookup with a newer one recomputes. With
+    ``stale_seconds`` > 0 the previous version keeps being served for up to
+    that long after the first newer lookup while one background task
+    recomputes it (stale-while-revalidate).
+    """
+
+    def __init__(self, backend: CacheBackend, stale_seconds: float = 0.0, enabled: bool = True) -> None:
+        self.backend = backend
+        self.stale_seconds = stale_seconds
+        self.enabled = enabled
+        self._revalidating: Dict[Hashable, asyncio.Task] = {}
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.revalidation_errors = 0
+
+    async def get_or_compute(
+        self,
+        key: Hashable,
+        version: int,
+        compute: Callable[[], Awaitable[Any]],
+        revalidate: Optional[Callable[[], Awaitable[Any]]] = None,
+    ) -> Tuple[int, Any]:
+        """``(version, value)`` of ``key``, where version is that of the value served.
+
+        ``compute`` runs in the caller's request. ``revalidate`` must not
+        depend on it (it outlives the request); without one, stale values are
+        never served.
+        """
+        if not self.enabled:
+            return version, await compute()
+
+        entry = self.backend.get(key)
+        if entry is not None and entry.version >= version:
+            self.hits += 1
+            return entry.version, entry.value
+
+        if entry is not None and revalidate is not None and self.stale_seconds > 0:
+            now = time.monotonic()
+            if entry.stale_since is None:
+                entry.stale_since = now
+                self.backend.set(key, entry)
+            if now - entry.stale_since <= self.stale_seconds:
+                self.stale_hits += 1
+                if key not in self._revalidating:
+                    self._revalidating[key] = asyncio.create_task(self._revalidate(key, version, revalidate))
+                return entry.version, entry.value
+
+        self.misses += 1
+        value = await compute()
+        self._store(key, version, value)
+        return version, value
+
+    async def _revalidate(self, key: Hashable, version: int, revalidate: Callable[[], Awaitable[Any]]) -> None:
+        try:
+            self.revalidations += 1
+            self._store(key, version, await revalidate())
+        except Exception:
+            # The entry stays stale and the next lookup past the window computes inline
+            self.revalidation_errors += 1
+            logger.exception("Revalidating %r failed", key)
+        finally:
+            self._revalidating.pop(key, None)
+
+    def _store(self, key: Hashable, version: int, value: Any) -> None:
+        current = self.backend.get(key)
+        # A slower computation must not overwrite a newer version
+        if current is None or current.version <= version:
+            self.backend.set(key, CacheEntry(version, value))
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            "enabled": self.enabled,
+            **self.backend.stats(),
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "hit_ratio": (self.hits + self.stale_hits) / lookups if lookups else 0.0,
+            "revalidations": self.revalidations,
+            "revalidation_errors": self.revalidation_errors,
+            "revalidating": len(self._revalidating),
+        }
+
+
+# Group summaries and balances keyed by (kind, group_id), valid for one groups.version
+group_read_cache = VersionedCache(
+    LocalCacheBackend(max_size=settings.read_cache_max_size, ttl_seconds=settings.read_cache_ttl_seconds),
+    stale_seconds=settings.read_cache_stale_seconds,
+    enabled=settings.read_cache_enabled,
+)
@@ -0,0 +1,108 @@
+import asyncio
+import time
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.bloom import BloomFilter
+from app.core.cache import TTLCache
+from app.core.config import get_settings
+from app.repositories.revoked_token_repository import RevokedTokenRepository
+
+settings = get_settings()
+
+
+class RevocationList:
+    """In-process mirror of the ``revoked_tokens`` table.
+
+    Every revoked ``jti`` goes into a Bloom filter, so the common "not revoked"
+    answer never touches storage. Filter hits are confirmed against the table
+    once and remembered in a bounded exact set of confirmed revocations. The
+    mirror pulls new rows incrementally (by id watermark) at most every
+    ``refresh_seconds``, so revocations made by other workers apply within
+    that window. When the filter fills up it is rebuilt from the unexpired
+    rows, and only doubled if those alone still overflow it.
+    """
+
+    def __init__(self, capacity: int, error_rate: float, refresh_seconds: float, confirmed_size: int) -> None:
+        self.error_rate = error_rate
+        self.refresh_seconds = refresh_seconds
+        self.bloom = BloomFilter(capacity, error_rate)
+        self.confirmed = TTLCache(max_size=confirmed_size, ttl_seconds=settings.access_token_expire_minutes * 60)
+        self.last_id = 0
+        self.last_refresh = float("-inf")
+        self._lock = asyncio.Lock()
+        self.bloom_negatives = 0
+        self.storage_checks = 0
+        self.false_positives = 0
+
+    async def refresh(self, session: AsyncSession, batch_size: int = 10_000) -> None:
+        async with self._lock:
+            # Another request may have refreshed while this one waited for the lock
+            if time.monotonic() - self.last_refresh < self.refresh_seconds:
+                return
+            repo = RevokedTokenRepository(session)
+            rebuilding = False
+            while True:
+                rows = await repo.get_since(self.last_id, batch_size)
+                full = False
+                for row_id, jti in rows:
+                    if self.bloom.count >= self.bloom.capacity:
+                        full = True
+                        break
+                    self.bloom.add(jti)
+                    self.last_id = max(self.last_id, row_id)
+                if full:
+                    # Only grow when the unexpired rows alone overflow the filter
+                    self._rebuild(grow=rebuilding)
+                    rebuilding = True
+                    continue
+                if len(rows) < batch_size:
+                    break
+            self.last_refresh = time.monotonic()
+
+    def _rebuild(self, grow: bool) -> None:
+        # A full filter degrades quickly. Start an empty one and reload from
+        # id 0: get_since skips expired rows, so this drops them from the count
+        capacity = self.bloom.capacity * 2 if grow else self.bloom.capacity
+        self.bloom = BloomFilter(capacity, self.error_rate)
+        self.last_id = 0
+
+    def record(self, jti: str) -> None:
+        """Apply a revocation made by this worker immediately."""
+        self.bloom.add(jti)
+        self.confirmed.set(jti, True)
+
+    async def is_revoked(self, session: AsyncSession, jti: str) -> bool:
+        if time.monotonic() - self.last_refresh >= self.refresh_seconds:
+            await self.refresh(session)
+
+        if jti not in self.bloom:
+            self.bloom_negatives += 1
+            return False
+        if self.confirmed.get(jti):
+            return True
+
+        self.storage_checks += 1
+        if await RevokedTokenRepository(session).exists(jti):
+            self.confirmed.set(jti, True)
+            return True
+        self.false_positives += 1
+        return False
+
+    def stats(self) -> dict:
+        return {
+            "bloom": self.bloom.stats(),
+            "confirmed": len(self.confirmed),
+            "last_id": self.last_id,
+            "bloom_negatives": self.bloom_negatives,
+            "storage_checks": self.storage_checks,
+            "false_positives": self.false_positives,
+        }
+
+
+revocation_list = RevocationList(
+    capacity=settings.revocation_bloom_capacity,
+    error_rate=settings.revocation_bloom_error_rate,
+    refresh_seconds=settings.revocation_refresh_seconds,
+    confirmed_size=settings.revocation_confirmed_cache_size,
+)
@@ -1,11 +1,20 @@
+import hashlib
+import math
+import secrets
+import statistics
+import time
+import uuid
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Optional, Tuple
 
 from jose import JWTError, jwt
 from passlib.context import CryptContext
+from passlib.hash import bcrypt
 from fastapi import HTTPException, status
 
+from app.core.cache import TTLCache
 from app.core.config import get_settings
+from app.core.hashing import password_hash_executor
 
 settings = get_settings()
 
@@ -13,6 +22,49 @@ settings = get_settings()
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
+def configure_bcrypt_rounds(rounds: int, min_rounds: int = settings.bcrypt_min_rounds) -> None:
+    """Hash new passwords at ``rounds`` and flag hashes below the policy floor for rehash.
+
+    Costs above ``rounds`` are left alone: workers calibrated on different
+    hosts would otherwise keep rewriting each other's hashes on login.
+    """
+    pwd_context.update(
+        bcrypt__default_rounds=rounds,
+        bcrypt__min_rounds=min(min_rounds, rounds),
+    )
+
+
+def calibrate_bcrypt_rounds(
+    target_ms: float = settings.password_hash_target_ms,
+    min_rounds: int = settings.bcrypt_min_rounds,
+    max_rounds: int = settings.bcrypt_max_rounds,
+    samples: int = 3,
+) -> int:
+    """Pick the bcrypt cost whose hash time on this host is closest to ``target_ms``.
+
+    Each extra round doubles the work, so one measurement at ``min_rounds``
+    is enough to extrapolate.
+    """
+    hasher = bcrypt.using(rounds=min_rounds)
+    timings = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        hasher.hash("calibration-password")
+        timings.append((time.perf_counter() - started) * 1000)
+    base_ms = statistics.median(timings)
+
+    rounds = min_rounds + round(math.log2(max(target_ms / base_ms, 1)))
+    return max(min_rounds, min(max_rounds, rounds))
+
+
+if settings.bcrypt_rounds is not None:
+    configure_bcrypt_rounds(settings.bcrypt_rounds)
+
+# Payloads of already-verified tokens keyed by SHA-256 of the token; each entry
+# expires at the token's own ``exp``
+verified_token_cache = TTLCache(max_size=settings.token_cache_max_size, ttl_seconds=0)
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a plain password against its hash."""
     return pwd_context.verify(plain_password, hashed_password)
@@ -23,6 +75,25 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password on the hashing executor instead of the event loop."""
+    return await password_hash_executor.run(verify_password, plain_password, hashed_password)
+
+
+async def verify_and_update_password_async(
+    plain_password: str, hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """Verify a password and return a replacement hash if its cost is outdated."""
+    return await password_hash_executor.run(
+        pwd_context.verify_and_update, plain_password, hashed_password
+    )
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Hash a password on the hashing executor instead of the event loop."""
+    return await password_hash_executor.run(get_password_hash, password)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token."""
     to_encode = data.copy()
@@ -32,18 +103,40 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
         expire = datetime.now(timezone.utc) + timedelta(minutes=settings.access_token_expire_minutes)
     
     to_encode.update({"exp": expire})
+    to_encode.setdefault("jti", uuid.uuid4().hex)
     encoded_jwt = jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
     return encoded_jwt
 
 
+def create_refresh_token() -> Tuple[str, str]:
+    """Create an opaque refresh token; returns (token, digest to store)."""
+    token = secrets.token_urlsafe(32)
+    return token, hash_refresh_token(token)
+
+
+def hash_refresh_token(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
 def verify_token(token: str) -> dict:
     """Verify and decode a JWT token."""
+    digest = None
+    if settings.token_cache_enabled:
+        digest = hashlib.sha256(token.encode()).digest()
+        cached = verified_token_cache.get(digest)
+        if cached is not None:
+            return dict(cached)
+
     try:
         payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
-        return payload
     except JWTError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
+
+    exp = payload.get("exp")
+    if digest is not None and exp is not None:
+        verified_token_cache.set(digest, dict(payload), ttl=exp - time.time())
+    return payload
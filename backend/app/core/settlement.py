@@ -0,0 +1,54 @@
+import heapq
+from decimal import Decimal, ROUND_FLOOR
+from typing import Dict, List, Tuple
+
+# (from_user_id, to_user_id, amount in cents)
+Transfer = Tuple[int, int, int]
+
+
+def net_balances_in_cents(net_balances: Dict[int, Decimal]) -> Dict[int, int]:
+    """Whole-cent net balances that sum to exactly zero.
+
+    Ledger shares carry four decimal places, so per-member rounding alone can
+    leave a stray cent; the remaining cents go to the largest remainders.
+    """
+    exact = {user_id: net * 100 for user_id, net in net_balances.items()}
+    cents = {user_id: int(value.to_integral_value(rounding=ROUND_FLOOR)) for user_id, value in exact.items()}
+    missing = -sum(cents.values())
+    by_remainder = sorted(exact, key=lambda user_id: (exact[user_id] - cents[user_id], -user_id), reverse=True)
+    if missing >= 0:
+        for user_id in by_remainder[:missing]:
+            cents[user_id] += 1
+    else:
+        for user_id in by_remainder[missing:]:
+            cents[user_id] -= 1
+    return cents
+
+
+def simplify_debts(net_cents: Dict[int, int]) -> List[Transfer]:
+    """Greedy settle-up plan: the largest debtor pays the largest creditor until everyone is square.
+
+    Each transfer settles at least one side completely, so there are at most
+    n - 1 transfers, and the two heaps keep the whole pass O(n log n).
+    Balances must sum to zero.
+    """
+    if sum(net_cents.values()) != 0:
+        raise ValueError("Net balances do not sum to zero")
+
+    # heapq is a min-heap: store negated amounts to pop the largest first, user id breaks ties
+    creditors = [(-cents, user_id) for user_id, cents in net_cents.items() if cents > 0]
+    debtors = [(cents, user_id) for user_id, cents in net_cents.items() if cents < 0]
+    heapq.heapify(creditors)
+    heapq.heapify(debtors)
+
+    transfers: List[Transfer] = []
+    while creditors and debtors:
+        credit, creditor = heapq.heappop(creditors)
+        debt, debtor = heapq.heappop(debtors)
+        amount = min(-credit, -debt)
+        transfers.append((debtor, creditor, amount))
+        if credit + amount < 0:
+            heapq.heappush(creditors, (credit + amount, creditor))
+        if debt + amount < 0:
+            heapq.heappush(debtors, (debt + amount, debtor))
+    return transfers
@@ -0,0 +1,44 @@
+from decimal import Decimal, ROUND_FLOOR
+from typing import Dict, Iterable
+
+# user_id -> share in cents
+Shares = Dict[int, int]
+
+
+def amount_to_cents(amount: Decimal) -> int:
+    cents = amount * 100
+    if cents != cents.to_integral_value():
+        raise ValueError("Amounts must be whole cents")
+    return int(cents)
+
+
+def split_by_weight(total_cents: int, weights: Dict[int, Decimal]) -> Shares:
+    """Split ``total_cents`` in proportion to ``weights`` without losing a cent.
+
+    Everyone gets the floor of their exact share; the leftover cents go to the
+    largest remainders, lowest user id first on ties.
+    """
+    if not weights:
+        raise ValueError("An expense must be split between at least one member")
+    weight_sum = sum(weights.values())
+    if weight_sum <= 0:
+        raise ValueError("Split weights must be positive")
+
+    exact = {user_id: total_cents * Decimal(weight) / weight_sum for user_id, weight in weights.items()}
+    shares = {user_id: int(value.to_integral_value(rounding=ROUND_FLOOR)) for user_id, value in exact.items()}
+    leftover = total_cents - sum(shares.values())
+    by_remainder = sorted(exact, key=lambda user_id: (shares[user_id] - exact[user_id], user_id))
+    for user_id in by_remainder[:leftover]:
+        shares[user_id] += 1
+    return shares
+
+
+def split_equal(total_cents: int, user_ids: Iterable[int]) -> Shares:
+    return split_by_weight(total_cents, {user_id: Decimal(1) for user_id in user_ids})
+
+
+def split_exact(total_cents: int, amounts: Dict[int, Decimal]) -> Shares:
+    shares = {user_id: amount_to_cents(amount) for user_id, amount in amounts.items()}
+    if sum(shares.values()) != total_cents:
+        raise ValueError("Exact split amounts must add up to the expense amount")
+    return shares
@@ -0,0 +1,76 @@
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger("app.db.slow_query")
+
+
+class QueryStats:
+    """Statements issued and time spent in the database on behalf of one request."""
+
+    def __init__(self, route: Optional[str] = None) -> None:
+        self.route = route
+        self.count = 0
+        self.total_seconds = 0.0
+
+    @property
+    def total_ms(self) -> float:
+        return self.total_seconds * 1000
+
+
+# Mutated in place by the engine hooks, so tasks copied from the request
+# context (e.g. the one running call_next) report into the same object
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    return _current_stats.get()
+
+
+@contextmanager
+def track_queries(route: Optional[str] = None) -> Iterator[QueryStats]:
+    """Collect statements executed in this context into a fresh ``QueryStats``."""
+    stats = QueryStats(route)
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def instrument_queries(engine: AsyncEngine, slow_query_threshold_ms: float) -> None:
+    """Time every statement on ``engine`` and log those slower than the threshold."""
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_started"].pop()
+        stats = _current_stats.get()
+        if stats is not None:
+            stats.count += 1
+            stats.total_seconds += elapsed
+
+        elapsed_ms = elapsed * 1000
+        if elapsed_ms >= slow_query_threshold_ms:
+            logger.warning(
+                "Slow query (%.1f ms) from %s: %s",
+                elapsed_ms,
+                stats.route if stats is not None and stats.route else "<no request>",
+                " ".join(statement.split()),
+            )
+
+    @event.listens_for(sync_engine, "handle_error")
+    def handle_error(exception_context):
+        # A failed statement never reaches after_cursor_execute
+        started = exception_context.connection.info.get("query_started") if exception_context.connection else None
+        if started:
+            started.pop()
@@ -1,31 +1,103 @@
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Callable
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import DeclarativeBase, Session
 
 from app.core.config import get_settings
+from app.db.instrumentation import instrument_queries
+from app.db.pool import InstrumentedAsyncAdaptedQueuePool, instrument_engine
 
 
 settings = get_settings()
 
+
+def _engine_options(url: str) -> dict:
+    if url.startswith("sqlite"):
+        # SQLite (local stand-in only) uses its own pooling
+        return {}
+    return {
+        "poolclass": InstrumentedAsyncAdaptedQueuePool,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+
+
 # Connection pooling and engine options
 engine = create_async_engine(
     settings.database_url,  # type: ignore[arg-type]
     future=True,
-    echo=settings.debug,
-    pool_size=5,
-    max_overflow=10,
-    pool_recycle=1800,
-    pool_pre_ping=True,
+    echo=settings.db_echo,
+    **_engine_options(settings.database_url),  # type: ignore[arg-type]
 )
+instrument_engine(engine)
+instrument_queries(engine, settings.slow_query_threshold_ms)
 SessionLocal = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
 
+# Read-only replica; falls back to the primary when no replica is configured
+if settings.database_read_url:
+    read_engine = create_async_engine(
+        settings.database_read_url,
+        future=True,
+        echo=settings.db_echo,
+        **_engine_options(settings.database_read_url),
+    )
+    instrument_engine(read_engine)
+    instrument_queries(read_engine, settings.slow_query_threshold_ms)
+else:
+    read_engine = engine
+ReadSessionLocal = async_sessionmaker(bind=read_engine, class_=AsyncSession, expire_on_commit=False)
+
 
 class Base(DeclarativeBase):
     pass
 
 
+_ON_COMMIT_KEY = "on_commit"
+
+
+def on_commit(session: AsyncSession, callback: Callable[[], None]) -> None:
+    """Run ``callback`` once the session's current transaction commits.
+
+    Used for in-process side effects (cache invalidation, revocation mirror)
+    that must not happen if the unit of work is rolled back.
+    """
+    session.info.setdefault(_ON_COMMIT_KEY, []).append(callback)
+
+
+@event.listens_for(Session, "after_commit")
+def _run_on_commit(session: Session) -> None:
+    for callback in session.info.pop(_ON_COMMIT_KEY, []):
+        callback()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_on_commit(session: Session) -> None:
+    session.info.pop(_ON_COMMIT_KEY, None)
+
+
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
+    """Request-scoped unit of work.
+
+    Services only flush; the transaction is committed once after the route
+    returns, or rolled back if it raised (including ``HTTPException``).
+    """
     async with SessionLocal() as session:
+        try:
+            yield session
+            if session.in_transaction():
+                await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+        finally:
+            await session.close()
+
+
+async def get_read_db_session() -> AsyncGenerator[AsyncSession, None]:
+    async with ReadSessionLocal() as session:
         try:
             yield session
         finally:
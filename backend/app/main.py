@@ -1,14 +1,37 @@
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+
 import uvicorn
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import get_settings
+from app.api.deps import PRIMARY_PIN_COOKIE
+from app.core.hashing import password_hash_executor
+from app.core.security import calibrate_bcrypt_rounds, configure_bcrypt_rounds
+from app.db.instrumentation import track_queries
 from app.api.routes import users as users_routes, groups as groups_routes, expenses as expenses_routes
+from app.api.routes import internal as internal_routes
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    settings = get_settings()
+    if settings.bcrypt_rounds is None and settings.password_hash_calibrate_on_startup:
+        rounds = await asyncio.to_thread(calibrate_bcrypt_rounds)
+        configure_bcrypt_rounds(rounds)
+        logger.info("Calibrated bcrypt cost to %d rounds", rounds)
+    yield
+    password_hash_executor.shutdown()
 
 
 def create_app() -> FastAPI:
     settings = get_settings()
-    app = FastAPI(title=settings.app_name, debug=settings.debug)
+    app = FastAPI(title=settings.app_name, debug=settings.debug, lifespan=lifespan)
 
     # Configure CORS via env
     app.add_middleware(
@@ -17,11 +40,47 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["X-DB-Queries", "X-DB-Time", "ETag"],
     )
 
+    serves_stale_reads = settings.read_cache_enabled and settings.read_cache_stale_seconds > 0
+    if settings.database_read_url or serves_stale_reads:
+        @app.middleware("http")
+        async def pin_writers_to_primary(request: Request, call_next):
+            # Read-your-writes: after a successful write, route this client's
+            # reads to the primary until the replica has caught up, and never
+            # answer them with a stale cached group read
+            response = await call_next(request)
+            if request.method in ("POST", "PUT", "PATCH", "DELETE") and response.status_code < 400:
+                pin_seconds = max(settings.read_your_writes_seconds, settings.read_cache_stale_seconds)
+                response.set_cookie(
+                    PRIMARY_PIN_COOKIE,
+                    str(time.time() + pin_seconds),
+                    max_age=max(1, int(pin_seconds)),
+                    httponly=True,
+                    samesite="lax",
+                )
+            return response
+
+    if settings.app_env != "production":
+        @app.middleware("http")
+        async def report_query_stats(request: Request, call_next):
+            with track_queries(f"{request.method} {request.url.path}") as stats:
+                response = await call_next(request)
+            response.headers["X-DB-Queries"] = str(stats.count)
+            response.headers["X-DB-Time"] = f"{stats.total_ms:.1f}"
+            return response
+    else:
+        @app.middleware("http")
+        async def attribute_slow_queries(request: Request, call_next):
+            with track_queries(f"{request.method} {request.url.path}"):
+                return await call_next(request)
+
     app.include_router(users_routes.router)
     app.include_router(groups_routes.router)
     app.include_router(expenses_routes.router)
+    if settings.internal_metrics_enabled:
+        app.include_router(internal_routes.router)
     return app
 
 
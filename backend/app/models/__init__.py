@@ -1,5 +1,8 @@
 from .user import User  # noqa: F401
 from .group import Group, GroupMember  # noqa: F401
-from .expense import Expense  # noqa: F401
+from .expense import Expense, ExpenseSplit  # noqa: F401
+from .refresh_token import RefreshToken  # noqa: F401
+from .revoked_token import RevokedToken  # noqa: F401
+from .group_balance import GroupBalance  # noqa: F401
 
-__all__ = ["User", "Group", "GroupMember", "Expense"]
+__all__ = ["User", "Group", "GroupMember", "Expense", "ExpenseSplit", "RefreshToken", "RevokedToken", "GroupBalance"]
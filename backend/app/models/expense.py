@@ -1,5 +1,5 @@
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import String, DateTime, ForeignKey, Integer, Numeric, Text
+from sqlalchemy import String, DateTime, ForeignKey, Integer, BigInteger, Numeric, Text, Index
 from datetime import datetime
 from decimal import Decimal
 from app.db.session import Base
@@ -10,7 +10,7 @@ class Expense(Base):
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True, autoincrement=True)
     group_id: Mapped[int] = mapped_column(Integer, ForeignKey("groups.id"), nullable=False)
-    paid_by_user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False)
+    paid_by_user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     amount: Mapped[Decimal] = mapped_column(Numeric(10, 2), nullable=False)
     description: Mapped[str | None] = mapped_column(String(500), nullable=True)
     category: Mapped[str | None] = mapped_column(String(100), nullable=True)
@@ -21,3 +21,16 @@ class Expense(Base):
     # Relationships
     group: Mapped["Group"] = relationship("Group", back_populates="expenses")
     paid_by_user: Mapped["User"] = relationship("User", foreign_keys=[paid_by_user_id], back_populates="expenses_paid")
+
+
+# Group expense listing (newest first), summaries and balances
+Index("ix_expenses_group_id_created_at_id", Expense.group_id, Expense.created_at.desc(), Expense.id)
+
+
+class ExpenseSplit(Base):
+    """What one member owes for one expense; the shares of an expense add up to its amount."""
+    __tablename__ = "expense_splits"
+
+    expense_id: Mapped[int] = mapped_column(Integer, ForeignKey("expenses.id", ondelete="CASCADE"), primary_key=True)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), primary_key=True)
+    share_cents: Mapped[int] = mapped_column(BigInteger, nullable=False)
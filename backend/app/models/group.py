@@ -1,5 +1,5 @@
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import String, DateTime, ForeignKey, Integer
+from sqlalchemy import String, DateTime, ForeignKey, Integer, Index
 from datetime import datetime
 from app.db.session import Base
 
@@ -13,6 +13,8 @@ class Group(Base):
     created_by_user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
     updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Bumped by every write to the group, its members or its expenses; versions cached reads
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=1, server_default="1")
     
     # Relationships
     created_by_user: Mapped["User"] = relationship("User", foreign_keys=[created_by_user_id])
@@ -22,6 +24,12 @@ class Group(Base):
 
 class GroupMember(Base):
     __tablename__ = "group_members"
+    __table_args__ = (
+        # is_member / membership checks and members of a group
+        Index("uq_group_members_group_id_user_id", "group_id", "user_id", unique=True),
+        # get_user_groups and expenses across a user's groups
+        Index("ix_group_members_user_id_group_id", "user_id", "group_id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True, autoincrement=True)
     group_id: Mapped[int] = mapped_column(Integer, ForeignKey("groups.id"), nullable=False)
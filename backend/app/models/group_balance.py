@@ -0,0 +1,22 @@
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import DateTime, ForeignKey, Integer, Numeric
+from datetime import datetime
+from decimal import Decimal
+from app.db.session import Base
+
+
+class GroupBalance(Base):
+    """Running per-member totals of a group.
+
+    Maintained from expense_splits by expense create, update, delete, the bulk
+    endpoints and imports; membership changes leave it alone. Rows exist for
+    anyone who paid into the group or owes a share of one of its expenses,
+    whether or not they are still a member.
+    """
+    __tablename__ = "group_balances"
+
+    group_id: Mapped[int] = mapped_column(Integer, ForeignKey("groups.id", ondelete="CASCADE"), primary_key=True)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    paid_total: Mapped[Decimal] = mapped_column(Numeric(14, 2), nullable=False, default=0)
+    share_total: Mapped[Decimal] = mapped_column(Numeric(16, 4), nullable=False, default=0)  # what the member owes
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -0,0 +1,160 @@
+from typing import Optional, Dict, Any, Tuple
+from decimal import Decimal
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, true, union
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app.models.expense import Expense, ExpenseSplit
+from app.models.group import Group, GroupMember
+from app.models.group_balance import GroupBalance
+
+CENTS = Decimal('0.01')
+SHARE_QUANTUM = Decimal('0.0001')  # scale of group_balances.share_total
+
+# (paid_total, share_total) per (group_id, user_id)
+LedgerRows = Dict[Tuple[int, int], Tuple[Decimal, Decimal]]
+
+
+def to_cents(amount) -> Decimal:
+    # SUM over NUMERIC is exact on PostgreSQL but comes back as a float on SQLite
+    return Decimal(str(amount)).quantize(CENTS)
+
+
+def cents_to_share(cents: int) -> Decimal:
+    return Decimal(cents).scaleb(-2).quantize(SHARE_QUANTUM)
+
+
+class BalanceRepository:
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    def _insert(self):
+        dialect = postgresql if self.session.bind.dialect.name == "postgresql" else sqlite
+        return dialect.insert(GroupBalance)
+
+    async def apply_deltas(self, group_id: int, deltas: LedgerRows) -> None:
+        """Add (paid, share) deltas to the members' rows in one multi-row upsert.
+
+        Increments commute, so concurrent writes to a group need no lock; rows
+        are sorted so that two transactions always take row locks in the same order.
+        """
+        rows = [
+            {"group_id": group_id, "user_id": user_id, "paid_total": paid, "share_total": share}
+            for (_, user_id), (paid, share) in sorted(deltas.items())
+            if paid or share
+        ]
+        if not rows:
+            return
+        insert = self._insert().values(rows)
+        await self.session.execute(
+            insert.on_conflict_do_update(
+                index_elements=[GroupBalance.group_id, GroupBalance.user_id],
+                set_={
+                    "paid_total": GroupBalance.paid_total + insert.excluded.paid_total,
+                    "share_total": GroupBalance.share_total + insert.excluded.share_total,
+                    "updated_at": insert.excluded.updated_at,
+                },
+            )
+        )
+
+    async def get_group_balances(self, group_id: int) -> Optional[Dict[str, Any]]:
+        """Group name, total spent and the ledger row of each current member and ex-member on the ledger.
+
+        ``members`` covers every current member (zero if they have no row yet),
+        ``former_members`` the ledger rows of users who have since left. Returns
+        None if the group does not exist.
+        """
+        total = (
+            select(func.sum(GroupBalance.paid_total))
+            .where(GroupBalance.group_id == group_id)
+            .scalar_subquery()
+        )
+        participants = union(
+            select(GroupMember.user_id).where(GroupMember.group_id == group_id),
+            select(GroupBalance.user_id).where(GroupBalance.group_id == group_id),
+        ).subquery()
+        result = await self.session.execute(
+            select(
+                Group.name,
+                participants.c.user_id,
+                GroupMember.id.label('membership_id'),
+                func.coalesce(GroupBalance.paid_total, 0).label('paid_total'),
+                func.coalesce(GroupBalance.share_total, 0).label('share_total'),
+                func.coalesce(total, 0).label('total'),
+            )
+            .select_from(Group)
+            .outerjoin(participants, true())
+            .outerjoin(
+                GroupMember,
+                (GroupMember.group_id == Group.id) & (GroupMember.user_id == participants.c.user_id),
+            )
+            .outerjoin(
+                GroupBalance,
+                (GroupBalance.group_id == Group.id) & (GroupBalance.user_id == participants.c.user_id),
+            )
+            .where(Group.id == group_id)
+        )
+        rows = result.all()
+        if not rows:
+            return None
+
+        balances = {
+            row.user_id: (to_cents(row.paid_total), Decimal(str(row.share_total)).quantize(SHARE_QUANTUM))
+            for row in rows if row.user_id is not None
+        }
+        current = {row.user_id for row in rows if row.membership_id is not None}
+        return {
+            "group_name": rows[0].name,
+            "total_expenses": to_cents(rows[0].total),
+            "members": {user_id: row for user_id, row in balances.items() if user_id in current},
+            "former_members": {user_id: row for user_id, row in balances.items() if user_id not in current},
+        }
+
+    async def get_ledger(self, group_id: Optional[int] = None) -> LedgerRows:
+        query = select(GroupBalance.group_id, GroupBalance.user_id, GroupBalance.paid_total, GroupBalance.share_total)
+        if group_id is not None:
+            query = query.where(GroupBalance.group_id == group_id)
+        result = await self.session.execute(query)
+        return {
+            (row.group_id, row.user_id): (to_cents(row.paid_total), Decimal(str(row.share_total)).quantize(SHARE_QUANTUM))
+            for row in result
+        }
+
+    async def compute_from_expenses(self, group_id: Optional[int] = None) -> LedgerRows:
+        """What the ledger should contain, aggregated in SQL from raw expenses and their splits."""
+        paid_query = (
+            select(Expense.group_id, Expense.paid_by_user_id.label('user_id'), func.sum(Expense.amount).label('total'))
+            .group_by(Expense.group_id, Expense.paid_by_user_id)
+        )
+        share_query = (
+            select(Expense.group_id, ExpenseSplit.user_id, func.sum(ExpenseSplit.share_cents).label('total'))
+            .join(ExpenseSplit, ExpenseSplit.expense_id == Expense.id)
+            .group_by(Expense.group_id, ExpenseSplit.user_id)
+        )
+        if group_id is not None:
+            paid_query = paid_query.where(Expense.group_id == group_id)
+            share_query = share_query.where(Expense.group_id == group_id)
+
+        zero = (Decimal('0').quantize(CENTS), Decimal('0').quantize(SHARE_QUANTUM))
+        expected: LedgerRows = {}
+        for row in await self.session.execute(paid_query):
+            expected[(row.group_id, row.user_id)] = (to_cents(row.total), zero[1])
+        for row in await self.session.execute(share_query):
+            paid, _ = expected.get((row.group_id, row.user_id), zero)
+            expected[(row.group_id, row.user_id)] = (paid, cents_to_share(row.total))
+        return expected
+
+    async def replace_rows(self, rows: LedgerRows) -> None:
+        """Overwrite (or create) the given ledger rows."""
+        for (gid, uid), (paid_total, share_total) in rows.items():
+            insert = self._insert().values(group_id=gid, user_id=uid, paid_total=paid_total, share_total=share_total)
+            await self.session.execute(
+                insert.on_conflict_do_update(
+                    index_elements=[GroupBalance.group_id, GroupBalance.user_id],
+                    set_={
+                        "paid_total": insert.excluded.paid_total,
+                        "share_total": insert.excluded.share_total,
+                        "updated_at": insert.excluded.updated_at,
+                    },
+                )
+            )
@@ -0,0 +1,114 @@
+import json
+from datetime import datetime
+from typing import List, Tuple
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.splits import Shares
+from app.repositories.expense_repository import ExpenseRepository
+from app.schemas.expense import ExpenseCreate
+
+StagedExpense = Tuple[ExpenseCreate, Shares]
+
+EXPENSE_COLUMNS = ["expense_id", "amount", "description", "category", "expense_metadata"]
+SPLIT_COLUMNS = ["expense_id", "user_id", "share_cents"]
+
+
+class ExpenseImportRepository:
+    """Loads large numbers of expenses into one group.
+
+    On PostgreSQL each batch is COPYed into temporary staging tables, which
+    are merged into expenses and expense_splits with one INSERT ... SELECT each
+    by ``finish``. Other databases (SQLite in tests) have no COPY; there each
+    batch goes straight in through ExpenseRepository.create_many.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+        self.use_copy = session.bind.dialect.name == "postgresql"
+        self.expenses = ExpenseRepository(session)
+
+    async def start(self) -> None:
+        if not self.use_copy:
+            return
+        await self.session.execute(text(
+            "CREATE TEMP TABLE expense_import ("
+            " expense_id integer PRIMARY KEY,"
+            " amount numeric(10, 2) NOT NULL,"
+            " description varchar(500),"
+            " category varchar(100),"
+            " expense_metadata text"
+            ") ON COMMIT DROP"
+        ))
+        await self.session.execute(text(
+            "CREATE TEMP TABLE expense_import_splits ("
+            " expense_id integer NOT NULL,"
+            " user_id integer NOT NULL,"
+            " share_cents bigint NOT NULL"
+            ") ON COMMIT DROP"
+        ))
+
+    async def stage(self, paid_by_user_id: int, batch: List[StagedExpense]) -> None:
+        if not self.use_copy:
+            expenses = await self.expenses.create_many([item for item, _ in batch], paid_by_user_id)
+            await self.expenses.add_splits_of({expense.id: shares for expense, (_, shares) in zip(expenses, batch)})
+            return
+
+        # Ids are taken from the expenses sequence up front so that splits can
+        # be staged with the id their expense will have
+        result = await self.session.execute(
+            text("SELECT nextval(pg_get_serial_sequence('expenses', 'id')) FROM generate_series(1, :count)"),
+            {"count": len(batch)},
+        )
+        expense_ids = sorted(result.scalars().all())
+        connection = await self._driver_connection()
+        await connection.copy_records_to_table(
+            "expense_import",
+            columns=EXPENSE_COLUMNS,
+            records=[
+                (
+                    expense_id,
+                    item.amount,
+                    item.description,
+                    item.category,
+                    json.dumps(item.metadata) if item.metadata else None,
+                )
+                for expense_id, (item, _) in zip(expense_ids, batch)
+            ],
+        )
+        await connection.copy_records_to_table(
+            "expense_import_splits",
+            columns=SPLIT_COLUMNS,
+            records=[
+                (expense_id, user_id, cents)
+                for expense_id, (_, shares) in zip(expense_ids, batch)
+                for user_id, cents in shares.items()
+            ],
+        )
+
+    async def finish(self, group_id: int, paid_by_user_id: int) -> None:
+        """Move the staged rows into expenses and expense_splits."""
+        if not self.use_copy:
+            return
+        now = datetime.utcnow()
+        await self.session.execute(
+            text(
+                "INSERT INTO expenses"
+                " (id, group_id, paid_by_user_id, amount, description, category, expense_metadata, created_at, updated_at)"
+                " SELECT expense_id, :group_id, :paid_by_user_id, amount, description, category, expense_metadata, :now, :now"
+                " FROM expense_import ORDER BY expense_id"
+            ),
+            {"group_id": group_id, "paid_by_user_id": paid_by_user_id, "now": now},
+        )
+        await self.session.execute(text(
+            "INSERT INTO expense_splits (expense_id, user_id, share_cents)"
+            " SELECT expense_id, user_id, share_cents FROM expense_import_splits"
+        ))
+        # ON COMMIT DROP only fires at commit; drop now so the session can import again
+        await self.session.execute(text("DROP TABLE expense_import, expense_import_splits"))
+
+    async def _driver_connection(self):
+        # The asyncpg connection behind the session, inside its transaction
+        connection = await self.session.connection()
+        raw = await connection.get_raw_connection()
+        return raw.driver_connection
@@ -1,12 +1,14 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, AsyncIterator, Sequence
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, func
+from sqlalchemy import Row, select, insert, delete, and_, or_, func, tuple_
 from sqlalchemy.orm import selectinload
 from decimal import Decimal
 import json
 
-from app.models.expense import Expense
-from app.models.group import Group
+from app.core.pagination import ExpenseKey
+from app.core.splits import Shares
+from app.models.expense import Expense, ExpenseSplit
+from app.models.group import Group, GroupMember
 from app.models.user import User
 from app.schemas.expense import ExpenseCreate, ExpenseUpdate
 
@@ -34,6 +36,31 @@ class ExpenseRepository:
         await self.session.refresh(expense, ['paid_by_user'])
         return expense
 
+    async def create_many(self, items: List[ExpenseCreate], paid_by_user_id: int) -> List[Expense]:
+        """Insert ``items`` with one multi-row INSERT ... RETURNING; rows come back in the order given.
+
+        paid_by_user is not loaded on the returned expenses.
+        """
+        # SQLite can only keep parameter order by inserting row by row, so there
+        # the rows are sorted by id instead (it numbers them in VALUES order)
+        in_order = self.session.bind.dialect.name == "postgresql"
+        result = await self.session.scalars(
+            insert(Expense).returning(Expense, sort_by_parameter_order=in_order),
+            [
+                {
+                    "group_id": item.group_id,
+                    "paid_by_user_id": paid_by_user_id,
+                    "amount": item.amount,
+                    "description": item.description,
+                    "category": item.category,
+                    "expense_metadata": json.dumps(item.metadata) if item.metadata else None,
+                }
+                for item in items
+            ],
+        )
+        expenses = list(result.all())
+        return expenses if in_order else sorted(expenses, key=lambda expense: expense.id)
+
     async def get_by_id(self, expense_id: int) -> Optional[Expense]:
         result = await self.session.execute(
             select(Expense)
@@ -42,23 +69,74 @@ class ExpenseRepository:
         )
         return result.scalar_one_or_none()
 
-    async def get_group_expenses(self, group_id: int, limit: int = 100, offset: int = 0) -> List[Expense]:
+    @staticmethod
+    def _page(query, limit: int, offset: int, after: Optional[ExpenseKey]):
+        # Newest first; id breaks ties in the order of ix_expenses_group_id_created_at_id
+        query = query.order_by(Expense.created_at.desc(), Expense.id)
+        if after is not None:
+            created_at, expense_id = after
+            # The OR alone is not a range condition the index can seek on; the
+            # redundant created_at bound is, and the OR only filters ties
+            query = query.where(
+                Expense.created_at <= created_at,
+                or_(
+                    Expense.created_at < created_at,
+                    and_(Expense.created_at == created_at, Expense.id > expense_id),
+                ),
+            )
+        elif offset:
+            query = query.offset(offset)
+        return query.limit(limit)
+
+    async def get_group_expenses(
+        self, group_id: int, limit: int = 100, offset: int = 0, after: Optional[ExpenseKey] = None
+    ) -> List[Expense]:
+        """Expenses of a group, newest first.
+
+        ``after`` is the (created_at, id) of the last row of the previous page;
+        when given it replaces ``offset`` so deep pages don't scan skipped rows.
+        """
         result = await self.session.execute(
-            select(Expense)
-            .where(Expense.group_id == group_id)
-            .options(selectinload(Expense.paid_by_user))
-            .order_by(Expense.created_at.desc())
-            .limit(limit)
-            .offset(offset)
+            self._page(
+                select(Expense)
+                .where(Expense.group_id == group_id)
+                .options(selectinload(Expense.paid_by_user)),
+                limit, offset, after,
+            )
         )
         return result.scalars().all()
 
+    async def stream_group_expenses(self, group_id: int, batch_size: int = 1000) -> AsyncIterator[Sequence[Row]]:
+        """Export rows of a group, oldest first, read from a server-side cursor ``batch_size`` at a time.
+
+        Plain columns rather than ORM objects, so nothing piles up in the identity map.
+        """
+        result = await self.session.stream(
+            select(
+                Expense.id,
+                Expense.created_at,
+                Expense.paid_by_user_id,
+                func.coalesce(User.full_name, User.email).label("paid_by"),
+                Expense.amount,
+                Expense.description,
+                Expense.category,
+                Expense.expense_metadata.label("metadata"),
+            )
+            .join(User, Expense.paid_by_user_id == User.id)
+            .where(Expense.group_id == group_id)
+            .order_by(Expense.created_at, Expense.id)
+            .execution_options(yield_per=batch_size)
+        )
+        async for rows in result.partitions():
+            yield rows
+
     async def update(self, expense_id: int, data: ExpenseUpdate) -> Optional[Expense]:
         expense = await self.get_by_id(expense_id)
         if not expense:
             return None
         
-        update_data = data.model_dump(exclude_unset=True)
+        # Splits live in their own table, see add_splits
+        update_data = data.model_dump(exclude_unset=True, exclude={"split_mode", "splits"})
         for field, value in update_data.items():
             if field == "metadata":
                 setattr(expense, "expense_metadata", json.dumps(value) if value else None)
@@ -69,6 +147,11 @@ class ExpenseRepository:
         await self.session.refresh(expense)
         return expense
 
+    async def get_many(self, expense_ids: List[int]) -> List[Expense]:
+        """Expenses among ``expense_ids`` (one IN query, paid_by_user not loaded)."""
+        result = await self.session.execute(select(Expense).where(Expense.id.in_(expense_ids)))
+        return result.scalars().all()
+
     async def delete(self, expense_id: int) -> bool:
         expense = await self.get_by_id(expense_id)
         if not expense:
@@ -78,62 +161,125 @@ class ExpenseRepository:
         await self.session.flush()
         return True
 
-    async def get_user_expenses(self, user_id: int, limit: int = 100, offset: int = 0) -> List[Expense]:
+    async def get_splits(self, expense_id: int) -> Shares:
+        result = await self.session.execute(
+            select(ExpenseSplit.user_id, ExpenseSplit.share_cents).where(ExpenseSplit.expense_id == expense_id)
+        )
+        return {row.user_id: row.share_cents for row in result}
+
+    async def get_splits_of(self, expense_ids: List[int]) -> Dict[int, Shares]:
+        """Splits of several expenses in one query, keyed by expense id."""
+        result = await self.session.execute(
+            select(ExpenseSplit.expense_id, ExpenseSplit.user_id, ExpenseSplit.share_cents)
+            .where(ExpenseSplit.expense_id.in_(expense_ids))
+        )
+        splits: Dict[int, Shares] = {expense_id: {} for expense_id in expense_ids}
+        for row in result:
+            splits[row.expense_id][row.user_id] = row.share_cents
+        return splits
+
+    async def add_splits(self, expense_id: int, shares: Shares) -> None:
+        await self.add_splits_of({expense_id: shares})
+
+    async def add_splits_of(self, splits: Dict[int, Shares]) -> None:
+        """Insert the splits of any number of expenses in one bulk INSERT."""
+        rows = [
+            {"expense_id": expense_id, "user_id": uid, "share_cents": cents}
+            for expense_id, shares in splits.items()
+            for uid, cents in shares.items()
+        ]
+        if rows:
+            await self.session.execute(insert(ExpenseSplit), rows)
+
+    async def delete_splits(self, expense_id: int) -> None:
+        await self.session.execute(delete(ExpenseSplit).where(ExpenseSplit.expense_id == expense_id))
+
+    async def delete_many(self, expense_ids: List[int]) -> None:
+        """Delete the expenses and their splits with one statement each."""
+        await self.session.execute(delete(ExpenseSplit).where(ExpenseSplit.expense_id.in_(expense_ids)))
+        await self.session.execute(delete(Expense).where(Expense.id.in_(expense_ids)))
+
+    async def get_user_expenses(
+        self, user_id: int, limit: int = 100, offset: int = 0, after: Optional[ExpenseKey] = None
+    ) -> List[Expense]:
         """Get all expenses for a user across all groups they're a member of"""
-        from app.models.group import GroupMember
-        
         result = await self.session.execute(
-            select(Expense)
-            .join(Group, Expense.group_id == Group.id)
-            .join(GroupMember, Group.id == GroupMember.group_id)
-            .where(GroupMember.user_id == user_id)
-            .options(selectinload(Expense.paid_by_user))
-            .order_by(Expense.created_at.desc())
-            .limit(limit)
-            .offset(offset)
+            self._page(
+                select(Expense)
+                .join(Group, Expense.group_id == Group.id)
+                .join(GroupMember, Group.id == GroupMember.group_id)
+                .where(GroupMember.user_id == user_id)
+                .options(selectinload(Expense.paid_by_user)),
+                limit, offset, after,
+            )
         )
         return result.scalars().all()
 
     async def get_group_expense_summary(self, group_id: int) -> Dict[str, Any]:
-        # Get total amount and count
-        total_result = await self.session.execute(
-            select(
-                func.sum(Expense.amount).label('total_amount'),
-                func.count(Expense.id).label('expense_count')
-            ).where(Expense.group_id == group_id)
+        """Total, per-category and per-payer sums of a group in one statement.
+
+        PostgreSQL aggregates all three levels with GROUPING SETS; other
+        dialects group by (category, payer) once and roll the rows up here.
+        ``by_user`` is keyed by user id, with display names in ``user_names``.
+        """
+        columns = [
+            Expense.category,
+            Expense.paid_by_user_id,
+            User.full_name,
+            User.email,
+            func.sum(Expense.amount).label('amount'),
+            func.count(Expense.id).label('expense_count'),
+        ]
+        query_base = (
+            select()
+            .join_from(Expense, User, Expense.paid_by_user_id == User.id)
+            .where(Expense.group_id == group_id)
         )
-        total_data = total_result.first()
-        
-        # Get expenses by category
-        category_result = await self.session.execute(
-            select(
-                Expense.category.label('category'),
-                func.sum(Expense.amount).label('amount')
+        if self.session.bind.dialect.name == "postgresql":
+            result = await self.session.execute(
+                query_base.add_columns(
+                    *columns,
+                    func.grouping(Expense.category).label('category_grouped'),
+                    func.grouping(Expense.paid_by_user_id).label('user_grouped'),
+                ).group_by(func.grouping_sets(
+                    tuple_(),
+                    tuple_(Expense.category),
+                    tuple_(Expense.paid_by_user_id, User.full_name, User.email),
+                ))
             )
-            .where(and_(Expense.group_id == group_id, Expense.category.isnot(None)))
-            .group_by(Expense.category)
-        )
-        by_category = {row.category: row.amount for row in category_result}
-        
-        # Get expenses by user
-        user_result = await self.session.execute(
-            select(
-                User.full_name.label('user_name'),
-                User.email.label('user_email'),
-                func.sum(Expense.amount).label('amount')
+            rows = result.all()
+            total = next((row for row in rows if row.category_grouped and row.user_grouped), None)
+            total_amount = total.amount if total else None
+            expense_count = total.expense_count if total else 0
+            category_rows = [row for row in rows if not row.category_grouped and row.user_grouped]
+            user_rows = [row for row in rows if row.category_grouped and not row.user_grouped]
+        else:
+            result = await self.session.execute(
+                query_base.add_columns(*columns).group_by(
+                    Expense.category, Expense.paid_by_user_id, User.full_name, User.email
+                )
             )
-            .join(Expense, Expense.paid_by_user_id == User.id)
-            .where(Expense.group_id == group_id)
-            .group_by(User.id, User.full_name, User.email)
-        )
-        by_user = {}
-        for row in user_result:
-            user_display = row.user_name or row.user_email
-            by_user[user_display] = row.amount
-        
+            rows = result.all()
+            total_amount = sum((row.amount for row in rows), Decimal('0'))
+            expense_count = sum(row.expense_count for row in rows)
+            category_rows = user_rows = rows
+
+        by_category: Dict[str, Decimal] = {}
+        for row in category_rows:
+            if row.category is not None:
+                by_category[row.category] = by_category.get(row.category, Decimal('0')) + row.amount
+
+        by_user: Dict[str, Decimal] = {}
+        user_names: Dict[str, str] = {}
+        for row in user_rows:
+            user_id = str(row.paid_by_user_id)
+            by_user[user_id] = by_user.get(user_id, Decimal('0')) + row.amount
+            user_names[user_id] = row.full_name or row.email
+
         return {
-            "total_amount": total_data.total_amount or Decimal('0'),
-            "expense_count": total_data.expense_count or 0,
+            "total_amount": total_amount or Decimal('0'),
+            "expense_count": expense_count or 0,
             "by_category": by_category,
-            "by_user": by_user
+            "by_user": by_user,
+            "user_names": user_names,
         }
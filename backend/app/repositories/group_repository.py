@@ -1,6 +1,8 @@
-from typing import Optional, List
+from datetime import datetime
+from typing import Optional, List, Dict, Iterable, Set
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, update, and_
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import selectinload
 
 from app.models.group import Group, GroupMember
@@ -16,18 +18,19 @@ class GroupRepository:
         group = Group(
             name=data.name,
             description=data.description,
-            created_by_user_id=created_by_user_id
+            created_by_user_id=created_by_user_id,
+            members=[GroupMember(user_id=created_by_user_id)],
         )
         self.session.add(group)
         await self.session.flush()
-        await self.session.refresh(group)
         return group
 
-    async def get_by_id(self, group_id: int) -> Optional[Group]:
+    async def get_by_id(self, group_id: int, populate_existing: bool = False) -> Optional[Group]:
         result = await self.session.execute(
             select(Group)
             .where(Group.id == group_id)
             .options(selectinload(Group.members).selectinload(GroupMember.user))
+            .execution_options(populate_existing=populate_existing)
         )
         return result.scalar_one_or_none()
 
@@ -83,6 +86,33 @@ class GroupRepository:
         await self.session.refresh(member)
         return member
 
+    async def get_memberships(self, group_id: int, user_ids: List[int]) -> Dict[int, bool]:
+        """Which of ``user_ids`` exist, mapped to whether they are already members (one IN query)."""
+        result = await self.session.execute(
+            select(User.id, GroupMember.id.is_not(None).label("is_member"))
+            .outerjoin(GroupMember, and_(GroupMember.user_id == User.id, GroupMember.group_id == group_id))
+            .where(User.id.in_(user_ids))
+        )
+        return {row.id: row.is_member for row in result}
+
+    async def add_members(self, group_id: int, user_ids: List[int]) -> Set[int]:
+        """Add the users in one INSERT, skipping existing memberships; returns the ids actually added."""
+        if not user_ids:
+            return set()
+        joined_at = datetime.utcnow()
+        insert = self._insert().values(
+            [{"group_id": group_id, "user_id": user_id, "joined_at": joined_at} for user_id in user_ids]
+        )
+        result = await self.session.execute(
+            insert.on_conflict_do_nothing(index_elements=[GroupMember.group_id, GroupMember.user_id])
+            .returning(GroupMember.user_id)
+        )
+        return set(result.scalars().all())
+
+    def _insert(self):
+        dialect = postgresql if self.session.bind.dialect.name == "postgresql" else sqlite
+        return dialect.insert(GroupMember)
+
     async def remove_member(self, group_id: int, user_id: int) -> bool:
         member = await self.session.execute(
             select(GroupMember).where(
@@ -106,6 +136,53 @@ class GroupRepository:
         )
         return result.scalar_one_or_none() is not None
 
+    async def get_version(self, group_id: int, user_id: Optional[int] = None) -> Optional[int]:
+        """The group's version, or None if it does not exist or ``user_id`` is not a member.
+
+        With a ``user_id`` this doubles as the membership check.
+        """
+        query = select(Group.version).where(Group.id == group_id)
+        if user_id is not None:
+            query = query.join(GroupMember, GroupMember.group_id == Group.id).where(GroupMember.user_id == user_id)
+        result = await self.session.execute(query)
+        return result.scalar_one_or_none()
+
+    async def bump_version(self, group_id: int) -> None:
+        await self.session.execute(
+            update(Group)
+            .where(Group.id == group_id)
+            .values(version=Group.version + 1)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def bump_versions_of_user(self, user_id: int) -> None:
+        """Bump every group the user belongs to (their name appears in those groups' reads)."""
+        await self.session.execute(
+            update(Group)
+            .where(Group.id.in_(select(GroupMember.group_id).where(GroupMember.user_id == user_id)))
+            .values(version=Group.version + 1)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def get_member_ids(self, group_id: int, user_ids: Optional[Iterable[int]] = None) -> Set[int]:
+        """Current members of the group, or those of ``user_ids`` that are members (one IN query)."""
+        query = select(GroupMember.user_id).where(GroupMember.group_id == group_id)
+        if user_ids is not None:
+            query = query.where(GroupMember.user_id.in_(list(user_ids)))
+        result = await self.session.execute(query)
+        return set(result.scalars().all())
+
+    async def get_member_ids_of(self, group_ids: Iterable[int]) -> Dict[int, Set[int]]:
+        """Current members of several groups in one query, keyed by group id."""
+        group_ids = list(group_ids)
+        result = await self.session.execute(
+            select(GroupMember.group_id, GroupMember.user_id).where(GroupMember.group_id.in_(group_ids))
+        )
+        members: Dict[int, Set[int]] = {group_id: set() for group_id in group_ids}
+        for row in result:
+            members[row.group_id].add(row.user_id)
+        return members
+
     async def get_group_with_members(self, group_id: int) -> Optional[Group]:
         result = await self.session.execute(
             select(Group)
@@ -0,0 +1,60 @@
+from typing import Optional, Tuple
+from datetime import datetime
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, and_
+
+from app.models.refresh_token import RefreshToken
+
+
+class RefreshTokenRepository:
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def create(self, user_id: int, token_hash: str, expires_at: datetime) -> RefreshToken:
+        refresh_token = RefreshToken(user_id=user_id, token_hash=token_hash, expires_at=expires_at)
+        self.session.add(refresh_token)
+        await self.session.flush()
+        return refresh_token
+
+    async def get_by_hash(self, token_hash: str) -> Optional[RefreshToken]:
+        result = await self.session.execute(
+            select(RefreshToken).where(RefreshToken.token_hash == token_hash)
+        )
+        return result.scalar_one_or_none()
+
+    async def claim(self, token_hash: str) -> Optional[Tuple[int, int]]:
+        """Revoke a live token in one conditional UPDATE; ``(id, user_id)`` if this call revoked it.
+
+        The UPDATE locks the row, so concurrent claims of one token serialize
+        and only the first still finds ``revoked_at`` unset.
+        """
+        now = datetime.utcnow()
+        result = await self.session.execute(
+            update(RefreshToken)
+            .where(and_(
+                RefreshToken.token_hash == token_hash,
+                RefreshToken.revoked_at.is_(None),
+                RefreshToken.expires_at > now,
+            ))
+            .values(revoked_at=now)
+            .returning(RefreshToken.id, RefreshToken.user_id)
+        )
+        row = result.one_or_none()
+        return (row.id, row.user_id) if row is not None else None
+
+    async def set_replaced_by(self, token_id: int, replaced_by_id: int) -> None:
+        await self.session.execute(
+            update(RefreshToken).where(RefreshToken.id == token_id).values(replaced_by_id=replaced_by_id)
+        )
+
+    async def revoke(self, refresh_token: RefreshToken, replaced_by_id: Optional[int] = None) -> None:
+        refresh_token.revoked_at = datetime.utcnow()
+        refresh_token.replaced_by_id = replaced_by_id
+        await self.session.flush()
+
+    async def revoke_all_for_user(self, user_id: int) -> None:
+        await self.session.execute(
+            update(RefreshToken)
+            .where(and_(RefreshToken.user_id == user_id, RefreshToken.revoked_at.is_(None)))
+            .values(revoked_at=datetime.utcnow())
+        )
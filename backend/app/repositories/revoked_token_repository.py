@@ -0,0 +1,31 @@
+from typing import List, Tuple
+from datetime import datetime
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, and_
+
+from app.models.revoked_token import RevokedToken
+
+
+class RevokedTokenRepository:
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def create(self, jti: str, user_id: int, expires_at: datetime) -> RevokedToken:
+        revoked = RevokedToken(jti=jti, user_id=user_id, expires_at=expires_at)
+        self.session.add(revoked)
+        await self.session.flush()
+        return revoked
+
+    async def exists(self, jti: str) -> bool:
+        result = await self.session.execute(select(RevokedToken.id).where(RevokedToken.jti == jti))
+        return result.scalar_one_or_none() is not None
+
+    async def get_since(self, last_id: int, limit: int) -> List[Tuple[int, str]]:
+        """Unexpired revocations with id greater than ``last_id``, oldest first."""
+        result = await self.session.execute(
+            select(RevokedToken.id, RevokedToken.jti)
+            .where(and_(RevokedToken.id > last_id, RevokedToken.expires_at > datetime.utcnow()))
+            .order_by(RevokedToken.id)
+            .limit(limit)
+        )
+        return [(row.id, row.jti) for row in result.all()]
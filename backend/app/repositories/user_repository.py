@@ -4,7 +4,7 @@ from sqlalchemy import select, or_
 
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
-from app.core.security import get_password_hash
+from app.core.security import get_password_hash_async
 
 
 class UserRepository:
@@ -20,7 +20,7 @@ class UserRepository:
         return result.scalar_one_or_none()
 
     async def create(self, data: UserCreate) -> User:
-        hashed_password = get_password_hash(data.password)
+        hashed_password = await get_password_hash_async(data.password)
         user = User(
             email=data.email, 
             full_name=data.full_name,
@@ -44,6 +44,11 @@ class UserRepository:
         await self.session.refresh(user)
         return user
 
+    async def update_password_hash(self, user: User, hashed_password: str) -> User:
+        user.hashed_password = hashed_password
+        await self.session.flush()
+        return user
+
     async def get_all_users(self, name_search: Optional[str] = None) -> List[User]:
         query = select(User)
         
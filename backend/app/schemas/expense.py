@@ -1,8 +1,38 @@
-from pydantic import BaseModel, Field, field_validator, ConfigDict
+from pydantic import BaseModel, Field, field_validator, model_validator, ConfigDict
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Literal
 from decimal import Decimal
 
+# equal: the same share for everyone (all current members unless ``splits`` lists a subset)
+# weight: shares proportional to each ``weight``; exact: each member owes ``amount``
+SplitMode = Literal["equal", "weight", "exact"]
+MAX_SPLITS = 1000
+MAX_IMPORT_ERRORS = 100
+
+
+class SplitShare(BaseModel):
+    user_id: int
+    weight: Optional[Decimal] = Field(None, gt=0)
+    amount: Optional[Decimal] = Field(None, ge=0, decimal_places=2)
+
+
+class SplitSpec(BaseModel):
+    split_mode: Optional[SplitMode] = None
+    splits: Optional[list[SplitShare]] = Field(None, min_length=1, max_length=MAX_SPLITS)
+
+    @model_validator(mode='after')
+    def check_splits(self):
+        if self.splits is None:
+            if self.split_mode in ("weight", "exact"):
+                raise ValueError(f"split_mode '{self.split_mode}' needs splits")
+            return self
+        if len({share.user_id for share in self.splits}) != len(self.splits):
+            raise ValueError("Each member can appear only once in splits")
+        field = {"weight": "weight", "exact": "amount"}.get(self.split_mode or "equal")
+        if field and any(getattr(share, field) is None for share in self.splits):
+            raise ValueError(f"split_mode '{self.split_mode}' needs a {field} for every member")
+        return self
+
 
 class ExpenseBase(BaseModel):
     amount: Decimal = Field(..., gt=0, decimal_places=2)
@@ -11,11 +41,11 @@ class ExpenseBase(BaseModel):
     metadata: Optional[Dict[str, Any]] = None
 
 
-class ExpenseCreate(ExpenseBase):
+class ExpenseCreate(ExpenseBase, SplitSpec):
     group_id: int
 
 
-class ExpenseUpdate(BaseModel):
+class ExpenseUpdate(SplitSpec):
     amount: Optional[Decimal] = Field(None, gt=0, decimal_places=2)
     description: Optional[str] = Field(None, max_length=500)
     category: Optional[str] = Field(None, max_length=100)
@@ -55,23 +85,83 @@ class ExpenseRead(ExpenseBase):
         return None
 
 
+class ExpensePage(BaseModel):
+    items: list[ExpenseRead]
+    next_cursor: Optional[str] = None  # None on the last page
+
+
+class ExpenseBulkCreate(BaseModel):
+    expenses: list[ExpenseCreate] = Field(..., min_length=1)
+    atomic: bool = False  # reject the whole batch if any item is invalid
+
+
+class ExpenseBulkDelete(BaseModel):
+    expense_ids: list[int] = Field(..., min_length=1)
+    atomic: bool = False
+
+
+class BulkItemError(BaseModel):
+    index: int  # position of the item in the request
+    detail: str
+
+
+class ExpenseBulkCreateResult(BaseModel):
+    created: list[ExpenseRead]  # in request order, without the failed items
+    errors: list[BulkItemError]
+
+
+class ExpenseBulkDeleteResult(BaseModel):
+    deleted: list[int]
+    errors: list[BulkItemError]
+
+
+class ImportRowError(BaseModel):
+    line: int  # line of the file the row starts on
+    detail: str
+
+
+class ExpenseImportResult(BaseModel):
+    imported: int
+    failed: int
+    errors: list[ImportRowError]  # the first MAX_IMPORT_ERRORS failures
+
+
 class ExpenseSummary(BaseModel):
     total_amount: Decimal
     expense_count: int
     by_category: Dict[str, Decimal]
-    by_user: Dict[str, Decimal]
+    by_user: Dict[str, Decimal]  # user_id -> amount paid
+    user_names: Dict[str, str]  # user_id -> display name
 
 
 class BalanceSummary(BaseModel):
     group_id: int
     group_name: str
     total_expenses: Decimal
-    member_count: int
-    equal_share: Decimal
-    balances: Dict[str, Decimal]  # user_id -> balance (positive = owed to them, negative = they owe)
-    net_balances: Dict[str, Decimal]  # user_id -> net balance after settling
+    member_count: int  # current members
+    equal_share: Decimal = Field(
+        deprecated="total_expenses / member_count, which is not what anyone owes once splits are "
+        "weighted, exact or predate a membership change; use net_balances",
+    )
+    # Current members and every ex-member still on the ledger, so net_balances sum to zero
+    balances: Dict[str, Decimal]  # user_id -> amount paid
+    net_balances: Dict[str, Decimal]  # user_id -> paid minus owed (positive = owed to them, negative = they owe)
+    former_member_ids: list[int] = []  # ex-members among the keys above
+
+
+class Settlement(BaseModel):
+    from_user_id: int
+    to_user_id: int
+    amount: Decimal
+
+
+class SettlementPlan(BaseModel):
+    group_id: int
+    transfers: list[Settlement]  # paying these leaves every balance at zero
 
 
 # Update forward references
 from app.schemas.user import UserRead
 ExpenseRead.model_rebuild()
+ExpensePage.model_rebuild()
+ExpenseBulkCreateResult.model_rebuild()
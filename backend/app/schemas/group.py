@@ -2,6 +2,8 @@ from pydantic import BaseModel, Field, ConfigDict
 from datetime import datetime
 from typing import Optional, List
 
+MAX_BULK_MEMBERS = 1000
+
 
 class GroupBase(BaseModel):
     name: str = Field(..., min_length=1, max_length=255)
@@ -30,6 +32,16 @@ class GroupMemberCreate(BaseModel):
     user_id: int
 
 
+class GroupMembersAdd(BaseModel):
+    user_ids: List[int] = Field(..., min_length=1, max_length=MAX_BULK_MEMBERS)
+
+
+class GroupMembersAddResult(BaseModel):
+    added: List[int]
+    already_members: List[int]
+    unknown: List[int]  # no such user
+
+
 class GroupMemberRead(BaseModel):
     model_config = ConfigDict(from_attributes=True)
     
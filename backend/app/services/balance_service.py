@@ -0,0 +1,78 @@
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+from decimal import Decimal
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.splits import Shares
+from app.repositories.balance_repository import BalanceRepository, LedgerRows, cents_to_share
+
+
+class BalanceDrift(NamedTuple):
+    group_id: int
+    user_id: int
+    ledger: Tuple[Decimal, Decimal]  # (paid_total, share_total) as stored
+    expected: Tuple[Decimal, Decimal]  # recomputed from expenses
+
+
+class ExpenseChange(NamedTuple):
+    paid_by_user_id: int
+    amount: Decimal  # change of the amount paid, negative for deletes
+    old_shares: Optional[Shares] = None
+    new_shares: Optional[Shares] = None
+
+
+class BalanceService:
+    """Keeps the group_balances ledger in step with expense writes.
+
+    Every method runs inside the caller's transaction. Shares come from
+    expense_splits, so membership changes do not touch the ledger.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+        self.repo = BalanceRepository(session)
+
+    async def record_expense(
+        self,
+        group_id: int,
+        paid_by_user_id: int,
+        amount: Decimal,
+        old_shares: Optional[Shares] = None,
+        new_shares: Optional[Shares] = None,
+    ) -> None:
+        """Apply a change of ``amount`` paid (negative for deletes) and of the expense's splits."""
+        await self.record_expenses(group_id, [ExpenseChange(paid_by_user_id, amount, old_shares, new_shares)])
+
+    async def record_expenses(self, group_id: int, changes: Iterable[ExpenseChange]) -> None:
+        """Apply the changes of several expenses of one group with a single upsert."""
+        paid: Dict[int, Decimal] = {}
+        share_cents: Dict[int, int] = {}
+        for change in changes:
+            paid[change.paid_by_user_id] = paid.get(change.paid_by_user_id, Decimal('0')) + change.amount
+            old_shares, new_shares = change.old_shares or {}, change.new_shares or {}
+            for user_id in old_shares.keys() | new_shares.keys():
+                cents = new_shares.get(user_id, 0) - old_shares.get(user_id, 0)
+                share_cents[user_id] = share_cents.get(user_id, 0) + cents
+        deltas: LedgerRows = {
+            (group_id, user_id): (paid.get(user_id, Decimal('0')), cents_to_share(share_cents.get(user_id, 0)))
+            for user_id in paid.keys() | share_cents.keys()
+        }
+        await self.repo.apply_deltas(group_id, deltas)
+
+    async def find_drift(self, group_id: Optional[int] = None) -> List[BalanceDrift]:
+        ledger = await self.repo.get_ledger(group_id)
+        expected = await self.repo.compute_from_expenses(group_id)
+        zero = (Decimal('0'), Decimal('0'))
+        drift = []
+        # A missing row and an all-zero row mean the same thing
+        for key in sorted(ledger.keys() | expected.keys()):
+            stored, wanted = ledger.get(key, zero), expected.get(key, zero)
+            if stored != wanted:
+                drift.append(BalanceDrift(key[0], key[1], stored, wanted))
+        return drift
+
+    async def rebuild(self, group_id: Optional[int] = None) -> List[BalanceDrift]:
+        """Overwrite drifted ledger rows with values recomputed from expenses; returns the drift fixed."""
+        drift = await self.find_drift(group_id)
+        expected = {(d.group_id, d.user_id): d.expected for d in drift}
+        await self.repo.replace_rows(expected)
+        return drift
@@ -1,10 +1,31 @@
-from typing import Optional, List
+import json
+from typing import Optional, List, Dict, Set, Any, AsyncIterable, AsyncIterator, Callable, Awaitable, Tuple, TypeVar
+from decimal import Decimal
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.repositories.expense_repository import ExpenseRepository
 from app.repositories.group_repository import GroupRepository
-from app.schemas.expense import ExpenseCreate, ExpenseUpdate, ExpenseRead, ExpenseSummary, BalanceSummary
+from app.repositories.balance_repository import BalanceRepository
+from app.repositories.expense_import_repository import ExpenseImportRepository, StagedExpense
+from app.repositories.user_repository import UserRepository
+from app.services.balance_service import BalanceService, ExpenseChange
+from app.schemas.expense import (
+    SplitSpec, ExpenseCreate, ExpenseUpdate, ExpenseRead, ExpensePage, ExpenseSummary, BalanceSummary, Settlement, SettlementPlan,
+    BulkItemError, ExpenseBulkCreateResult, ExpenseBulkDeleteResult, ImportRowError, ExpenseImportResult, MAX_IMPORT_ERRORS,
+)
 from app.models.expense import Expense
+from app.models.user import User
+from app.core.config import get_settings
+from app.core.expense_import import ImportRow
+from app.core.expense_export import ExportFormat, encode_header, encode_rows
+from app.core.pagination import encode_cursor, decode_cursor
+from app.core.read_cache import group_read_cache
+from app.core.settlement import net_balances_in_cents, simplify_debts
+from app.core.splits import Shares, amount_to_cents, split_by_weight, split_equal, split_exact
+
+T = TypeVar("T")
+settings = get_settings()
 
 
 class ExpenseService:
@@ -12,14 +33,20 @@ class ExpenseService:
         self.session = session
         self.repo = ExpenseRepository(session)
         self.group_repo = GroupRepository(session)
+        self.user_repo = UserRepository(session)
+        self.balance_repo = BalanceRepository(session)
+        self.balances = BalanceService(session)
 
     async def create_expense(self, data: ExpenseCreate, paid_by_user_id: int) -> ExpenseRead:
         # Check if user is a member of the group
         if not await self.group_repo.is_member(data.group_id, paid_by_user_id):
             raise ValueError("You must be a member of the group to add expenses")
         
+        shares = await self._allocate(data.group_id, data.amount, data)
         expense: Expense = await self.repo.create(data, paid_by_user_id)
-        await self.session.commit()
+        await self.repo.add_splits(expense.id, shares)
+        await self.balances.record_expense(expense.group_id, paid_by_user_id, expense.amount, new_shares=shares)
+        await self.group_repo.bump_version(expense.group_id)
         
         # Convert the expense to a dict and handle metadata conversion
         expense_dict = {
@@ -51,6 +78,193 @@ class ExpenseService:
             return None
         return ExpenseRead.model_validate(expense)
 
+    async def create_expenses(
+        self, items: List[ExpenseCreate], paid_by_user_id: int, atomic: bool = False
+    ) -> ExpenseBulkCreateResult:
+        """Create a batch of expenses with a fixed number of statements, whatever its size.
+
+        Membership is checked once per group and all rows go in with one
+        INSERT ... RETURNING. Invalid items are reported in ``errors`` and
+        skipped, or reject the whole batch when ``atomic``.
+        """
+        self._check_batch_size(len(items))
+        members = await self.group_repo.get_member_ids_of({item.group_id for item in items})
+        valid: List[Tuple[ExpenseCreate, Shares]] = []
+        errors: List[BulkItemError] = []
+        for index, item in enumerate(items):
+            try:
+                if paid_by_user_id not in members[item.group_id]:
+                    raise ValueError("You must be a member of the group to add expenses")
+                shares = await self._allocate(item.group_id, item.amount, item, member_ids=members[item.group_id])
+                valid.append((item, shares))
+            except ValueError as e:
+                errors.append(BulkItemError(index=index, detail=str(e)))
+        self._check_atomic(errors, atomic)
+        if not valid:
+            return ExpenseBulkCreateResult(created=[], errors=errors)
+
+        expenses = await self.repo.create_many([item for item, _ in valid], paid_by_user_id)
+        splits = {expense.id: shares for expense, (_, shares) in zip(expenses, valid)}
+        await self.repo.add_splits_of(splits)
+        await self._record_batch(
+            expenses, lambda expense: ExpenseChange(paid_by_user_id, expense.amount, new_shares=splits[expense.id])
+        )
+        payer = await self.user_repo.get_by_id(paid_by_user_id)
+        return ExpenseBulkCreateResult(created=[self._to_read(expense, payer) for expense in expenses], errors=errors)
+
+    async def delete_expenses(self, expense_ids: List[int], user_id: int, atomic: bool = False) -> ExpenseBulkDeleteResult:
+        """Delete a batch of expenses paid by ``user_id``; errors are reported as in create_expenses."""
+        self._check_batch_size(len(expense_ids))
+        found = {expense.id: expense for expense in await self.repo.get_many(expense_ids)}
+        expenses: Dict[int, Expense] = {}
+        errors: List[BulkItemError] = []
+        for index, expense_id in enumerate(expense_ids):
+            expense = found.get(expense_id)
+            if expense is None:
+                errors.append(BulkItemError(index=index, detail="Expense not found"))
+            elif expense.paid_by_user_id != user_id:
+                errors.append(BulkItemError(index=index, detail="You can only delete expenses you paid for"))
+            elif expense_id in expenses:
+                errors.append(BulkItemError(index=index, detail="Expense listed more than once"))
+            else:
+                expenses[expense_id] = expense
+        self._check_atomic(errors, atomic)
+        if not expenses:
+            return ExpenseBulkDeleteResult(deleted=[], errors=errors)
+
+        ids = list(expenses)
+        splits = await self.repo.get_splits_of(ids)
+        await self.repo.delete_many(ids)
+        await self._record_batch(
+            list(expenses.values()), lambda expense: ExpenseChange(user_id, -expense.amount, old_shares=splits[expense.id])
+        )
+        return ExpenseBulkDeleteResult(deleted=ids, errors=errors)
+
+    async def import_expenses(
+        self, group_id: int, user_id: int, rows: AsyncIterable[ImportRow], atomic: bool = False
+    ) -> ExpenseImportResult:
+        """Load a stream of parsed rows into the group as expenses paid by ``user_id``.
+
+        Each row is validated as an ExpenseCreate (its group_id is ignored) and
+        staged in batches of settings.expense_import_batch_rows, so memory use
+        does not grow with the file. Invalid rows are skipped and reported,
+        or abort the import when ``atomic``. The ledger and the group version
+        are updated once at the end.
+        """
+        members = await self.group_repo.get_member_ids(group_id)
+        if user_id not in members:
+            raise ValueError("You must be a member of the group to import expenses")
+
+        importer = ExpenseImportRepository(self.session)
+        await importer.start()
+        batch: List[StagedExpense] = []
+        errors: List[ImportRowError] = []
+        imported = failed = 0
+        paid, share_cents = Decimal('0'), {}
+        async for row in rows:
+            try:
+                if row.error:
+                    raise ValueError(row.error)
+                item = self._import_row(group_id, row.data)
+                shares = await self._allocate(group_id, item.amount, item, member_ids=members)
+            except ValueError as e:
+                detail = self._describe(e)
+                if atomic:
+                    raise ValueError(f"Line {row.line}: {detail}")
+                failed += 1
+                if len(errors) < MAX_IMPORT_ERRORS:
+                    errors.append(ImportRowError(line=row.line, detail=detail))
+                continue
+            batch.append((item, shares))
+            paid += item.amount
+            for member_id, cents in shares.items():
+                share_cents[member_id] = share_cents.get(member_id, 0) + cents
+            if len(batch) >= settings.expense_import_batch_rows:
+                await importer.stage(user_id, batch)
+                imported += len(batch)
+                batch = []
+        if batch:
+            await importer.stage(user_id, batch)
+            imported += len(batch)
+        await importer.finish(group_id, user_id)
+
+        if imported:
+            # The whole import is one change of what the importer paid and of everyone's shares
+            await self.balances.record_expenses(group_id, [ExpenseChange(user_id, paid, new_shares=share_cents)])
+            await self.group_repo.bump_version(group_id)
+        return ExpenseImportResult(imported=imported, failed=failed, errors=errors)
+
+    @staticmethod
+    def _import_row(group_id: int, data: Dict[str, Any]) -> ExpenseCreate:
+        metadata = data.get("metadata")
+        if isinstance(metadata, str):
+            # CSV cells carry metadata as JSON text
+            try:
+                data = {**data, "metadata": json.loads(metadata)}
+            except json.JSONDecodeError:
+                raise ValueError("metadata must be a JSON object")
+        return ExpenseCreate.model_validate({**data, "group_id": group_id})
+
+    @staticmethod
+    def _describe(error: ValueError) -> str:
+        if isinstance(error, ValidationError):
+            return "; ".join(
+                f"{'.'.join(str(part) for part in e['loc'])}: {e['msg']}" if e['loc'] else e['msg']
+                for e in error.errors()
+            )
+        return str(error)
+
+    async def export_group_expenses(self, group_id: int, user_id: int, format: ExportFormat) -> AsyncIterator[bytes]:
+        """Check membership, then return the group's expenses as a stream of encoded chunks.
+
+        The stream reads through its own session: it is consumed by the
+        response after the request's session has been closed.
+        """
+        await self.get_group_version(group_id, user_id, "export expenses")
+        bind = self.session.bind
+
+        async def chunks() -> AsyncIterator[bytes]:
+            yield encode_header(format)
+            async with AsyncSession(bind=bind) as session:
+                async for rows in ExpenseRepository(session).stream_group_expenses(group_id):
+                    yield encode_rows(rows, format)
+        return chunks()
+
+    async def _record_batch(self, expenses: List[Expense], change: Callable[[Expense], ExpenseChange]) -> None:
+        # One ledger upsert and one version bump per group, in group order
+        by_group: Dict[int, List[ExpenseChange]] = {}
+        for expense in expenses:
+            by_group.setdefault(expense.group_id, []).append(change(expense))
+        for group_id, changes in sorted(by_group.items()):
+            await self.balances.record_expenses(group_id, changes)
+            await self.group_repo.bump_version(group_id)
+
+    @staticmethod
+    def _check_batch_size(size: int) -> None:
+        if size > settings.expense_bulk_max_items:
+            raise ValueError(f"A batch can hold at most {settings.expense_bulk_max_items} items")
+
+    @staticmethod
+    def _check_atomic(errors: List[BulkItemError], atomic: bool) -> None:
+        if atomic and errors:
+            raise ValueError(f"Item {errors[0].index}: {errors[0].detail}")
+
+    @staticmethod
+    def _to_read(expense: Expense, paid_by_user: User) -> ExpenseRead:
+        # paid_by_user is passed in because bulk-inserted rows don't have it loaded
+        return ExpenseRead.model_validate({
+            'id': expense.id,
+            'group_id': expense.group_id,
+            'paid_by_user_id': expense.paid_by_user_id,
+            'amount': expense.amount,
+            'description': expense.description,
+            'category': expense.category,
+            'created_at': expense.created_at,
+            'updated_at': expense.updated_at,
+            'paid_by_user': paid_by_user,
+            'metadata': expense.expense_metadata,
+        })
+
     async def get_user_expenses(self, user_id: int, limit: int = 100, offset: int = 0) -> List[ExpenseRead]:
         """Get all expenses for a user across all groups they're a member of"""
         expenses = await self.repo.get_user_expenses(user_id, limit, offset)
@@ -64,6 +278,35 @@ class ExpenseService:
         expenses = await self.repo.get_group_expenses(group_id, limit, offset)
         return [ExpenseRead.model_validate(expense) for expense in expenses]
 
+    async def get_user_expenses_page(self, user_id: int, limit: int = 100, cursor: Optional[str] = None) -> ExpensePage:
+        """Keyset-paginated variant of get_user_expenses; an empty cursor starts at the newest expense."""
+        after = decode_cursor(cursor) if cursor else None
+        expenses = await self.repo.get_user_expenses(user_id, limit + 1, after=after)
+        return self._to_page(expenses, limit)
+
+    async def get_group_expenses_page(
+        self, group_id: int, user_id: int, limit: int = 100, cursor: Optional[str] = None
+    ) -> ExpensePage:
+        """Keyset-paginated variant of get_group_expenses; an empty cursor starts at the newest expense."""
+        if not await self.group_repo.is_member(group_id, user_id):
+            raise ValueError("You must be a member of the group to view expenses")
+
+        after = decode_cursor(cursor) if cursor else None
+        expenses = await self.repo.get_group_expenses(group_id, limit + 1, after=after)
+        return self._to_page(expenses, limit)
+
+    @staticmethod
+    def _to_page(expenses: List[Expense], limit: int) -> ExpensePage:
+        # One extra row was fetched to tell whether another page exists
+        items = expenses[:limit]
+        next_cursor = None
+        if len(expenses) > limit:
+            next_cursor = encode_cursor(items[-1].created_at, items[-1].id)
+        return ExpensePage(
+            items=[ExpenseRead.model_validate(expense) for expense in items],
+            next_cursor=next_cursor,
+        )
+
     async def update_expense(self, expense_id: int, data: ExpenseUpdate, user_id: int) -> Optional[ExpenseRead]:
         expense = await self.repo.get_by_id(expense_id)
         if not expense:
@@ -73,9 +316,22 @@ class ExpenseService:
         if expense.paid_by_user_id != user_id:
             raise ValueError("You can only update expenses you paid for")
         
+        group_id, previous_amount = expense.group_id, expense.amount
+        amount = data.amount if data.amount is not None else previous_amount
+        resplit = amount != previous_amount or data.split_mode is not None or data.splits is not None
+        if resplit:
+            old_shares = await self.repo.get_splits(expense_id)
+            new_shares = await self._allocate(group_id, amount, data, previous=old_shares)
+        
         updated_expense = await self.repo.update(expense_id, data)
+        if updated_expense and resplit:
+            await self.repo.delete_splits(expense_id)
+            await self.repo.add_splits(expense_id, new_shares)
+            await self.balances.record_expense(
+                group_id, user_id, amount - previous_amount, old_shares=old_shares, new_shares=new_shares
+            )
         if updated_expense:
-            await self.session.commit()
+            await self.group_repo.bump_version(group_id)
         return ExpenseRead.model_validate(updated_expense) if updated_expense else None
 
     async def delete_expense(self, expense_id: int, user_id: int) -> bool:
@@ -87,74 +343,139 @@ class ExpenseService:
         if expense.paid_by_user_id != user_id:
             raise ValueError("You can only delete expenses you paid for")
         
+        group_id, amount = expense.group_id, expense.amount
+        old_shares = await self.repo.get_splits(expense_id)
+        await self.repo.delete_splits(expense_id)
         success = await self.repo.delete(expense_id)
         if success:
-            await self.session.commit()
+            await self.balances.record_expense(group_id, user_id, -amount, old_shares=old_shares)
+            await self.group_repo.bump_version(group_id)
         return success
 
-    async def get_group_expense_summary(self, group_id: int, user_id: int) -> ExpenseSummary:
-        # Check if user is a member of the group
-        if not await self.group_repo.is_member(group_id, user_id):
-            raise ValueError("You must be a member of the group to view expense summary")
+    async def _allocate(
+        self,
+        group_id: int,
+        amount: Decimal,
+        spec: SplitSpec,
+        previous: Optional[Shares] = None,
+        member_ids: Optional[Set[int]] = None,
+    ) -> Shares:
+        """Shares in cents for ``spec``; without split instructions ``previous`` is rescaled to ``amount``.
+
+        ``member_ids`` spares the member lookup when the caller already has the group's members.
+        """
+        total_cents = amount_to_cents(amount)
+        if spec.splits is None:
+            if spec.split_mode is None and previous:
+                return split_by_weight(total_cents, {uid: Decimal(cents) for uid, cents in previous.items()})
+            if member_ids is None:
+                member_ids = await self.group_repo.get_member_ids(group_id)
+            return split_equal(total_cents, member_ids)
         
+        user_ids = [share.user_id for share in spec.splits]
+        if member_ids is None:
+            member_ids = await self.group_repo.get_member_ids(group_id, user_ids)
+        if not member_ids.issuperset(user_ids):
+            raise ValueError("Expenses can only be split between members of the group")
+        if spec.split_mode == "weight":
+            return split_by_weight(total_cents, {share.user_id: share.weight for share in spec.splits})
+        if spec.split_mode == "exact":
+            return split_exact(total_cents, {share.user_id: share.amount for share in spec.splits})
+        return split_equal(total_cents, user_ids)
+
+    async def get_group_version(self, group_id: int, user_id: int, action: str) -> int:
+        """The group's change version; raises unless ``user_id`` is a member."""
+        version = await self.group_repo.get_version(group_id, user_id)
+        if version is None:
+            raise ValueError(f"You must be a member of the group to {action}")
+        return version
+
+    async def get_group_expense_summary(self, group_id: int, user_id: int, allow_stale: bool = True) -> ExpenseSummary:
+        # The membership check also returns the version the cached summary must match
+        version = await self.get_group_version(group_id, user_id, "view expense summary")
+        return (await self.read_group_expense_summary(group_id, version, allow_stale))[1]
+
+    async def get_group_balance_summary(self, group_id: int, user_id: int, allow_stale: bool = True) -> BalanceSummary:
+        version = await self.get_group_version(group_id, user_id, "view balance summary")
+        return (await self.read_group_balance_summary(group_id, version, allow_stale))[1]
+
+    async def read_group_expense_summary(
+        self, group_id: int, version: int, allow_stale: bool = True
+    ) -> Tuple[int, ExpenseSummary]:
+        """``(version, summary)`` for a caller that already checked membership; the version is that of the summary served."""
+        return await group_read_cache.get_or_compute(
+            ("summary", group_id),
+            version,
+            lambda: self._build_expense_summary(group_id),
+            self._in_own_session(lambda service: service._build_expense_summary(group_id)) if allow_stale else None,
+        )
+
+    async def read_group_balance_summary(
+        self, group_id: int, version: int, allow_stale: bool = True
+    ) -> Tuple[int, BalanceSummary]:
+        """``(version, balances)`` for a caller that already checked membership; the version is that of the balances served."""
+        return await group_read_cache.get_or_compute(
+            ("balance", group_id),
+            version,
+            lambda: self._build_balance_summary(group_id),
+            self._in_own_session(lambda service: service._build_balance_summary(group_id)) if allow_stale else None,
+        )
+
+    def _in_own_session(self, build: Callable[["ExpenseService"], Awaitable[T]]) -> Callable[[], Awaitable[T]]:
+        """``build`` against a new session on the same database, for work that outlives the request."""
+        bind = self.session.bind
+        
+        async def run() -> T:
+            async with AsyncSession(bind=bind, expire_on_commit=False) as session:
+                return await build(ExpenseService(session))
+        return run
+
+    async def _build_expense_summary(self, group_id: int) -> ExpenseSummary:
         summary_data = await self.repo.get_group_expense_summary(group_id)
         return ExpenseSummary(**summary_data)
 
-    async def get_group_balance_summary(self, group_id: int, user_id: int) -> BalanceSummary:
-        # Check if user is a member of the group
-        if not await self.group_repo.is_member(group_id, user_id):
-            raise ValueError("You must be a member of the group to view balance summary")
-        
-        # Get group info and members
-        group = await self.group_repo.get_group_with_members(group_id)
-        if not group:
+    async def _build_balance_summary(self, group_id: int) -> BalanceSummary:
+        # O(participants) read of the incrementally maintained ledger
+        ledger = await self.balance_repo.get_group_balances(group_id)
+        if not ledger:
             raise ValueError("Group not found")
-        
-        # Get all expenses for the group
-        expenses = await self.repo.get_group_expenses(group_id, limit=1000, offset=0)
-        
-        # Calculate balances
-        member_count = len(group.members)
-        if member_count == 0:
-            return BalanceSummary(
-                group_id=group_id,
-                group_name=group.name,
-                total_expenses=0,
-                member_count=0,
-                equal_share=0,
-                balances={},
-                net_balances={}
-            )
-        
-        total_expenses = sum(expense.amount for expense in expenses)
-        equal_share = total_expenses / member_count if member_count > 0 else 0
-        
-        # Initialize balances for each member
-        balances = {}
-        for member in group.members:
-            balances[str(member.user_id)] = 0
-        
-        # Calculate what each member paid vs what they should pay
-        for expense in expenses:
-            paid_by_user_id = str(expense.paid_by_user_id)
-            if paid_by_user_id in balances:
-                balances[paid_by_user_id] += expense.amount
-        
-        # Calculate net balances (what each member owes/is owed)
-        net_balances = {}
-        for member in group.members:
-            user_id_str = str(member.user_id)
-            paid_amount = balances.get(user_id_str, 0)
-            should_pay = equal_share
-            net_balance = paid_amount - should_pay
-            net_balances[user_id_str] = net_balance
-        
+
+        members = ledger["members"]
+        member_count = len(members)
+        # Ex-members keep what they paid and owe until settled; leaving them out
+        # would stop the balances summing to zero and disagree with /settlements
+        former = {
+            user_id: (paid, share) for user_id, (paid, share) in ledger["former_members"].items()
+            if paid or share
+        }
+        participants = {**members, **former}
+        total_expenses = ledger["total_expenses"]
+
+        # What each participant paid, and paid minus what they owe
+        balances = {str(user_id): paid for user_id, (paid, _) in participants.items()}
+        net_balances = {str(user_id): paid - share for user_id, (paid, share) in participants.items()}
+
         return BalanceSummary(
             group_id=group_id,
-            group_name=group.name,
+            group_name=ledger["group_name"],
             total_expenses=total_expenses,
             member_count=member_count,
-            equal_share=equal_share,
+            equal_share=total_expenses / member_count if member_count else 0,
             balances=balances,
-            net_balances=net_balances
+            net_balances=net_balances,
+            former_member_ids=sorted(former),
         )
+
+    async def get_group_settlements(self, group_id: int, user_id: int) -> SettlementPlan:
+        """Transfers that settle every balance in the group, including payers who have since left."""
+        if not await self.group_repo.is_member(group_id, user_id):
+            raise ValueError("You must be a member of the group to view settlements")
+        
+        ledger = await self.balance_repo.get_ledger(group_id)
+        net_balances = {member_id: paid - share for (_, member_id), (paid, share) in ledger.items()}
+        net_cents = net_balances_in_cents(net_balances)
+        transfers = [
+            Settlement(from_user_id=debtor, to_user_id=creditor, amount=Decimal(cents).scaleb(-2))
+            for debtor, creditor, cents in simplify_debts(net_cents)
+        ]
+        return SettlementPlan(group_id=group_id, transfers=transfers)
@@ -3,7 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.repositories.group_repository import GroupRepository
 from app.repositories.user_repository import UserRepository
-from app.schemas.group import GroupCreate, GroupUpdate, GroupRead, GroupMemberCreate, GroupWithMembers, GroupMemberRead
+from app.schemas.group import GroupCreate, GroupUpdate, GroupRead, GroupMemberCreate, GroupWithMembers, GroupMemberRead, GroupMembersAddResult
 from app.models.group import Group, GroupMember
 
 
@@ -14,15 +14,9 @@ class GroupService:
         self.user_repo = UserRepository(session)
 
     async def create_group(self, data: GroupCreate, created_by_user_id: int) -> GroupRead:
+        # The group and the creator's membership are inserted in one flush
         group: Group = await self.repo.create(data, created_by_user_id)
-        await self.session.commit()
-        
-        # Add creator as a member
-        await self.repo.add_member(group.id, GroupMemberCreate(user_id=created_by_user_id))
-        await self.session.commit()
-        
-        # Refresh to get the updated group with members
-        group = await self.repo.get_by_id(group.id)
+        group = await self.repo.get_by_id(group.id, populate_existing=True)
         return GroupWithMembers.model_validate(group)
 
     async def get_group(self, group_id: int) -> Optional[GroupWithMembers]:
@@ -31,6 +25,10 @@ class GroupService:
             return None
         return GroupWithMembers.model_validate(group)
 
+    async def get_group_version(self, group_id: int) -> Optional[int]:
+        """The group's change version, None if it does not exist."""
+        return await self.repo.get_version(group_id)
+
     async def get_user_groups(self, user_id: int) -> List[GroupRead]:
         groups = await self.repo.get_user_groups(user_id)
         return [GroupRead.model_validate(group) for group in groups]
@@ -43,7 +41,7 @@ class GroupService:
         group = await self.repo.update(group_id, data)
         if not group:
             return None
-        await self.session.commit()
+        await self.repo.bump_version(group_id)
         return GroupRead.model_validate(group)
 
     async def delete_group(self, group_id: int, user_id: int) -> bool:
@@ -52,10 +50,7 @@ class GroupService:
         if not group or group.created_by_user_id != user_id:
             raise ValueError("You can only delete groups you created")
         
-        success = await self.repo.delete(group_id)
-        if success:
-            await self.session.commit()
-        return success
+        return await self.repo.delete(group_id)
 
     async def add_member(self, group_id: int, data: GroupMemberCreate, added_by_user_id: int) -> Optional[GroupMember]:
         # Check if the user adding members is a member of the group
@@ -69,9 +64,28 @@ class GroupService:
         
         member = await self.repo.add_member(group_id, data)
         if member:
-            await self.session.commit()
+            await self.repo.bump_version(group_id)
         return member
 
+    async def add_members(self, group_id: int, user_ids: List[int], added_by_user_id: int) -> GroupMembersAddResult:
+        """Add several users with a fixed number of queries, reporting each id as added, already a member or unknown."""
+        if not await self.repo.is_member(group_id, added_by_user_id):
+            raise ValueError("You must be a member of the group to add other members")
+        
+        requested = list(dict.fromkeys(user_ids))
+        memberships = await self.repo.get_memberships(group_id, requested)
+        # Memberships created concurrently since the check are skipped by the insert and reported as existing
+        added = await self.repo.add_members(
+            group_id, [user_id for user_id in requested if memberships.get(user_id) is False]
+        )
+        if added:
+            await self.repo.bump_version(group_id)
+        return GroupMembersAddResult(
+            added=[user_id for user_id in requested if user_id in added],
+            already_members=[user_id for user_id in requested if user_id in memberships and user_id not in added],
+            unknown=[user_id for user_id in requested if user_id not in memberships],
+        )
+
     async def remove_member(self, group_id: int, user_id_to_remove: int, removed_by_user_id: int) -> bool:
         # Check if the user removing members is a member of the group
         if not await self.repo.is_member(group_id, removed_by_user_id):
@@ -85,7 +99,7 @@ class GroupService:
         
         success = await self.repo.remove_member(group_id, user_id_to_remove)
         if success:
-            await self.session.commit()
+            await self.repo.bump_version(group_id)
         return success
 
     async def get_group_members(self, group_id: int, user_id: int) -> List[GroupMemberRead]:
@@ -2,11 +2,22 @@ from typing import Optional, List
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.repositories.user_repository import UserRepository
+from app.repositories.refresh_token_repository import RefreshTokenRepository
+from app.repositories.revoked_token_repository import RevokedTokenRepository
+from app.repositories.group_repository import GroupRepository
 from app.schemas.user import UserCreate, UserRead, UserUpdate, UserLogin, Token
 from app.models.user import User
-from app.core.security import verify_password, create_access_token
-from datetime import timedelta
+from app.core.security import (
+    verify_and_update_password_async,
+    create_access_token,
+    create_refresh_token,
+    hash_refresh_token,
+)
+from datetime import datetime, timedelta
 from app.core.config import get_settings
+from app.core.principal_cache import invalidate_principal
+from app.core.revocation import revocation_list
+from app.db.session import on_commit
 
 settings = get_settings()
 
@@ -15,13 +26,15 @@ class UserService:
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
         self.repo = UserRepository(session)
+        self.refresh_repo = RefreshTokenRepository(session)
+        self.revoked_repo = RevokedTokenRepository(session)
+        self.group_repo = GroupRepository(session)
 
     async def create_user(self, data: UserCreate) -> UserRead:
         existing = await self.repo.get_by_email(data.email)
         if existing:
             raise ValueError("Email already exists")
         user: User = await self.repo.create(data)
-        await self.session.commit()
         return UserRead.model_validate(user)
 
     async def get_user(self, user_id: int) -> Optional[UserRead]:
@@ -34,19 +47,75 @@ class UserService:
         user = await self.repo.update(user_id, data)
         if not user:
             return None
-        await self.session.commit()
+        # Names show up in group summaries and expense lists
+        await self.group_repo.bump_versions_of_user(user_id)
+        on_commit(self.session, lambda: invalidate_principal(user_id))
         return UserRead.model_validate(user)
 
     async def authenticate_user(self, login_data: UserLogin) -> Optional[Token]:
         user = await self.repo.get_by_email(login_data.email)
-        if not user or not verify_password(login_data.password, user.hashed_password):
+        if not user:
+            return None
+
+        valid, new_hash = await verify_and_update_password_async(login_data.password, user.hashed_password)
+        if not valid:
+            return None
+        if new_hash:
+            # Converge stored hashes to the configured bcrypt cost
+            await self.repo.update_password_hash(user, new_hash)
+
+        return await self._issue_tokens(user.id)
+
+    async def refresh_access_token(self, refresh_token: str) -> Optional[Token]:
+        """Rotate a refresh token and issue a new access token without a password check."""
+        token_hash = hash_refresh_token(refresh_token)
+        # Revoke before issuing: of concurrent rotations of one token only the
+        # first claims it, the others fall through to reuse detection
+        claimed = await self.refresh_repo.claim(token_hash)
+        if claimed is not None:
+            token_id, user_id = claimed
+            return await self._issue_tokens(user_id, rotated_id=token_id)
+
+        stored = await self.refresh_repo.get_by_hash(token_hash)
+        if not stored or stored.expires_at <= datetime.utcnow():
             return None
-        
+
+        # A rotated token was presented again: treat the family as stolen
+        await self.refresh_repo.revoke_all_for_user(stored.user_id)
+        # Commit now: the route answers 401, which rolls the request back
+        await self.session.commit()
+        return None
+
+    async def revoke_refresh_token(self, refresh_token: str) -> bool:
+        stored = await self.refresh_repo.get_by_hash(hash_refresh_token(refresh_token))
+        if not stored or stored.revoked_at is not None:
+            return False
+        await self.refresh_repo.revoke(stored)
+        return True
+
+    async def logout(self, user_id: int, token_payload: dict) -> None:
+        """Revoke the presented access token and every refresh token of the user."""
+        jti = token_payload.get("jti")
+        if jti is not None:
+            expires_at = datetime.utcfromtimestamp(token_payload["exp"])
+            await self.revoked_repo.create(jti, user_id, expires_at)
+        await self.refresh_repo.revoke_all_for_user(user_id)
+        if jti is not None:
+            on_commit(self.session, lambda: revocation_list.record(jti))
+
+    async def _issue_tokens(self, user_id: int, rotated_id: Optional[int] = None) -> Token:
         access_token_expires = timedelta(minutes=settings.access_token_expire_minutes)
         access_token = create_access_token(
-            data={"sub": str(user.id)}, expires_delta=access_token_expires
+            data={"sub": str(user_id)}, expires_delta=access_token_expires
         )
-        return Token(access_token=access_token, token_type="bearer")
+
+        raw_refresh_token, refresh_token_hash = create_refresh_token()
+        refresh_expires_at = datetime.utcnow() + timedelta(days=settings.refresh_token_expire_days)
+        stored = await self.refresh_repo.create(user_id, refresh_token_hash, refresh_expires_at)
+        if rotated_id is not None:
+            await self.refresh_repo.set_replaced_by(rotated_id, stored.id)
+
+        return Token(access_token=access_token, token_type="bearer", refresh_token=raw_refresh_token)
 
     async def get_all_users(self, name_search: Optional[str] = None) -> List[UserRead]:
         users = await self.repo.get_all_users(name_search)
@@ -0,0 +1,20 @@
+import argparse
+
+from app.core.config import get_settings
+from app.core.security import calibrate_bcrypt_rounds
+
+
+def main() -> None:
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description="Measure bcrypt cost on this host")
+    parser.add_argument("--target-ms", type=float, default=settings.password_hash_target_ms)
+    parser.add_argument("--min-rounds", type=int, default=settings.bcrypt_min_rounds)
+    parser.add_argument("--max-rounds", type=int, default=settings.bcrypt_max_rounds)
+    args = parser.parse_args()
+
+    rounds = calibrate_bcrypt_rounds(args.target_ms, args.min_rounds, args.max_rounds)
+    print(f"BCRYPT_ROUNDS={rounds}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+import argparse
+import asyncio
+import sys
+from typing import AsyncIterator, BinaryIO
+
+from app.core.expense_import import iter_rows
+from app.db.session import SessionLocal
+from app.schemas.expense import ExpenseImportResult
+from app.services.expense_service import ExpenseService
+
+CHUNK_BYTES = 1 << 16
+
+
+async def read_chunks(file: BinaryIO) -> AsyncIterator[bytes]:
+    while chunk := file.read(CHUNK_BYTES):
+        yield chunk
+
+
+async def run(file: BinaryIO, format: str, group_id: int, user_id: int, atomic: bool) -> ExpenseImportResult:
+    async with SessionLocal() as session:
+        service = ExpenseService(session)
+        result = await service.import_expenses(group_id, user_id, iter_rows(read_chunks(file), format), atomic)
+        await session.commit()
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Import expenses into a group from a CSV or NDJSON file")
+    parser.add_argument("file", help="path to the file, or - for stdin")
+    parser.add_argument("--group", type=int, required=True, help="group id to import into")
+    parser.add_argument("--user", type=int, required=True, help="id of the member who paid the expenses")
+    parser.add_argument("--format", choices=["csv", "ndjson"], default=None, help="default: from the file extension")
+    parser.add_argument("--atomic", action="store_true", help="import nothing if any row is invalid")
+    args = parser.parse_args()
+
+    format = args.format or ("ndjson" if args.file.endswith((".ndjson", ".jsonl")) else "csv")
+    try:
+        if args.file == "-":
+            result = asyncio.run(run(sys.stdin.buffer, format, args.group, args.user, args.atomic))
+        else:
+            with open(args.file, "rb") as file:
+                result = asyncio.run(run(file, format, args.group, args.user, args.atomic))
+    except ValueError as e:
+        sys.exit(f"Import failed: {e}")
+
+    for error in result.errors:
+        print(f"line {error.line}: {error.detail}")
+    print(f"{result.imported} imported, {result.failed} failed")
+    sys.exit(1 if result.failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+import argparse
+import asyncio
+import sys
+
+from app.db.session import SessionLocal
+from app.services.balance_service import BalanceService
+
+
+async def run(group_id: int | None, fix: bool) -> int:
+    async with SessionLocal() as session:
+        service = BalanceService(session)
+        drift = await (service.rebuild(group_id) if fix else service.find_drift(group_id))
+        for row in drift:
+            (paid, share), (expected_paid, expected_share) = row.ledger, row.expected
+            print(
+                f"group={row.group_id} user={row.user_id} "
+                f"paid {paid} -> {expected_paid} share {share} -> {expected_share}"
+            )
+        if fix:
+            await session.commit()
+    print(f"{len(drift)} drifted row(s){' fixed' if fix and drift else ''}")
+    return len(drift)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Check the group_balances ledger against raw expenses")
+    parser.add_argument("--group", type=int, default=None, help="only this group id")
+    parser.add_argument("--fix", action="store_true", help="overwrite drifted rows with recomputed values")
+    args = parser.parse_args()
+
+    drifted = asyncio.run(run(args.group, args.fix))
+    # Non-zero exit on unfixed drift so it can run as a periodic check
+    sys.exit(1 if drifted and not args.fix else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Peak memory of exporting a large group: the streaming export against
+materializing the rows the way get_group_expenses does.
+
+Seeds one group with ``--rows`` expenses in a throwaway SQLite file (or a
+scratch database given with ``--url``; it is seeded, so never point this at
+real data), then runs each export in a fresh process and reports its peak RSS.
+
+    python benchmarks/bench_export.py --rows 1000000
+    python benchmarks/bench_export.py --rows 1000000 --url postgresql+asyncpg://u:p@localhost/scratch
+"""
+
+import argparse
+import asyncio
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+BACKEND = Path(__file__).parent.parent
+sys.path.insert(0, str(BACKEND))
+for name, value in {
+    "DATABASE_USER": "bench",
+    "DATABASE_PASSWORD": "bench",
+    "DATABASE_NAME": "bench",
+    "SECRET_KEY": "bench-secret",
+}.items():
+    os.environ.setdefault(name, value)
+
+GROUP_ID = 1
+USER_ID = 1
+SEED_BATCH = 10_000
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--url", default=None)
+    parser.add_argument("--format", choices=["csv", "ndjson"], default="csv")
+    # Internal: run one export in this process against an already seeded database
+    parser.add_argument("--mode", choices=["stream", "materialize"], default=None, help=argparse.SUPPRESS)
+    return parser.parse_args()
+
+
+args = _parse_args()
+if args.url is None:
+    args.url = f"sqlite+aiosqlite:///{tempfile.mkdtemp()}/export.sqlite3"
+os.environ["DATABASE_URL"] = args.url
+
+from sqlalchemy import insert  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine  # noqa: E402
+
+import app.models  # noqa: E402,F401
+from app.db.session import Base  # noqa: E402
+from app.models.expense import Expense  # noqa: E402
+from app.models.group import Group, GroupMember  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.repositories.expense_repository import ExpenseRepository  # noqa: E402
+from app.schemas.expense import ExpenseRead  # noqa: E402
+from app.services.expense_service import ExpenseService  # noqa: E402
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is in KiB on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+async def seed(engine) -> None:
+    now = datetime.utcnow()
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(insert(User), [{"id": USER_ID, "email": "bench@example.com", "full_name": "Bench",
+                                           "hashed_password": "x", "created_at": now, "updated_at": now}])
+        await conn.execute(insert(Group), [{"id": GROUP_ID, "name": "Export", "created_by_user_id": USER_ID,
+                                            "created_at": now, "updated_at": now}])
+        await conn.execute(insert(GroupMember), [{"group_id": GROUP_ID, "user_id": USER_ID, "joined_at": now}])
+        for start in range(0, args.rows, SEED_BATCH):
+            await conn.execute(insert(Expense), [
+                {"group_id": GROUP_ID, "paid_by_user_id": USER_ID, "amount": (n % 10_000) / 100 + 1,
+                 "description": f"Expense {n}", "category": "Food", "expense_metadata": '{"source": "bench"}',
+                 "created_at": now + timedelta(seconds=n), "updated_at": now}
+                for n in range(start, min(start + SEED_BATCH, args.rows))
+            ])
+
+
+async def export(mode: str) -> int:
+    engine = create_async_engine(args.url)
+    written = 0
+    async with AsyncSession(bind=engine) as session:
+        if mode == "stream":
+            async for chunk in await ExpenseService(session).export_group_expenses(GROUP_ID, USER_ID, args.format):
+                written += len(chunk)
+        else:
+            expenses = await ExpenseRepository(session).get_group_expenses(GROUP_ID, limit=args.rows)
+            models = [ExpenseRead.model_validate(expense) for expense in expenses]
+            written = sum(len(model.model_dump_json()) for model in models)
+    await engine.dispose()
+    return written
+
+
+def main() -> None:
+    if args.mode:
+        started = time.perf_counter()
+        written = asyncio.run(export(args.mode))
+        print(f"{args.mode:>12} {time.perf_counter() - started:>9.1f}s {written / 1e6:>10.1f} MB {peak_rss_mb():>12.1f} MB")
+        return
+
+    started = time.perf_counter()
+    engine = create_async_engine(args.url)
+    asyncio.run(seed(engine))
+    asyncio.run(engine.dispose())
+    print(f"seeded {args.rows} expenses in {time.perf_counter() - started:.1f}s")
+    print(f"{'mode':>12} {'time':>10} {'output':>13} {'peak RSS':>15}")
+    for mode in ("stream", "materialize"):
+        subprocess.run(
+            [sys.executable, __file__, "--rows", str(args.rows), "--url", args.url,
+             "--format", args.format, "--mode", mode],
+            check=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
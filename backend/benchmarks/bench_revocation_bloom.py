@@ -0,0 +1,68 @@
+"""
+Memory and false-positive stats for the revocation Bloom filter.
+
+Loads ``--revoked`` random jtis into a filter sized like production and
+compares its footprint with an exact Python set, then probes with unrevoked
+jtis to measure the false-positive rate (the share of requests that would
+need a storage check).
+
+    python benchmarks/bench_revocation_bloom.py --revoked 1000000
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+for name, value in {
+    "DATABASE_USER": "bench",
+    "DATABASE_PASSWORD": "bench",
+    "DATABASE_NAME": "bench",
+    "SECRET_KEY": "bench-secret",
+}.items():
+    os.environ.setdefault(name, value)
+
+from app.core.bloom import BloomFilter  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--revoked", type=int, default=1_000_000)
+    parser.add_argument("--probes", type=int, default=1_000_000)
+    parser.add_argument("--error-rate", type=float, default=0.001)
+    args = parser.parse_args()
+
+    revoked = [uuid.uuid4().hex for _ in range(args.revoked)]
+
+    tracemalloc.start()
+    exact = set(revoked)
+    set_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    bloom = BloomFilter(args.revoked, args.error_rate)
+    started = time.perf_counter()
+    for jti in revoked:
+        bloom.add(jti)
+    insert_s = time.perf_counter() - started
+
+    probes = [uuid.uuid4().hex for _ in range(args.probes)]
+    started = time.perf_counter()
+    false_positives = sum(1 for jti in probes if jti in bloom)
+    lookup_s = time.perf_counter() - started
+
+    print(f"revoked tokens:       {args.revoked}")
+    print(f"bloom size:           {bloom.size_bytes / 2**20:8.2f} MiB ({bloom.num_hashes} hashes)")
+    print(f"exact set size:       {set_bytes / 2**20:8.2f} MiB (set only, excluding the jti strings)")
+    print(f"insert:               {insert_s / args.revoked * 1e6:8.2f} us/jti")
+    print(f"lookup:               {lookup_s / args.probes * 1e6:8.2f} us/jti")
+    print(f"false positives:      {false_positives / args.probes:.5f} (target {args.error_rate}, "
+          f"estimated {bloom.estimated_false_positive_rate():.5f})")
+    del exact
+
+
+if __name__ == "__main__":
+    main()
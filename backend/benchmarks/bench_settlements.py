@@ -0,0 +1,72 @@
+"""
+Benchmark for the settle-up planner against the pairwise matching clients used to do.
+
+The naive matcher walks every creditor for every debtor (O(n^2)); the
+heap-based one in app.core.settlement is O(n log n) and emits at most n - 1
+transfers.
+
+    python benchmarks/bench_settlements.py --members 100 1000 5000 20000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.settlement import simplify_debts  # noqa: E402
+
+
+def random_group(members: int, rng: random.Random) -> dict[int, int]:
+    net_cents = {user_id: rng.randint(-500_000, 500_000) for user_id in range(1, members)}
+    net_cents[members] = -sum(net_cents.values())
+    return net_cents
+
+
+def naive_pairing(net_cents: dict[int, int]) -> list[tuple[int, int, int]]:
+    creditors = [[user_id, cents] for user_id, cents in net_cents.items() if cents > 0]
+    transfers = []
+    for debtor, debt in net_cents.items():
+        if debt >= 0:
+            continue
+        owed = -debt
+        # Rescans settled creditors every time, like the client-side loops did
+        for creditor in creditors:
+            if owed == 0:
+                break
+            if creditor[1] == 0:
+                continue
+            amount = min(owed, creditor[1])
+            transfers.append((debtor, creditor[0], amount))
+            creditor[1] -= amount
+            owed -= amount
+    return transfers
+
+
+def timed(matcher, net_cents: dict[int, int]) -> tuple[float, int]:
+    started = time.perf_counter()
+    transfers = matcher(net_cents)
+    return time.perf_counter() - started, len(transfers)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--members", type=int, nargs="+", default=[100, 1000, 5000, 20000])
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    print(f"{'members':>8} {'heap ms':>10} {'transfers':>10} {'naive ms':>10} {'transfers':>10}")
+    for members in args.members:
+        net_cents = random_group(members, rng)
+        heap_time, heap_transfers = timed(simplify_debts, net_cents)
+        naive_time, naive_transfers = timed(naive_pairing, net_cents)
+        print(
+            f"{members:>8} {heap_time * 1000:>10.2f} {heap_transfers:>10} "
+            f"{naive_time * 1000:>10.2f} {naive_transfers:>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
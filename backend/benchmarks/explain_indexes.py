@@ -0,0 +1,146 @@
+"""
+Query plans of the hot expense / membership lookups before and after the
+0002 index migration.
+
+Migrates a scratch database to 0001, seeds it, prints the plan of each
+lookup, upgrades to head and prints them again. Defaults to a throwaway
+SQLite file; pass ``--url`` to run against a scratch PostgreSQL database
+(it is seeded, so never point this at real data).
+
+    python benchmarks/explain_indexes.py --expenses 200000
+    python benchmarks/explain_indexes.py --url postgresql+asyncpg://u:p@localhost/scratch
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+BACKEND = Path(__file__).parent.parent
+sys.path.insert(0, str(BACKEND))
+for name, value in {
+    "DATABASE_USER": "bench",
+    "DATABASE_PASSWORD": "bench",
+    "DATABASE_NAME": "bench",
+    "SECRET_KEY": "bench-secret",
+}.items():
+    os.environ.setdefault(name, value)
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", default=None)
+    parser.add_argument("--users", type=int, default=5_000)
+    parser.add_argument("--groups", type=int, default=2_000)
+    parser.add_argument("--members-per-group", type=int, default=8)
+    parser.add_argument("--expenses", type=int, default=200_000)
+    return parser.parse_args()
+
+
+args = _parse_args()
+os.environ["DATABASE_URL"] = args.url or f"sqlite+aiosqlite:///{tempfile.mkdtemp()}/explain.sqlite3"
+
+from alembic import command  # noqa: E402
+from alembic.config import Config  # noqa: E402
+from sqlalchemy import and_, func, insert, select, text  # noqa: E402
+from sqlalchemy.ext.asyncio import create_async_engine  # noqa: E402
+
+from app.models.expense import Expense  # noqa: E402
+from app.models.group import Group, GroupMember  # noqa: E402
+from app.models.user import User  # noqa: E402
+
+GROUP_ID = 42
+USER_ID = 7
+
+LOOKUPS = {
+    "get_group_expenses": select(Expense)
+    .where(Expense.group_id == GROUP_ID)
+    .order_by(Expense.created_at.desc())
+    .limit(100),
+    "group summary totals": select(func.sum(Expense.amount), func.count(Expense.id))
+    .where(Expense.group_id == GROUP_ID),
+    "is_member": select(GroupMember)
+    .where(and_(GroupMember.group_id == GROUP_ID, GroupMember.user_id == USER_ID)),
+    "get_user_groups": select(Group).join(GroupMember).where(GroupMember.user_id == USER_ID),
+    "expenses paid by user": select(Expense.id).where(Expense.paid_by_user_id == USER_ID),
+}
+
+
+async def seed(engine) -> None:
+    rng = random.Random(0)
+    now = datetime.utcnow()
+    async with engine.begin() as conn:
+        await conn.execute(insert(User), [
+            {"id": i, "email": f"user{i}@example.com", "hashed_password": "x",
+             "created_at": now, "updated_at": now}
+            for i in range(1, args.users + 1)
+        ])
+        await conn.execute(insert(Group), [
+            {"id": g, "name": f"group {g}", "created_by_user_id": rng.randint(1, args.users),
+             "created_at": now, "updated_at": now}
+            for g in range(1, args.groups + 1)
+        ])
+        members = {
+            g: rng.sample(range(1, args.users + 1), args.members_per_group)
+            for g in range(1, args.groups + 1)
+        }
+        members[GROUP_ID][0] = USER_ID
+        await conn.execute(insert(GroupMember), [
+            {"group_id": g, "user_id": u, "joined_at": now}
+            for g, users in members.items() for u in users
+        ])
+        rows = []
+        for _ in range(args.expenses):
+            g = rng.randint(1, args.groups)
+            created = now - timedelta(minutes=rng.randint(0, 525_600))
+            rows.append({"group_id": g, "paid_by_user_id": rng.choice(members[g]),
+                         "amount": rng.randint(100, 50_000) / 100, "category": "food",
+                         "created_at": created, "updated_at": created})
+        await conn.execute(insert(Expense), rows)
+        if engine.dialect.name == "postgresql":
+            await conn.execute(text("ANALYZE"))
+
+
+async def explain(engine, label: str) -> None:
+    print(f"\n===== {label} =====")
+    async with engine.connect() as conn:
+        if engine.dialect.name == "sqlite":
+            await conn.execute(text("ANALYZE"))
+        for name, stmt in LOOKUPS.items():
+            sql = str(stmt.compile(dialect=engine.dialect, compile_kwargs={"literal_binds": True}))
+            if engine.dialect.name == "postgresql":
+                prefix = "EXPLAIN (ANALYZE, BUFFERS, COSTS OFF)"
+            else:
+                prefix = "EXPLAIN QUERY PLAN"
+            result = await conn.execute(text(f"{prefix} {sql}"))
+            print(f"\n-- {name}")
+            for row in result:
+                print("  ", row[-1])
+
+
+async def phase(label: str, seed_first: bool = False) -> None:
+    # One engine per event loop: asyncpg connections cannot outlive their loop
+    engine = create_async_engine(os.environ["DATABASE_URL"])
+    try:
+        if seed_first:
+            await seed(engine)
+        await explain(engine, label)
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    config = Config(str(BACKEND / "alembic.ini"))
+    config.set_main_option("script_location", str(BACKEND / "alembic"))
+    command.upgrade(config, "0001")
+    asyncio.run(phase("before (0001)", seed_first=True))
+    command.upgrade(config, "head")
+    asyncio.run(phase("after (head)"))
+
+
+if __name__ == "__main__":
+    main()
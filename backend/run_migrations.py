@@ -1,16 +1,41 @@
+"""
+Bring the database schema to the Alembic head revision.
+
+Runs at every container start. When the database is already at head this
+costs one query on ``alembic_version`` and no DDL introspection. Otherwise
+replicas serialize on a PostgreSQL advisory lock and the first one to get
+it runs the upgrade; the others find the database at head and return.
+
+Databases created by the old ``create_all`` bootstrap (tables, but no
+``alembic_version``) are stamped with the baseline revision first.
+
+    python run_migrations.py                 # upgrade to head
+    python run_migrations.py --sql           # print the upgrade SQL (offline)
+    python run_migrations.py --sql --from 0001
+"""
+
+import argparse
 import asyncio
 import os
 import sys
 from pathlib import Path
+from typing import Optional, Tuple
+
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import inspect, text
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
 
 project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
 
-from sqlalchemy.ext.asyncio import create_async_engine
-from app.db.session import Base
-from app.models.user import User
+BASELINE_REVISION = "0001"
+# Arbitrary key shared by every replica running this script
+MIGRATION_LOCK_ID = 0x4D494752
 
-async def run_migrations():
+
+def database_url() -> str:
     database_url = os.getenv("DATABASE_URL")
     if not database_url:
         host = os.getenv("DATABASE_HOST", "localhost")
@@ -18,22 +43,102 @@ async def run_migrations():
         user = os.getenv("DATABASE_USER")
         password = os.getenv("DATABASE_PASSWORD")
         name = os.getenv("DATABASE_NAME")
-        
+
         if not all([user, password, name]):
             raise ValueError("DATABASE_USER, DATABASE_PASSWORD, and DATABASE_NAME environment variables must be set")
         database_url = f"postgresql+asyncpg://{user}:{password}@{host}:{port}/{name}"
-    
-    engine = create_async_engine(database_url)
-    
+    return database_url
+
+
+def alembic_config() -> Config:
+    config = Config(str(project_root / "alembic.ini"))
+    config.set_main_option("script_location", str(project_root / "alembic"))
+    return config
+
+
+def head_revision(config: Config) -> Optional[str]:
+    return ScriptDirectory.from_config(config).get_current_head()
+
+
+async def schema_state(conn: AsyncConnection) -> Tuple[Optional[str], bool]:
+    """Return (current revision, whether unversioned tables already exist)."""
+    def inspect_state(sync_conn):
+        revision = MigrationContext.configure(sync_conn).get_current_revision()
+        legacy = revision is None and inspect(sync_conn).has_table("users")
+        return revision, legacy
+
+    state = await conn.run_sync(inspect_state)
+    await conn.commit()
+    return state
+
+
+async def upgrade(url: str, config: Config) -> None:
+    head = head_revision(config)
+    engine = create_async_engine(url)
     try:
-        async with engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
-        print("✅ Database migrations completed successfully")
+        async with engine.connect() as conn:
+            revision, _ = await schema_state(conn)
+            if revision == head:
+                print(f"✅ Database already at head ({head}), nothing to do")
+                return
+
+            use_lock = conn.dialect.name == "postgresql"
+            if use_lock:
+                await conn.execute(text("SELECT pg_advisory_lock(:id)"), {"id": MIGRATION_LOCK_ID})
+                await conn.commit()
+            try:
+                # Another replica may have finished while we waited for the lock
+                revision, legacy = await schema_state(conn)
+                if revision == head:
+                    print(f"✅ Database already at head ({head}), nothing to do")
+                    return
+                if legacy:
+                    print(f"Stamping unversioned schema as {BASELINE_REVISION}")
+                    await asyncio.to_thread(command.stamp, config, BASELINE_REVISION)
+                # env.py runs its own event loop, so Alembic gets a worker thread
+                await asyncio.to_thread(command.upgrade, config, "head")
+            finally:
+                if use_lock:
+                    await conn.execute(text("SELECT pg_advisory_unlock(:id)"), {"id": MIGRATION_LOCK_ID})
+                    await conn.commit()
+        print(f"✅ Database migrated to head ({head})")
+    finally:
+        await engine.dispose()
+
+
+async def current_revision(url: str) -> Optional[str]:
+    engine = create_async_engine(url)
+    try:
+        async with engine.connect() as conn:
+            revision, legacy = await schema_state(conn)
+            return BASELINE_REVISION if legacy else revision
+    finally:
+        await engine.dispose()
+
+
+def main(argv: Optional[list] = None) -> None:
+    parser = argparse.ArgumentParser(description="Upgrade the database schema to the Alembic head.")
+    parser.add_argument("--sql", action="store_true", help="print the upgrade SQL instead of running it")
+    parser.add_argument("--from", dest="from_revision", default=None,
+                        help="starting revision for --sql (default: read from the database)")
+    args = parser.parse_args(argv)
+
+    url = database_url()
+    # alembic/env.py reads the same variable
+    os.environ["DATABASE_URL"] = url
+    config = alembic_config()
+
+    if args.sql:
+        start = args.from_revision or asyncio.run(current_revision(url))
+        command.upgrade(config, f"{start}:head" if start else "head", sql=True)
+        return
+
+    try:
+        asyncio.run(upgrade(url, config))
     except Exception as e:
         print(f"❌ Migration failed: {e}")
         sys.exit(1)
-    finally:
-        await engine.dispose()
+
 
 if __name__ == "__main__":
-    asyncio.run(run_migrations())
+    main()
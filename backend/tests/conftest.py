@@ -6,12 +6,13 @@ from sqlalchemy.pool import StaticPool
 from httpx import AsyncClient, ASGITransport
 
 from app.main import create_app
-from app.db.session import Base, get_db_session
+from app.db.session import Base, get_db_session, get_read_db_session
 from app.core.config import get_settings
 from app.models.user import User
 from app.models.group import Group, GroupMember
 from app.models.expense import Expense
 from app.core.security import get_password_hash, create_access_token
+from app.core.read_cache import group_read_cache
 from decimal import Decimal
 
 
@@ -34,6 +35,14 @@ TestSessionLocal = async_sessionmaker(
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_group_read_cache():
+    """Group ids and versions repeat across test databases; start every test cold."""
+    group_read_cache.clear()
+    yield
+    group_read_cache.clear()
+
+
 @pytest.fixture(scope="function")
 async def db_session() -> AsyncGenerator[AsyncSession, None]:
     """Create a fresh database session for each test."""
@@ -60,6 +69,7 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
         yield db_session
     
     app.dependency_overrides[get_db_session] = override_get_db
+    app.dependency_overrides[get_read_db_session] = override_get_db
     
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
         yield ac
@@ -0,0 +1,61 @@
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+from fastapi import Response
+from starlette.requests import Request
+
+from app.api.etag import group_etag, not_modified
+from app.api.routes.expenses import get_group_expense_summary
+
+
+def _request(headers: dict | None = None) -> Request:
+    raw_headers = [(key.lower().encode(), value.encode()) for key, value in (headers or {}).items()]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": raw_headers})
+
+
+class TestETags:
+    """Test cases for ETags and conditional GETs on group reads."""
+
+    def test_tag_depends_on_version_and_parts(self):
+        tag = group_etag("expenses", 1, 3, 7, 100)
+
+        assert tag.startswith('"g1.v3.') and tag.endswith('"')
+        assert group_etag("expenses", 1, 3, 7, 100) == tag
+        assert group_etag("expenses", 1, 4, 7, 100) != tag
+        assert group_etag("expenses", 1, 3, 8, 100) != tag
+        assert group_etag("summary", 1, 3, 7, 100) != tag
+
+    def test_if_none_match(self):
+        tag = group_etag("summary", 1, 3)
+
+        assert not_modified(_request(), tag) is None
+        assert not_modified(_request({"If-None-Match": group_etag("summary", 1, 2)}), tag) is None
+        for header in (tag, f'"other", {tag}', f"W/{tag}", "*"):
+            response = not_modified(_request({"If-None-Match": header}), tag)
+            assert response.status_code == 304
+            assert response.headers["ETag"] == tag
+
+    @pytest.mark.asyncio
+    async def test_not_modified_summary_skips_the_read(self):
+        service = AsyncMock()
+        service.get_group_version.return_value = 3
+        request = _request({"If-None-Match": group_etag("summary", 1, 3, 5)})
+
+        with patch("app.api.routes.expenses.ExpenseService", return_value=service):
+            response = await get_group_expense_summary(1, request, Response(), SimpleNamespace(id=5), None)
+
+        assert response.status_code == 304
+        service.read_group_expense_summary.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_stale_summary_is_tagged_with_its_own_version(self):
+        service = AsyncMock()
+        service.get_group_version.return_value = 4
+        service.read_group_expense_summary.return_value = (3, "summary at v3")
+        response = Response()
+
+        with patch("app.api.routes.expenses.ExpenseService", return_value=service):
+            summary = await get_group_expense_summary(1, _request(), response, SimpleNamespace(id=5), None)
+
+        assert summary == "summary at v3"
+        assert response.headers["ETag"] == group_etag("summary", 1, 3, 5)
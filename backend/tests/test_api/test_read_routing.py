@@ -0,0 +1,42 @@
+import time
+import pytest
+from unittest.mock import patch
+from starlette.requests import Request
+
+from app.api.deps import get_read_session, is_pinned_to_primary, PRIMARY_PIN_COOKIE, PRIMARY_PIN_HEADER
+
+
+def _request(headers: dict | None = None) -> Request:
+    raw_headers = [(key.lower().encode(), value.encode()) for key, value in (headers or {}).items()]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": raw_headers})
+
+
+async def _sessions(name):
+    yield name
+
+
+class TestReadRouting:
+    """Test cases for routing read-only routes to the replica."""
+
+    def test_fresh_client_reads_from_replica(self):
+        assert not is_pinned_to_primary(_request())
+
+    def test_recent_writer_is_pinned(self):
+        pinned_until = str(time.time() + 5)
+        assert is_pinned_to_primary(_request({"Cookie": f"{PRIMARY_PIN_COOKIE}={pinned_until}"}))
+        assert is_pinned_to_primary(_request({PRIMARY_PIN_HEADER: "1"}))
+
+    def test_expired_or_garbled_pin_is_ignored(self):
+        expired = str(time.time() - 1)
+        assert not is_pinned_to_primary(_request({"Cookie": f"{PRIMARY_PIN_COOKIE}={expired}"}))
+        assert not is_pinned_to_primary(_request({"Cookie": f"{PRIMARY_PIN_COOKIE}=nope"}))
+
+    @pytest.mark.asyncio
+    async def test_get_read_session_picks_engine(self):
+        with patch("app.api.deps.get_db_session", lambda: _sessions("primary")), \
+                patch("app.api.deps.get_read_db_session", lambda: _sessions("replica")):
+            replica = [s async for s in get_read_session(_request())]
+            primary = [s async for s in get_read_session(_request({PRIMARY_PIN_HEADER: "1"}))]
+
+        assert replica == ["replica"]
+        assert primary == ["primary"]
@@ -0,0 +1,85 @@
+import pytest
+from unittest.mock import patch
+
+from app.core.admission import AdmissionRejectedError, ConcurrencySlots, LoginAdmission, TokenBucketStore
+
+
+class TestTokenBucketStore:
+    """Test cases for the SQLite-backed token buckets."""
+
+    def test_burst_then_reject(self, tmp_path):
+        store = TokenBucketStore(str(tmp_path / "buckets.sqlite3"))
+        buckets = [("login:ip:1.2.3.4", 1 / 60, 3)]
+
+        assert [store.try_consume(buckets) for _ in range(3)] == [None, None, None]
+        key, retry_after = store.try_consume(buckets)
+        assert key == "login:ip:1.2.3.4"
+        assert 0 < retry_after <= 60
+
+    def test_rejection_charges_no_bucket(self, tmp_path):
+        store = TokenBucketStore(str(tmp_path / "buckets.sqlite3"))
+        store.try_consume([("email", 1 / 60, 1)])
+
+        assert store.try_consume([("ip", 1 / 60, 1), ("email", 1 / 60, 1)])[0] == "email"
+        assert store.try_consume([("ip", 1 / 60, 1)]) is None
+
+    def test_state_is_shared_between_store_instances(self, tmp_path):
+        path = str(tmp_path / "buckets.sqlite3")
+        TokenBucketStore(path).try_consume([("ip", 1 / 60, 1)])
+
+        assert TokenBucketStore(path).try_consume([("ip", 1 / 60, 1)]) is not None
+
+
+class TestConcurrencySlots:
+    """Test cases for the flock-based host-wide semaphore."""
+
+    def test_slots_are_exclusive(self, tmp_path):
+        slots = ConcurrencySlots(str(tmp_path), 2)
+        first, second = slots.try_acquire(), slots.try_acquire()
+
+        assert first is not None and second is not None
+        assert ConcurrencySlots(str(tmp_path), 2).try_acquire() is None
+        slots.release(first)
+        third = slots.try_acquire()
+        assert third is not None
+        slots.release(second)
+        slots.release(third)
+
+
+class TestLoginAdmission:
+    """Test cases for login admission control."""
+
+    @pytest.mark.asyncio
+    async def test_per_email_limit(self, tmp_path):
+        admission = LoginAdmission(str(tmp_path), max_concurrent=1)
+
+        with patch("app.core.admission.settings.login_email_burst", 2):
+            await admission.admit("login", "1.1.1.1", "A@example.com")
+            await admission.admit("login", "2.2.2.2", "a@example.com")
+            with pytest.raises(AdmissionRejectedError) as excinfo:
+                await admission.admit("login", "3.3.3.3", "a@example.com")
+
+        assert excinfo.value.reason == "email"
+        assert admission.stats()["rejected_email"] == 1
+        assert admission.stats()["admitted"] == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrency_cap(self, tmp_path):
+        admission = LoginAdmission(str(tmp_path), max_concurrent=1)
+
+        async with admission.verification_slot():
+            with pytest.raises(AdmissionRejectedError):
+                async with admission.verification_slot():
+                    pass
+        async with admission.verification_slot():
+            pass
+
+        assert admission.stats()["rejected_concurrency"] == 1
+
+    @pytest.mark.asyncio
+    async def test_disabled(self, tmp_path):
+        admission = LoginAdmission(str(tmp_path), max_concurrent=1)
+
+        with patch("app.core.admission.settings.admission_control_enabled", False), \
+                patch("app.core.admission.settings.login_ip_burst", 0):
+            await admission.admit("login", "1.1.1.1")
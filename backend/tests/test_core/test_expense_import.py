@@ -0,0 +1,43 @@
+import pytest
+
+from app.core.expense_import import ImportRow, iter_csv, iter_ndjson
+
+
+async def _chunks(data: bytes, size: int):
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+
+async def _rows(parser, text: str, size: int = 3) -> list[ImportRow]:
+    return [row async for row in parser(_chunks(text.encode(), size))]
+
+
+class TestExpenseImportParsing:
+    """Test cases for streaming CSV and NDJSON parsing."""
+
+    @pytest.mark.asyncio
+    async def test_csv_rows_survive_any_chunking(self):
+        text = 'amount,description,category\r\n12.50,"Café, ""late""\nnight",\r\n\r\n3,Taxi,Travel'
+
+        for size in (1, 2, 5, 1000):
+            assert await _rows(iter_csv, text, size) == [
+                ImportRow(2, {"amount": "12.50", "description": 'Café, "late"\nnight'}),
+                ImportRow(5, {"amount": "3", "description": "Taxi", "category": "Travel"}),
+            ]
+
+    @pytest.mark.asyncio
+    async def test_csv_reports_malformed_rows(self):
+        rows = await _rows(iter_csv, 'amount,description\n1\n2,"open')
+
+        assert rows == [
+            ImportRow(2, None, "Expected 2 columns, got 1"),
+            ImportRow(3, None, "Unterminated quoted field"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_ndjson(self):
+        rows = await _rows(iter_ndjson, '{"amount": "1.00"}\n\n[1]\n{oops\n')
+
+        assert rows[0] == ImportRow(1, {"amount": "1.00"})
+        assert rows[1] == ImportRow(3, None, "Expected a JSON object")
+        assert rows[2].line == 4 and rows[2].error.startswith("Invalid JSON")
@@ -0,0 +1,48 @@
+import asyncio
+import threading
+import pytest
+
+from app.core.hashing import PasswordHashExecutor, HashingSaturatedError
+from app.core.security import get_password_hash_async, verify_password_async
+
+
+class TestPasswordHashExecutor:
+    """Test cases for the bounded password hashing executor."""
+
+    @pytest.mark.asyncio
+    async def test_runs_off_the_event_loop_thread(self):
+        executor = PasswordHashExecutor(workers=1, max_pending=4)
+        try:
+            thread_name = await executor.run(lambda: threading.current_thread().name)
+        finally:
+            executor.shutdown()
+
+        assert thread_name.startswith("password-hash")
+        stats = executor.stats()
+        assert stats["completed"] == 1
+        assert stats["pending"] == 0
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_saturated(self):
+        executor = PasswordHashExecutor(workers=1, max_pending=1)
+        release = threading.Event()
+        try:
+            blocked = asyncio.ensure_future(executor.run(release.wait))
+            await asyncio.sleep(0)
+            with pytest.raises(HashingSaturatedError):
+                await executor.run(lambda: None)
+            release.set()
+            await blocked
+        finally:
+            release.set()
+            executor.shutdown()
+
+        assert executor.stats()["rejected"] == 1
+        assert executor.stats()["completed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_async_wrappers_round_trip(self):
+        hashed = await get_password_hash_async("testpassword123")
+
+        assert await verify_password_async("testpassword123", hashed)
+        assert not await verify_password_async("wrongpassword", hashed)
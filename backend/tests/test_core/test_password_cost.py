@@ -0,0 +1,99 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from passlib.hash import bcrypt
+
+from app.core import security
+from app.core.security import calibrate_bcrypt_rounds, configure_bcrypt_rounds, verify_and_update_password_async
+from app.models.user import User
+from app.schemas.user import UserLogin
+from app.services.user_service import UserService
+
+
+@pytest.fixture
+def restore_pwd_context():
+    original = security.pwd_context.to_dict()
+    yield
+    security.pwd_context.load(original)
+
+
+def _fake_clock(step_ms: float):
+    ticks = iter(range(100))
+    return lambda: next(ticks) * step_ms / 2 / 1000
+
+
+class TestBcryptCalibration:
+    """Test cases for bcrypt cost calibration."""
+
+    def test_picks_rounds_closest_to_target(self):
+        # Every hash measures 10ms at min_rounds=4, so 80ms needs 3 doublings
+        with patch("app.core.security.bcrypt.using", return_value=MagicMock()), \
+                patch("app.core.security.time.perf_counter", _fake_clock(20)):
+            assert calibrate_bcrypt_rounds(target_ms=80, min_rounds=4, max_rounds=12) == 7
+
+    def test_clamps_to_policy_bounds(self):
+        with patch("app.core.security.bcrypt.using", return_value=MagicMock()), \
+                patch("app.core.security.time.perf_counter", _fake_clock(20)):
+            assert calibrate_bcrypt_rounds(target_ms=1, min_rounds=10, max_rounds=12) == 10
+        with patch("app.core.security.bcrypt.using", return_value=MagicMock()), \
+                patch("app.core.security.time.perf_counter", _fake_clock(20)):
+            assert calibrate_bcrypt_rounds(target_ms=10_000, min_rounds=4, max_rounds=8) == 8
+
+
+class TestRehashOnLogin:
+    """Test cases for converging stored hashes to the configured cost."""
+
+    @pytest.mark.asyncio
+    async def test_outdated_cost_returns_new_hash(self, restore_pwd_context):
+        configure_bcrypt_rounds(5)
+        old_hash = bcrypt.using(rounds=4).hash("password123")
+
+        valid, new_hash = await verify_and_update_password_async("password123", old_hash)
+
+        assert valid
+        assert bcrypt.from_string(new_hash).rounds == 5
+
+    @pytest.mark.asyncio
+    async def test_costs_within_policy_are_kept(self, restore_pwd_context):
+        # Another worker may have calibrated to a different cost
+        configure_bcrypt_rounds(6, min_rounds=5)
+
+        for rounds in (5, 7):
+            stored = bcrypt.using(rounds=rounds).hash("password123")
+            valid, new_hash = await verify_and_update_password_async("password123", stored)
+            assert valid
+            assert new_hash is None
+
+        valid, new_hash = await verify_and_update_password_async("password123", bcrypt.using(rounds=4).hash("password123"))
+        assert bcrypt.from_string(new_hash).rounds == 6
+
+    @pytest.mark.asyncio
+    async def test_authenticate_user_stores_rehashed_password(self, restore_pwd_context):
+        configure_bcrypt_rounds(5)
+        mock_session = AsyncMock()
+        mock_repo = AsyncMock()
+        user = User(id=1, email="test@example.com", hashed_password=bcrypt.using(rounds=4).hash("password123"))
+        mock_repo.get_by_email.return_value = user
+
+        with patch('app.services.user_service.UserRepository', return_value=mock_repo), \
+                patch('app.services.user_service.RefreshTokenRepository', return_value=AsyncMock()):
+            service = UserService(mock_session)
+            token = await service.authenticate_user(UserLogin(email="test@example.com", password="password123"))
+
+        assert token is not None
+        mock_repo.update_password_hash.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_current_cost_is_not_rehashed(self, restore_pwd_context):
+        configure_bcrypt_rounds(4)
+        mock_session = AsyncMock()
+        mock_repo = AsyncMock()
+        user = User(id=1, email="test@example.com", hashed_password=bcrypt.using(rounds=4).hash("password123"))
+        mock_repo.get_by_email.return_value = user
+
+        with patch('app.services.user_service.UserRepository', return_value=mock_repo), \
+                patch('app.services.user_service.RefreshTokenRepository', return_value=AsyncMock()):
+            service = UserService(mock_session)
+            token = await service.authenticate_user(UserLogin(email="test@example.com", password="password123"))
+
+        assert token is not None
+        mock_repo.update_password_hash.assert_not_awaited()
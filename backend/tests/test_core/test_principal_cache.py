@@ -0,0 +1,144 @@
+import pytest
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.api.deps import get_current_user
+from app.core.cache import TTLCache
+from app.core.principal_cache import principal_cache, invalidate_principal
+from app.core.security import create_access_token
+from app.db.session import Base
+from app.models.user import User
+
+
+@pytest.fixture(autouse=True)
+def clear_principal_cache():
+    principal_cache.clear()
+    yield
+    principal_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def no_revocations():
+    with patch("app.api.deps.revocation_list.is_revoked", AsyncMock(return_value=False)):
+        yield
+
+
+def _credentials(user_id: int) -> HTTPAuthorizationCredentials:
+    token = create_access_token(data={"sub": str(user_id)})
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+def _user() -> User:
+    return User(
+        id=1,
+        email="test@example.com",
+        full_name="Test User",
+        hashed_password="hashed_password",
+        created_at=datetime.now(),
+        updated_at=datetime.now()
+    )
+
+
+class TestTTLCache:
+    """Test cases for the in-process TTL/LRU cache."""
+
+    def test_get_set_counts_hits_and_misses(self):
+        cache = TTLCache(max_size=10, ttl_seconds=60)
+        assert cache.get("a") is None
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_expired_entries_are_dropped(self):
+        cache = TTLCache(max_size=10, ttl_seconds=60)
+        with patch("app.core.cache.time.monotonic", side_effect=[0.0, 120.0]):
+            cache.set("a", 1)
+            assert cache.get("a") is None
+
+    def test_evicts_least_recently_used(self):
+        cache = TTLCache(max_size=2, ttl_seconds=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.stats()["evictions"] == 1
+
+
+class TestPrincipalCache:
+    """Test cases for serving get_current_user from the principal cache."""
+
+    @pytest.mark.asyncio
+    async def test_second_lookup_skips_the_repository(self):
+        mock_session = AsyncMock()
+        mock_session.merge.side_effect = lambda user, load: user
+        get_by_id = AsyncMock(return_value=_user())
+
+        with patch("app.api.deps.UserRepository.get_by_id", get_by_id):
+            first = await get_current_user(_credentials(1), mock_session)
+            second = await get_current_user(_credentials(1), mock_session)
+
+        get_by_id.assert_awaited_once_with(1)
+        assert second.id == first.id
+        assert second.email == "test@example.com"
+
+    @pytest.mark.asyncio
+    async def test_snapshot_excludes_password_hash(self):
+        mock_session = AsyncMock()
+        get_by_id = AsyncMock(return_value=_user())
+
+        with patch("app.api.deps.UserRepository.get_by_id", get_by_id):
+            await get_current_user(_credentials(1), mock_session)
+
+        assert "hashed_password" not in principal_cache.get(1)
+
+    @pytest.mark.asyncio
+    async def test_invalidate_forces_reload(self):
+        mock_session = AsyncMock()
+        mock_session.merge.side_effect = lambda user, load: user
+        get_by_id = AsyncMock(return_value=_user())
+
+        with patch("app.api.deps.UserRepository.get_by_id", get_by_id):
+            await get_current_user(_credentials(1), mock_session)
+            await get_current_user(_credentials(1), mock_session)
+            invalidate_principal(1)
+            await get_current_user(_credentials(1), mock_session)
+
+        assert get_by_id.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_disabled_cache_always_queries(self):
+        mock_session = AsyncMock()
+        get_by_id = AsyncMock(return_value=_user())
+
+        with patch("app.core.principal_cache.settings.principal_cache_enabled", False), \
+                patch("app.api.deps.UserRepository.get_by_id", get_by_id):
+            await get_current_user(_credentials(1), mock_session)
+            await get_current_user(_credentials(1), mock_session)
+
+        assert get_by_id.await_count == 2
+        assert len(principal_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_read_connection_is_released_once_authenticated(self, tmp_path):
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'auth.sqlite3'}", poolclass=AsyncAdaptedQueuePool)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            await conn.execute(User.__table__.insert(), [{"id": 1, "email": "test@example.com", "hashed_password": "x"}])
+        sessions = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+
+        try:
+            for _ in range(2):  # from the database, then from the cache
+                async with sessions() as session:
+                    user = await get_current_user(_credentials(1), session)
+
+                    assert not session.in_transaction()
+                    assert engine.pool.checkedout() == 0
+                    assert user.email == "test@example.com"
+        finally:
+            await engine.dispose()
@@ -0,0 +1,92 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.core.read_cache import LocalCacheBackend, VersionedCache
+
+
+def _cache(stale_seconds: float = 0.0, max_size: int = 100) -> VersionedCache:
+    return VersionedCache(LocalCacheBackend(max_size=max_size, ttl_seconds=60), stale_seconds=stale_seconds)
+
+
+class TestVersionedCache:
+    """Test cases for the versioned read cache."""
+
+    @pytest.mark.asyncio
+    async def test_same_version_is_served_from_cache(self):
+        cache = _cache()
+        compute = AsyncMock(return_value="v1")
+
+        assert await cache.get_or_compute("key", 1, compute) == (1, "v1")
+        assert await cache.get_or_compute("key", 1, compute) == (1, "v1")
+
+        compute.assert_awaited_once()
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_newer_version_recomputes(self):
+        cache = _cache()
+        await cache.get_or_compute("key", 1, AsyncMock(return_value="v1"))
+
+        assert await cache.get_or_compute("key", 2, AsyncMock(return_value="v2")) == (2, "v2")
+        assert await cache.get_or_compute("key", 2, AsyncMock(return_value="unused")) == (2, "v2")
+
+    @pytest.mark.asyncio
+    async def test_stale_value_is_served_while_revalidating(self):
+        cache = _cache(stale_seconds=30)
+        await cache.get_or_compute("key", 1, AsyncMock(return_value="v1"))
+        compute = AsyncMock(return_value="inline")
+        revalidate = AsyncMock(return_value="v2")
+
+        # The stale value is reported with its own version
+        assert await cache.get_or_compute("key", 2, compute, revalidate) == (1, "v1")
+        assert await cache.get_or_compute("key", 2, compute, revalidate) == (1, "v1")
+        await asyncio.sleep(0)
+
+        assert await cache.get_or_compute("key", 2, compute, revalidate) == (2, "v2")
+        compute.assert_not_awaited()
+        revalidate.assert_awaited_once()
+        assert cache.stats()["stale_hits"] == 2
+
+    @pytest.mark.asyncio
+    async def test_stale_window_expires(self):
+        cache = _cache(stale_seconds=5)
+        await cache.get_or_compute("key", 1, AsyncMock(return_value="v1"))
+        revalidate = AsyncMock(side_effect=RuntimeError("database went away"))
+
+        with patch("app.core.read_cache.time.monotonic", return_value=100.0):
+            assert await cache.get_or_compute("key", 2, AsyncMock(), revalidate) == (1, "v1")
+            await asyncio.sleep(0)
+        with patch("app.core.read_cache.time.monotonic", return_value=106.0):
+            assert await cache.get_or_compute("key", 2, AsyncMock(return_value="v2"), revalidate) == (2, "v2")
+
+        assert cache.stats()["revalidation_errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_no_stale_values_without_revalidate(self):
+        cache = _cache(stale_seconds=30)
+        await cache.get_or_compute("key", 1, AsyncMock(return_value="v1"))
+
+        assert await cache.get_or_compute("key", 2, AsyncMock(return_value="v2")) == (2, "v2")
+
+    @pytest.mark.asyncio
+    async def test_size_is_bounded(self):
+        cache = _cache(max_size=2)
+        for key in ("a", "b", "c"):
+            await cache.get_or_compute(key, 1, AsyncMock(return_value=key))
+
+        stats = cache.stats()
+        assert stats["size"] == 2
+        assert stats["evictions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_disabled_cache_always_computes(self):
+        cache = _cache()
+        cache.enabled = False
+        compute = AsyncMock(return_value="v1")
+
+        await cache.get_or_compute("key", 1, compute)
+        await cache.get_or_compute("key", 1, compute)
+
+        assert compute.await_count == 2
@@ -0,0 +1,119 @@
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.core.bloom import BloomFilter
+from app.core.revocation import RevocationList
+
+
+def _revocation_list() -> RevocationList:
+    return RevocationList(capacity=100, error_rate=0.01, refresh_seconds=60, confirmed_size=10)
+
+
+class TestBloomFilter:
+    """Test cases for the Bloom filter."""
+
+    def test_members_are_always_found(self):
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        for i in range(1000):
+            bloom.add(f"jti-{i}")
+
+        assert all(f"jti-{i}" in bloom for i in range(1000))
+
+    def test_false_positive_rate_is_near_target(self):
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        for i in range(1000):
+            bloom.add(f"jti-{i}")
+
+        false_positives = sum(f"other-{i}" in bloom for i in range(10_000))
+        assert false_positives / 10_000 < 0.03
+        assert bloom.stats()["count"] == 1000
+
+
+class TestRevocationList:
+    """Test cases for the in-memory revocation mirror."""
+
+    @pytest.mark.asyncio
+    async def test_unrevoked_token_does_not_touch_storage(self):
+        revocations = _revocation_list()
+        mock_repo = AsyncMock()
+        mock_repo.get_since.return_value = [(1, "revoked-jti")]
+
+        with patch("app.core.revocation.RevokedTokenRepository", return_value=mock_repo):
+            assert not await revocations.is_revoked(AsyncMock(), "live-jti")
+            assert not await revocations.is_revoked(AsyncMock(), "other-live-jti")
+
+        mock_repo.exists.assert_not_awaited()
+        mock_repo.get_since.assert_awaited_once_with(0, 10_000)
+        assert revocations.last_id == 1
+
+    @pytest.mark.asyncio
+    async def test_probable_hit_is_confirmed_once(self):
+        revocations = _revocation_list()
+        mock_repo = AsyncMock()
+        mock_repo.get_since.return_value = [(1, "revoked-jti")]
+        mock_repo.exists.return_value = True
+
+        with patch("app.core.revocation.RevokedTokenRepository", return_value=mock_repo):
+            assert await revocations.is_revoked(AsyncMock(), "revoked-jti")
+            assert await revocations.is_revoked(AsyncMock(), "revoked-jti")
+
+        mock_repo.exists.assert_awaited_once_with("revoked-jti")
+
+    @pytest.mark.asyncio
+    async def test_refresh_pulls_incrementally(self):
+        revocations = _revocation_list()
+        revocations.refresh_seconds = 0
+        mock_repo = AsyncMock()
+        mock_repo.get_since.side_effect = [[(1, "a"), (2, "b")], [(3, "c")]]
+
+        with patch("app.core.revocation.RevokedTokenRepository", return_value=mock_repo):
+            await revocations.refresh(AsyncMock())
+            await revocations.refresh(AsyncMock())
+
+        assert [call.args[0] for call in mock_repo.get_since.await_args_list] == [0, 2]
+        assert "c" in revocations.bloom
+
+    @pytest.mark.asyncio
+    async def test_full_filter_is_rebuilt_from_unexpired_rows(self):
+        revocations = RevocationList(capacity=4, error_rate=0.01, refresh_seconds=0, confirmed_size=10)
+        table = {1: "a", 2: "b", 3: "c", 4: "d"}
+        mock_repo = AsyncMock()
+        mock_repo.get_since.side_effect = lambda last_id, limit: [
+            (row_id, jti) for row_id, jti in sorted(table.items()) if row_id > last_id
+        ][:limit]
+
+        with patch("app.core.revocation.RevokedTokenRepository", return_value=mock_repo):
+            await revocations.refresh(AsyncMock(), batch_size=2)
+            # a and b expire, e and f are revoked: the filter is full on e
+            del table[1], table[2]
+            table.update({5: "e", 6: "f"})
+            await revocations.refresh(AsyncMock(), batch_size=2)
+
+        assert all(jti in revocations.bloom for jti in "cdef")
+        assert revocations.bloom.capacity == 4
+        assert revocations.bloom.count == 4
+        assert revocations.last_id == 6
+
+    @pytest.mark.asyncio
+    async def test_filter_grows_when_unexpired_rows_overflow_it(self):
+        revocations = RevocationList(capacity=2, error_rate=0.01, refresh_seconds=0, confirmed_size=10)
+        table = {row_id: f"jti-{row_id}" for row_id in range(1, 6)}
+        mock_repo = AsyncMock()
+        mock_repo.get_since.side_effect = lambda last_id, limit: [
+            (row_id, jti) for row_id, jti in sorted(table.items()) if row_id > last_id
+        ][:limit]
+
+        with patch("app.core.revocation.RevokedTokenRepository", return_value=mock_repo):
+            await revocations.refresh(AsyncMock())
+
+        assert all(jti in revocations.bloom for jti in table.values())
+        assert revocations.bloom.capacity == 8
+        assert revocations.bloom.count == 5
+        assert revocations.last_id == 5
+
+    def test_record_applies_locally(self):
+        revocations = _revocation_list()
+        revocations.record("jti")
+
+        assert "jti" in revocations.bloom
+        assert revocations.confirmed.get("jti")
@@ -0,0 +1,61 @@
+import random
+import pytest
+from collections import defaultdict
+from decimal import Decimal
+
+from app.core.settlement import net_balances_in_cents, simplify_debts
+
+
+def _apply(net_cents, transfers):
+    remaining = defaultdict(int, net_cents)
+    for debtor, creditor, cents in transfers:
+        assert cents > 0
+        remaining[debtor] += cents
+        remaining[creditor] -= cents
+    return remaining
+
+
+class TestSimplifyDebts:
+    """Test cases for the greedy settle-up matcher."""
+
+    def test_largest_debtor_pays_largest_creditor(self):
+        transfers = simplify_debts({1: 5000, 2: 1000, 3: -4000, 4: -2000})
+
+        assert transfers == [(3, 1, 4000), (4, 1, 1000), (4, 2, 1000)]
+
+    def test_everyone_square_needs_no_transfers(self):
+        assert simplify_debts({1: 0, 2: 0}) == []
+
+    def test_unbalanced_input_is_rejected(self):
+        with pytest.raises(ValueError, match="do not sum to zero"):
+            simplify_debts({1: 100, 2: -99})
+
+    def test_random_groups_settle_in_fewer_than_n_transfers(self):
+        rng = random.Random(0)
+        for size in (2, 3, 10, 250):
+            net_cents = {user_id: rng.randint(-50000, 50000) for user_id in range(1, size)}
+            net_cents[size] = -sum(net_cents.values())
+
+            transfers = simplify_debts(net_cents)
+
+            assert len(transfers) <= size - 1
+            assert all(cents == 0 for cents in _apply(net_cents, transfers).values())
+
+
+class TestNetBalancesInCents:
+    """Test cases for converting ledger balances to whole cents."""
+
+    def test_rounds_to_nearest_cent_without_losing_one(self):
+        # 10.00 paid by member 1 and split three ways: shares of 3.3333
+        net = {1: Decimal("6.6667"), 2: Decimal("-3.3333"), 3: Decimal("-3.3333")}
+
+        # Ties on the remainder go to the lowest user id; one debtor owes the odd cent
+        assert net_balances_in_cents(net) == {1: 667, 2: -333, 3: -334}
+
+    def test_result_always_sums_to_zero(self):
+        # 1.00 split 300 ways: the rounded shares lose a whole cent
+        share = (Decimal("1.00") / 300).quantize(Decimal("0.0001"))
+        net = {user_id: -share for user_id in range(2, 301)}
+        net[1] = Decimal("1.00") - share
+
+        assert sum(net_balances_in_cents(net).values()) == 0
@@ -0,0 +1,36 @@
+import pytest
+from decimal import Decimal
+
+from app.core.splits import amount_to_cents, split_by_weight, split_equal, split_exact
+
+
+class TestSplits:
+    """Test cases for splitting an expense into whole-cent shares."""
+
+    def test_equal_split_hands_leftover_cents_to_lowest_ids(self):
+        assert split_equal(1000, [3, 1, 2]) == {1: 334, 2: 333, 3: 333}
+
+    def test_weighted_split_follows_largest_remainders(self):
+        shares = split_by_weight(1000, {1: Decimal("1"), 2: Decimal("1.5"), 3: Decimal("2.5")})
+
+        assert shares == {1: 200, 2: 300, 3: 500}
+        assert sum(split_by_weight(101, {1: Decimal("1"), 2: Decimal("1"), 3: Decimal("1")}).values()) == 101
+
+    def test_large_subset_adds_up(self):
+        shares = split_equal(123457, range(1, 201))
+
+        assert sum(shares.values()) == 123457
+        assert set(shares.values()) == {617, 618}
+
+    def test_exact_split_must_add_up(self):
+        assert split_exact(500, {1: Decimal("2.50"), 2: Decimal("2.50")}) == {1: 250, 2: 250}
+        with pytest.raises(ValueError, match="add up"):
+            split_exact(500, {1: Decimal("2.50")})
+
+    def test_fractional_cents_are_rejected(self):
+        with pytest.raises(ValueError, match="whole cents"):
+            amount_to_cents(Decimal("1.005"))
+
+    def test_empty_split_is_rejected(self):
+        with pytest.raises(ValueError, match="at least one member"):
+            split_equal(100, [])
@@ -0,0 +1,56 @@
+import pytest
+from datetime import timedelta
+from unittest.mock import patch
+from fastapi import HTTPException
+
+from app.core import security
+from app.core.security import create_access_token, verify_token, verified_token_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    verified_token_cache.clear()
+    yield
+    verified_token_cache.clear()
+
+
+class TestVerifiedTokenCache:
+    """Test cases for the verified-token cache in verify_token."""
+
+    def test_repeat_verification_skips_decode(self):
+        token = create_access_token({"sub": "123"})
+        verify_token(token)
+
+        with patch("app.core.security.jwt.decode") as decode:
+            payload = verify_token(token)
+
+        decode.assert_not_called()
+        assert payload["sub"] == "123"
+
+    def test_cached_payload_is_a_copy(self):
+        token = create_access_token({"sub": "123"})
+        verify_token(token)["sub"] = "tampered"
+
+        assert verify_token(token)["sub"] == "123"
+
+    def test_invalid_tokens_are_not_cached(self):
+        with pytest.raises(HTTPException):
+            verify_token("invalid_token")
+
+        assert len(verified_token_cache) == 0
+
+    def test_expired_tokens_are_not_cached(self):
+        token = create_access_token({"sub": "123"}, expires_delta=timedelta(seconds=-1))
+
+        with pytest.raises(HTTPException):
+            verify_token(token)
+        assert len(verified_token_cache) == 0
+
+    def test_disabled_cache_always_decodes(self):
+        token = create_access_token({"sub": "123"})
+
+        with patch.object(security.settings, "token_cache_enabled", False):
+            verify_token(token)
+            verify_token(token)
+
+        assert len(verified_token_cache) == 0
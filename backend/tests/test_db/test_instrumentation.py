@@ -0,0 +1,75 @@
+import logging
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.db.instrumentation import current_query_stats, instrument_queries, track_queries
+
+
+@pytest_asyncio.fixture
+async def make_engine(tmp_path):
+    engines = []
+
+    def factory(slow_query_threshold_ms: float):
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / f'q{len(engines)}.sqlite3'}")
+        instrument_queries(engine, slow_query_threshold_ms)
+        engines.append(engine)
+        return engine
+
+    yield factory
+    for engine in engines:
+        await engine.dispose()
+
+
+class TestQueryInstrumentation:
+    """Test cases for per-request SQL statement accounting."""
+
+    @pytest.mark.asyncio
+    async def test_counts_statements_in_tracked_context(self, make_engine):
+        engine = make_engine(slow_query_threshold_ms=10_000)
+
+        with track_queries("GET /things") as stats:
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+                await conn.execute(text("SELECT 2"))
+
+        assert stats.count == 2
+        assert stats.total_ms > 0
+        assert current_query_stats() is None
+
+    @pytest.mark.asyncio
+    async def test_untracked_statements_are_not_counted(self, make_engine):
+        engine = make_engine(slow_query_threshold_ms=10_000)
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+        with track_queries() as stats:
+            pass
+
+        assert stats.count == 0
+
+    @pytest.mark.asyncio
+    async def test_logs_slow_statements_with_route(self, make_engine, caplog):
+        engine = make_engine(slow_query_threshold_ms=0)
+
+        with caplog.at_level(logging.WARNING, logger="app.db.slow_query"):
+            with track_queries("POST /groups/"):
+                async with engine.connect() as conn:
+                    await conn.execute(text("SELECT   1"))
+
+        assert len(caplog.records) == 1
+        assert "POST /groups/" in caplog.records[0].getMessage()
+        assert "SELECT 1" in caplog.records[0].getMessage()
+
+    @pytest.mark.asyncio
+    async def test_failed_statement_does_not_break_timing(self, make_engine):
+        engine = make_engine(slow_query_threshold_ms=10_000)
+
+        with track_queries() as stats:
+            async with engine.connect() as conn:
+                with pytest.raises(Exception):
+                    await conn.execute(text("SELECT * FROM missing_table"))
+                await conn.execute(text("SELECT 1"))
+
+        assert stats.count == 1
@@ -0,0 +1,49 @@
+import pytest
+import pytest_asyncio
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.db.pool import InstrumentedAsyncAdaptedQueuePool, instrument_engine, pool_status
+
+
+@pytest_asyncio.fixture
+async def pooled_engine(tmp_path):
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.sqlite3'}",
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        pool_size=1,
+        max_overflow=1,
+        pool_timeout=0.05,
+        pool_pre_ping=True,
+    )
+    instrument_engine(engine)
+    yield engine
+    await engine.dispose()
+
+
+class TestInstrumentedPool:
+    """Test cases for connection pool telemetry."""
+
+    @pytest.mark.asyncio
+    async def test_reports_checked_out_and_overflow(self, pooled_engine):
+        async with pooled_engine.connect() as first, pooled_engine.connect() as second:
+            await first.execute(text("SELECT 1"))
+            await second.execute(text("SELECT 1"))
+            status = pool_status(pooled_engine)
+
+        assert status["checked_out"] == 2
+        assert status["overflow_in_use"] == 1
+        assert status["checkouts"] == 2
+        assert status["connects"] == 2
+        assert pool_status(pooled_engine)["checked_out"] == 0
+
+    @pytest.mark.asyncio
+    async def test_counts_checkout_timeouts(self, pooled_engine):
+        async with pooled_engine.connect(), pooled_engine.connect():
+            with pytest.raises(exc.TimeoutError):
+                async with pooled_engine.connect():
+                    pass
+
+        status = pool_status(pooled_engine)
+        assert status["checkout_timeouts"] == 1
+        assert status["wait_max_ms"] >= 50
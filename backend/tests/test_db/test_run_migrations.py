@@ -0,0 +1,131 @@
+import asyncio
+import pytest
+from datetime import datetime
+from unittest.mock import patch
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, MetaData, Numeric, String, Table, Text, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.migration import MigrationContext
+
+import app.models  # noqa: F401
+import run_migrations
+from app.db.session import Base
+
+# The models as they were when the old bootstrap ran Base.metadata.create_all;
+# frozen here because the live models have moved on since
+baseline = MetaData()
+Table(
+    "users", baseline,
+    Column("id", Integer, primary_key=True, index=True, autoincrement=True),
+    Column("email", String(255), unique=True, index=True, nullable=False),
+    Column("full_name", String(255), nullable=True),
+    Column("hashed_password", String(255), nullable=False),
+    Column("created_at", DateTime, default=datetime.utcnow, nullable=False),
+    Column("updated_at", DateTime, default=datetime.utcnow, nullable=False),
+)
+Table(
+    "groups", baseline,
+    Column("id", Integer, primary_key=True, index=True, autoincrement=True),
+    Column("name", String(255), nullable=False),
+    Column("description", String(500), nullable=True),
+    Column("created_by_user_id", Integer, ForeignKey("users.id"), nullable=False),
+    Column("created_at", DateTime, default=datetime.utcnow, nullable=False),
+    Column("updated_at", DateTime, default=datetime.utcnow, nullable=False),
+)
+Table(
+    "group_members", baseline,
+    Column("id", Integer, primary_key=True, index=True, autoincrement=True),
+    Column("group_id", Integer, ForeignKey("groups.id"), nullable=False),
+    Column("user_id", Integer, ForeignKey("users.id"), nullable=False),
+    Column("joined_at", DateTime, default=datetime.utcnow, nullable=False),
+)
+Table(
+    "expenses", baseline,
+    Column("id", Integer, primary_key=True, index=True, autoincrement=True),
+    Column("group_id", Integer, ForeignKey("groups.id"), nullable=False),
+    Column("paid_by_user_id", Integer, ForeignKey("users.id"), nullable=False),
+    Column("amount", Numeric(10, 2), nullable=False),
+    Column("description", String(500), nullable=True),
+    Column("category", String(100), nullable=True),
+    Column("expense_metadata", Text, nullable=True),
+    Column("created_at", DateTime, default=datetime.utcnow, nullable=False),
+    Column("updated_at", DateTime, default=datetime.utcnow, nullable=False),
+)
+
+
+@pytest.fixture
+def database_url(tmp_path, monkeypatch):
+    url = f"sqlite+aiosqlite:///{tmp_path / 'migrations.sqlite3'}"
+    monkeypatch.setenv("DATABASE_URL", url)
+    # alembic/env.py would otherwise reconfigure (and disable) the test loggers
+    with patch("logging.config.fileConfig"):
+        yield url
+
+
+def _run(coro_factory, url):
+    async def run():
+        engine = create_async_engine(url)
+        try:
+            async with engine.begin() as conn:
+                return await coro_factory(conn)
+        finally:
+            await engine.dispose()
+    return asyncio.run(run())
+
+
+def _version(url):
+    async def query(conn):
+        return await conn.scalar(text("SELECT version_num FROM alembic_version"))
+    return _run(query, url)
+
+
+class TestRunMigrations:
+    """Test cases for the startup migration step."""
+
+    def test_upgrades_empty_database_to_head(self, database_url):
+        run_migrations.main([])
+
+        assert _version(database_url) == run_migrations.head_revision(run_migrations.alembic_config())
+
+    def test_skips_upgrade_when_already_at_head(self, database_url):
+        run_migrations.main([])
+
+        with patch("run_migrations.command") as command:
+            run_migrations.main([])
+
+        command.upgrade.assert_not_called()
+        command.stamp.assert_not_called()
+
+    def test_stamps_create_all_schema_before_upgrading(self, database_url):
+        async def create_all(conn):
+            await conn.run_sync(baseline.create_all)
+        _run(create_all, database_url)
+
+        run_migrations.main([])
+
+        assert _version(database_url) == run_migrations.head_revision(run_migrations.alembic_config())
+        async def schema_diff(conn):
+            return await conn.run_sync(
+                lambda sync_conn: compare_metadata(MigrationContext.configure(sync_conn), Base.metadata)
+            )
+        assert _run(schema_diff, database_url) == []
+
+    def test_baseline_revision_matches_create_all_schema(self, database_url):
+        command.upgrade(run_migrations.alembic_config(), run_migrations.BASELINE_REVISION)
+
+        # Anything but the version table differing here would be missing after a stamp
+        async def schema_diff(conn):
+            return await conn.run_sync(
+                lambda sync_conn: compare_metadata(MigrationContext.configure(sync_conn), baseline)
+            )
+        assert _run(schema_diff, database_url) == []
+
+    def test_sql_mode_prints_ddl_without_touching_database(self, database_url, capsys):
+        run_migrations.main(["--sql", "--from", run_migrations.BASELINE_REVISION])
+
+        assert "CREATE INDEX" in capsys.readouterr().out
+        async def has_version_table(conn):
+            return await conn.scalar(text("SELECT count(*) FROM sqlite_master WHERE name = 'alembic_version'"))
+        assert _run(has_version_table, database_url) == 0
@@ -0,0 +1,88 @@
+import pytest
+import pytest_asyncio
+from unittest.mock import patch
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+import app.models  # noqa: F401 - register tables on Base.metadata
+from app.db.session import Base, get_db_session, on_commit
+from app.models.group import Group, GroupMember
+from app.models.user import User
+from app.schemas.group import GroupCreate
+from app.services.group_service import GroupService
+
+
+@pytest_asyncio.fixture
+async def session_factory(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'uow.sqlite3'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+    with patch('app.db.session.SessionLocal', factory):
+        yield factory
+    await engine.dispose()
+
+
+async def _count(factory, model) -> int:
+    async with factory() as session:
+        return await session.scalar(select(func.count()).select_from(model))
+
+
+def _user() -> User:
+    return User(email="test@example.com", full_name="Test User", hashed_password="hashed")
+
+
+class TestUnitOfWork:
+    """Test cases for the request-scoped session dependency."""
+
+    @pytest.mark.asyncio
+    async def test_commits_once_when_request_succeeds(self, session_factory):
+        callbacks = []
+        sessions = get_db_session()
+        session = await sessions.__anext__()
+        session.add(_user())
+        await session.flush()
+        on_commit(session, lambda: callbacks.append("committed"))
+
+        assert callbacks == []
+        with pytest.raises(StopAsyncIteration):
+            await sessions.__anext__()
+
+        assert callbacks == ["committed"]
+        assert await _count(session_factory, User) == 1
+
+    @pytest.mark.asyncio
+    async def test_rolls_back_when_request_raises(self, session_factory):
+        callbacks = []
+        sessions = get_db_session()
+        session = await sessions.__anext__()
+        session.add(_user())
+        await session.flush()
+        on_commit(session, lambda: callbacks.append("committed"))
+
+        with pytest.raises(RuntimeError):
+            await sessions.athrow(RuntimeError("boom"))
+
+        assert callbacks == []
+        assert await _count(session_factory, User) == 0
+
+    @pytest.mark.asyncio
+    async def test_create_group_includes_creator_in_one_transaction(self, session_factory):
+        sessions = get_db_session()
+        session = await sessions.__anext__()
+        creator = _user()
+        session.add(creator)
+        await session.flush()
+
+        group = await GroupService(session).create_group(GroupCreate(name="Trip"), creator.id)
+
+        assert [member.user_id for member in group.members] == [creator.id]
+        assert group.members[0].user.email == "test@example.com"
+        # Nothing is visible to other connections before the request commits
+        assert await _count(session_factory, Group) == 0
+
+        with pytest.raises(StopAsyncIteration):
+            await sessions.__anext__()
+
+        assert await _count(session_factory, Group) == 1
+        assert await _count(session_factory, GroupMember) == 1
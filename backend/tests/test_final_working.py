@@ -9,6 +9,7 @@ from decimal import Decimal
 from datetime import datetime
 from httpx import AsyncClient, ASGITransport
 from app.main import create_app
+from app.core.config import get_settings
 from app.models.user import User
 from app.models.group import Group, GroupMember
 from app.models.expense import Expense
@@ -155,9 +156,10 @@ class TestGroupRepositoryFinal:
         assert result.name == "Test Group"
         assert result.description == "A test group"
         assert result.created_by_user_id == 1
+        assert [member.user_id for member in result.members] == [1]
         mock_session.add.assert_called_once()
         mock_session.flush.assert_called_once()
-        mock_session.refresh.assert_called_once()
+        mock_session.refresh.assert_not_called()
     
     @pytest.mark.asyncio
     async def test_get_by_id_existing_group(self):
@@ -325,7 +327,7 @@ class TestUserServiceFinal:
         assert result.full_name == "Test User"
         mock_repo.get_by_email.assert_called_once_with("test@example.com")
         mock_repo.create.assert_called_once()
-        mock_session.commit.assert_called_once()
+        mock_session.commit.assert_not_called()
     
     @pytest.mark.asyncio
     async def test_create_user_email_exists(self):
@@ -472,6 +474,15 @@ class TestAPIBasic:
         assert app.routes is not None
         assert len(app.routes) > 0
 
+    def test_internal_metrics_are_mounted_only_when_enabled(self):
+        """The metrics endpoint is unauthenticated and off by default."""
+        settings = get_settings()
+        assert not settings.internal_metrics_enabled
+        assert "/internal/metrics" not in [route.path for route in create_app().routes]
+
+        with patch.object(settings, "internal_metrics_enabled", True):
+            assert "/internal/metrics" in [route.path for route in create_app().routes]
+
 
 class TestSecurityFunctions:
     """Test security-related functions."""
@@ -1,6 +1,7 @@
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 from decimal import Decimal
+from sqlalchemy.dialects import postgresql
 from app.repositories.expense_repository import ExpenseRepository
 from app.schemas.expense import ExpenseCreate, ExpenseUpdate
 from app.models.expense import Expense
@@ -232,34 +233,59 @@ class TestExpenseRepositoryWorking:
     async def test_get_group_expense_summary(self):
         """Test getting expense summary for a group."""
         mock_session = AsyncMock()
+        mock_session.bind.dialect.name = "sqlite"
         
-        # Mock total result
-        mock_total_result = MagicMock()
-        mock_total_result.first.return_value = MagicMock(total_amount=Decimal("50.50"), expense_count=3)
+        # One row per (category, payer) pair
+        mock_result = MagicMock()
+        mock_result.all.return_value = [
+            MagicMock(category="Food", paid_by_user_id=1, full_name="Same Name", email="user1@example.com",
+                      amount=Decimal("25.50"), expense_count=2),
+            MagicMock(category="Food", paid_by_user_id=2, full_name="Same Name", email="user2@example.com",
+                      amount=Decimal("10.00"), expense_count=1),
+            MagicMock(category="Transport", paid_by_user_id=2, full_name="Same Name", email="user2@example.com",
+                      amount=Decimal("15.00"), expense_count=1),
+            MagicMock(category=None, paid_by_user_id=3, full_name=None, email="user3@example.com",
+                      amount=Decimal("5.00"), expense_count=1),
+        ]
+        mock_session.execute.return_value = mock_result
         
-        # Mock category result
-        mock_category_result = MagicMock()
-        mock_category_result.__iter__ = lambda self: iter([
-            MagicMock(category="Food", amount=Decimal("35.50")),
-            MagicMock(category="Transport", amount=Decimal("15.00"))
-        ])
+        repo = ExpenseRepository(mock_session)
+        result = await repo.get_group_expense_summary(1)
         
-        # Mock user result
-        mock_user_result = MagicMock()
-        mock_user_result.__iter__ = lambda self: iter([
-            MagicMock(user_name="User 1", user_email="user1@example.com", amount=Decimal("25.50")),
-            MagicMock(user_name="User 2", user_email="user2@example.com", amount=Decimal("25.00"))
-        ])
+        assert result["total_amount"] == Decimal("55.50")
+        assert result["expense_count"] == 5
+        assert result["by_category"] == {"Food": Decimal("35.50"), "Transport": Decimal("15.00")}
+        assert result["by_user"] == {"1": Decimal("25.50"), "2": Decimal("25.00"), "3": Decimal("5.00")}
+        assert result["user_names"] == {"1": "Same Name", "2": "Same Name", "3": "user3@example.com"}
+        mock_session.execute.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_get_group_expense_summary_postgres_grouping_sets(self):
+        """Test the PostgreSQL summary runs as one GROUPING SETS statement."""
+        mock_session = AsyncMock()
+        mock_session.bind.dialect.name = "postgresql"
         
-        # Set up execute to return different results for different calls
-        mock_session.execute.side_effect = [mock_total_result, mock_category_result, mock_user_result]
+        mock_result = MagicMock()
+        mock_result.all.return_value = [
+            MagicMock(category=None, paid_by_user_id=None, full_name=None, email=None,
+                      amount=Decimal("40.50"), expense_count=3, category_grouped=1, user_grouped=1),
+            MagicMock(category="Food", paid_by_user_id=None, full_name=None, email=None,
+                      amount=Decimal("35.50"), expense_count=2, category_grouped=0, user_grouped=1),
+            MagicMock(category=None, paid_by_user_id=None, full_name=None, email=None,
+                      amount=Decimal("5.00"), expense_count=1, category_grouped=0, user_grouped=1),
+            MagicMock(category=None, paid_by_user_id=1, full_name="User 1", email="user1@example.com",
+                      amount=Decimal("40.50"), expense_count=3, category_grouped=1, user_grouped=0),
+        ]
+        mock_session.execute.return_value = mock_result
         
         repo = ExpenseRepository(mock_session)
         result = await repo.get_group_expense_summary(1)
         
-        assert result["total_amount"] == Decimal("50.50")
+        statement = mock_session.execute.call_args[0][0]
+        assert "GROUPING SETS" in str(statement.compile(dialect=postgresql.dialect()))
+        assert result["total_amount"] == Decimal("40.50")
         assert result["expense_count"] == 3
-        assert result["by_category"]["Food"] == Decimal("35.50")
-        assert result["by_category"]["Transport"] == Decimal("15.00")
-        assert len(result["by_user"]) == 2
-        assert mock_session.execute.call_count == 3
+        assert result["by_category"] == {"Food": Decimal("35.50")}
+        assert result["by_user"] == {"1": Decimal("40.50")}
+        assert result["user_names"] == {"1": "User 1"}
+        mock_session.execute.assert_called_once()
@@ -30,9 +30,10 @@ class TestGroupRepositoryWorking:
         assert result.name == "Test Group"
         assert result.description == "A test group"
         assert result.created_by_user_id == 1
+        assert [member.user_id for member in result.members] == [1]
         mock_session.add.assert_called_once()
         mock_session.flush.assert_called_once()
-        mock_session.refresh.assert_called_once()
+        mock_session.refresh.assert_not_called()
     
     @pytest.mark.asyncio
     async def test_create_group_without_description(self):
@@ -0,0 +1,171 @@
+import pytest
+import pytest_asyncio
+from decimal import Decimal
+from pydantic import ValidationError
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+import app.models  # noqa: F401 - register tables on Base.metadata
+from app.db.session import Base
+from app.models.group_balance import GroupBalance
+from app.models.user import User
+from app.schemas.expense import ExpenseCreate, ExpenseUpdate, SplitShare
+from app.schemas.group import GroupCreate, GroupMemberCreate
+from app.services.balance_service import BalanceService
+from app.services.expense_service import ExpenseService
+from app.services.group_service import GroupService
+
+
+@pytest_asyncio.fixture
+async def session(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'ledger.sqlite3'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)() as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def users(session):
+    users = [User(email=f"user{i}@example.com", hashed_password="hashed") for i in range(3)]
+    session.add_all(users)
+    await session.flush()
+    return users
+
+
+@pytest_asyncio.fixture
+async def group(session, users):
+    group = await GroupService(session).create_group(GroupCreate(name="Trip"), users[0].id)
+    await GroupService(session).add_member(group.id, GroupMemberCreate(user_id=users[1].id), users[0].id)
+    return group
+
+
+def _create(group, amount):
+    return ExpenseCreate(group_id=group.id, amount=Decimal(amount))
+
+
+class TestBalanceLedger:
+    """Test cases for the incrementally maintained balance ledger."""
+
+    @pytest.mark.asyncio
+    async def test_service_writes_keep_ledger_in_step(self, session, users, group):
+        expenses = ExpenseService(session)
+        groups = GroupService(session)
+        first = await expenses.create_expense(_create(group, "10.00"), users[0].id)
+        await expenses.create_expense(_create(group, "20.01"), users[1].id)
+        await expenses.update_expense(first.id, ExpenseUpdate(amount=Decimal("12.50")), users[0].id)
+        await groups.add_member(group.id, GroupMemberCreate(user_id=users[2].id), users[0].id)
+        third = await expenses.create_expense(_create(group, "7.00"), users[2].id)
+        await groups.remove_member(group.id, users[2].id, users[2].id)
+        await expenses.create_expense(_create(group, "3.33"), users[1].id)
+        await expenses.delete_expense(third.id, users[2].id)
+
+        assert await BalanceService(session).find_drift() == []
+        summary = await expenses.get_group_balance_summary(group.id, users[0].id)
+        assert summary.total_expenses == Decimal("35.84")
+        # Shares: 6.25 + 10.01 + 1.67 and 6.25 + 10.00 + 1.66 (odd cents go to the lower user id)
+        assert summary.net_balances == {
+            str(users[0].id): Decimal("12.50") - Decimal("17.93"),
+            str(users[1].id): Decimal("23.34") - Decimal("17.91"),
+        }
+
+    @pytest.mark.asyncio
+    async def test_late_joiner_only_shares_later_expenses(self, session, users, group):
+        expenses = ExpenseService(session)
+        await expenses.create_expense(_create(group, "10.00"), users[0].id)
+        await GroupService(session).add_member(group.id, GroupMemberCreate(user_id=users[2].id), users[0].id)
+        await expenses.create_expense(_create(group, "9.00"), users[1].id)
+
+        ledger = await BalanceService(session).repo.get_ledger(group.id)
+
+        assert {user_id: share for (_, user_id), (_, share) in ledger.items()} == {
+            users[0].id: Decimal("8.00"),
+            users[1].id: Decimal("8.00"),
+            users[2].id: Decimal("3.00"),
+        }
+
+    @pytest.mark.asyncio
+    async def test_split_modes(self, session, users, group):
+        expenses = ExpenseService(session)
+        weighted = await expenses.create_expense(
+            ExpenseCreate(
+                group_id=group.id, amount=Decimal("10.00"), split_mode="weight",
+                splits=[SplitShare(user_id=users[0].id, weight=1), SplitShare(user_id=users[1].id, weight=2)],
+            ),
+            users[0].id,
+        )
+        exact = await expenses.create_expense(
+            ExpenseCreate(
+                group_id=group.id, amount=Decimal("10.00"), split_mode="exact",
+                splits=[SplitShare(user_id=users[0].id, amount=Decimal("9.99")), SplitShare(user_id=users[1].id, amount=Decimal("0.01"))],
+            ),
+            users[0].id,
+        )
+        subset = await expenses.create_expense(
+            ExpenseCreate(group_id=group.id, amount=Decimal("4.00"), splits=[SplitShare(user_id=users[1].id)]),
+            users[0].id,
+        )
+
+        assert await expenses.repo.get_splits(weighted.id) == {users[0].id: 333, users[1].id: 667}
+        assert await expenses.repo.get_splits(exact.id) == {users[0].id: 999, users[1].id: 1}
+        assert await expenses.repo.get_splits(subset.id) == {users[1].id: 400}
+
+        # Changing only the amount rescales the stored shares
+        await expenses.update_expense(weighted.id, ExpenseUpdate(amount=Decimal("20.00")), users[0].id)
+        assert await expenses.repo.get_splits(weighted.id) == {users[0].id: 666, users[1].id: 1334}
+        assert await BalanceService(session).find_drift() == []
+
+    @pytest.mark.asyncio
+    async def test_invalid_splits_are_rejected(self, session, users, group):
+        expenses = ExpenseService(session)
+
+        with pytest.raises(ValueError, match="members of the group"):
+            await expenses.create_expense(
+                ExpenseCreate(group_id=group.id, amount=Decimal("5.00"), splits=[SplitShare(user_id=users[2].id)]),
+                users[0].id,
+            )
+        with pytest.raises(ValueError, match="add up"):
+            await expenses.create_expense(
+                ExpenseCreate(
+                    group_id=group.id, amount=Decimal("5.00"), split_mode="exact",
+                    splits=[SplitShare(user_id=users[0].id, amount=Decimal("1.00"))],
+                ),
+                users[0].id,
+            )
+        with pytest.raises(ValidationError, match="needs a weight"):
+            ExpenseCreate(group_id=group.id, amount=Decimal("5.00"), split_mode="weight", splits=[SplitShare(user_id=1)])
+
+    @pytest.mark.asyncio
+    async def test_rebuild_repairs_drift(self, session, users, group):
+        await ExpenseService(session).create_expense(_create(group, "10.00"), users[0].id)
+        await session.execute(
+            update(GroupBalance)
+            .where(GroupBalance.user_id == users[0].id)
+            .values(paid_total=Decimal("99.00"))
+        )
+        service = BalanceService(session)
+
+        drift = await service.find_drift(group.id)
+        assert [(d.user_id, d.ledger[0], d.expected[0]) for d in drift] == [
+            (users[0].id, Decimal("99.00"), Decimal("10.00"))
+        ]
+
+        assert await service.rebuild(group.id) == drift
+        assert await service.find_drift(group.id) == []
+
+    @pytest.mark.asyncio
+    async def test_settlements_pay_back_former_members(self, session, users, group):
+        expenses = ExpenseService(session)
+        await GroupService(session).add_member(group.id, GroupMemberCreate(user_id=users[2].id), users[0].id)
+        await expenses.create_expense(_create(group, "30.00"), users[2].id)
+        await GroupService(session).remove_member(group.id, users[2].id, users[2].id)
+        await expenses.create_expense(_create(group, "10.00"), users[0].id)
+
+        plan = await expenses.get_group_settlements(group.id, users[0].id)
+
+        # User 2 is owed 30.00 - 10.00; users 0 and 1 owe 15.00 each, less the 10.00 user 0 paid
+        assert sorted((t.from_user_id, t.to_user_id, t.amount) for t in plan.transfers) == [
+            (users[0].id, users[2].id, Decimal("5.00")),
+            (users[1].id, users[2].id, Decimal("15.00")),
+        ]
@@ -0,0 +1,103 @@
+import pytest
+import pytest_asyncio
+from decimal import Decimal
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+import app.models  # noqa: F401 - register tables on Base.metadata
+from app.db.session import Base
+from app.models.expense import Expense, ExpenseSplit
+from app.models.group import Group, GroupMember
+from app.models.user import User
+from app.core.splits import amount_to_cents, split_equal
+from app.services.balance_service import BalanceService
+from app.services.expense_service import ExpenseService
+
+EXPENSE_COUNT = 1500
+
+
+@pytest_asyncio.fixture
+async def session(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'balances.sqlite3'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)() as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def users(session):
+    users = [User(email=f"user{i}@example.com", hashed_password="hashed") for i in range(4)]
+    session.add_all(users)
+    await session.flush()
+    return users
+
+
+class TestGroupBalanceSummary:
+    """Test cases for balances read from the ledger."""
+
+    @pytest.mark.asyncio
+    async def test_balances_cover_more_than_1000_expenses(self, session, users):
+        members, former_member = users[:3], users[3]
+        group = Group(
+            name="Trip",
+            created_by_user_id=members[0].id,
+            members=[GroupMember(user_id=user.id) for user in members],
+        )
+        session.add(group)
+        await session.flush()
+
+        payers = members + [former_member]
+        rows = [
+            {
+                "id": i + 1,
+                "group_id": group.id,
+                "paid_by_user_id": payers[i % len(payers)].id,
+                "amount": Decimal(i % 97 + 1) + Decimal("0.37"),
+            }
+            for i in range(EXPENSE_COUNT)
+        ]
+        splits = [
+            {"expense_id": row["id"], "user_id": user_id, "share_cents": cents}
+            for row in rows
+            for user_id, cents in split_equal(amount_to_cents(row["amount"]), [user.id for user in members]).items()
+        ]
+        # A raw bulk insert bypasses the ledger, so bring it up to date the way an operator would
+        await session.execute(insert(Expense), rows)
+        await session.execute(insert(ExpenseSplit), splits)
+        assert len(await BalanceService(session).rebuild(group.id)) == 4
+        await session.commit()
+
+        paid = {user.id: Decimal("0") for user in payers}
+        for row in rows:
+            paid[row["paid_by_user_id"]] += row["amount"]
+        total = sum(paid.values())
+        owed = {user.id: Decimal("0") for user in members}
+        for split in splits:
+            owed[split["user_id"]] += Decimal(split["share_cents"]) / 100
+
+        summary = await ExpenseService(session).get_group_balance_summary(group.id, members[0].id)
+
+        assert summary.total_expenses == total
+        assert summary.member_count == 3
+        with pytest.deprecated_call():
+            assert summary.equal_share == total / 3
+        # The former member is still owed what they paid, so balances agree with /settlements
+        assert summary.balances == {str(user.id): paid[user.id] for user in payers}
+        assert sum(owed.values()) == total
+        owed[former_member.id] = Decimal("0")
+        assert summary.net_balances == {str(user.id): paid[user.id] - owed[user.id] for user in payers}
+        assert sum(summary.net_balances.values()) == 0
+        assert summary.former_member_ids == [former_member.id]
+
+    @pytest.mark.asyncio
+    async def test_group_without_expenses(self, session, users):
+        group = Group(name="Empty", created_by_user_id=users[0].id, members=[GroupMember(user_id=users[0].id)])
+        session.add(group)
+        await session.commit()
+
+        summary = await ExpenseService(session).get_group_balance_summary(group.id, users[0].id)
+
+        assert summary.total_expenses == 0
+        assert summary.balances == {str(users[0].id): Decimal("0")}
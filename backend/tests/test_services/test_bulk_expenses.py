@@ -0,0 +1,123 @@
+import pytest
+import pytest_asyncio
+from decimal import Decimal
+from unittest.mock import patch
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+import app.models  # noqa: F401 - register tables on Base.metadata
+from app.db.session import Base
+from app.models.expense import Expense, ExpenseSplit
+from app.models.user import User
+from app.schemas.expense import ExpenseCreate, SplitShare
+from app.schemas.group import GroupCreate, GroupMemberCreate
+from app.services.balance_service import BalanceService
+from app.services.expense_service import ExpenseService
+from app.services.group_service import GroupService
+
+
+@pytest_asyncio.fixture
+async def session(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'bulk.sqlite3'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)() as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def users(session):
+    users = [User(email=f"user{i}@example.com", full_name=f"User {i}", hashed_password="hashed") for i in range(3)]
+    session.add_all(users)
+    await session.flush()
+    return users
+
+
+@pytest_asyncio.fixture
+async def group(session, users):
+    groups = GroupService(session)
+    group = await groups.create_group(GroupCreate(name="Trip"), users[0].id)
+    await groups.add_member(group.id, GroupMemberCreate(user_id=users[1].id), users[0].id)
+    return group
+
+
+def _expense(group_id: int, amount: str, **kwargs) -> ExpenseCreate:
+    return ExpenseCreate(group_id=group_id, amount=Decimal(amount), **kwargs)
+
+
+class TestBulkExpenses:
+    """Test cases for creating and deleting expenses in batches."""
+
+    @pytest.mark.asyncio
+    async def test_create_reports_invalid_items_and_keeps_the_rest(self, session, users, group):
+        service = ExpenseService(session)
+        items = [
+            _expense(group.id, "10.00", metadata={"n": 1}),
+            _expense(group.id + 1, "5.00"),
+            _expense(group.id, "3.00", split_mode="exact", splits=[SplitShare(user_id=users[1].id, amount=Decimal("1.00"))]),
+            _expense(group.id, "4.00", splits=[SplitShare(user_id=users[2].id)]),
+            _expense(group.id, "6.00", split_mode="weight",
+                     splits=[SplitShare(user_id=users[0].id, weight=Decimal(1)), SplitShare(user_id=users[1].id, weight=Decimal(2))]),
+        ]
+
+        result = await service.create_expenses(items, users[0].id)
+
+        assert [expense.amount for expense in result.created] == [Decimal("10.00"), Decimal("6.00")]
+        assert result.created[0].metadata == {"n": 1}
+        assert result.created[0].paid_by_user.email == "user0@example.com"
+        assert [error.index for error in result.errors] == [1, 2, 3]
+        assert result.errors[0].detail == "You must be a member of the group to add expenses"
+        assert await service.repo.get_splits(result.created[1].id) == {users[0].id: 200, users[1].id: 400}
+        assert await BalanceService(session).find_drift() == []
+
+    @pytest.mark.asyncio
+    async def test_atomic_create_rejects_the_whole_batch(self, session, users, group):
+        items = [_expense(group.id, "10.00"), _expense(group.id + 1, "5.00")]
+
+        with pytest.raises(ValueError, match="Item 1: You must be a member"):
+            await ExpenseService(session).create_expenses(items, users[0].id, atomic=True)
+
+        assert await session.scalar(select(func.count()).select_from(Expense)) == 0
+
+    @pytest.mark.asyncio
+    async def test_create_bumps_the_version_once(self, session, users, group):
+        service = ExpenseService(session)
+        before = await service.group_repo.get_version(group.id)
+
+        await service.create_expenses([_expense(group.id, "1.00") for _ in range(5)], users[0].id)
+
+        assert await service.group_repo.get_version(group.id) == before + 1
+
+    @pytest.mark.asyncio
+    async def test_batch_size_is_limited(self, session, users, group):
+        with patch("app.services.expense_service.settings.expense_bulk_max_items", 2):
+            with pytest.raises(ValueError, match="at most 2 items"):
+                await ExpenseService(session).create_expenses([_expense(group.id, "1.00")] * 3, users[0].id)
+
+    @pytest.mark.asyncio
+    async def test_delete_skips_foreign_missing_and_repeated_ids(self, session, users, group):
+        service = ExpenseService(session)
+        mine = (await service.create_expenses([_expense(group.id, "10.00"), _expense(group.id, "2.50")], users[0].id)).created
+        theirs = await service.create_expense(_expense(group.id, "8.00"), users[1].id)
+
+        result = await service.delete_expenses([mine[0].id, theirs.id, 999, mine[1].id, mine[0].id], users[0].id)
+
+        assert result.deleted == [mine[0].id, mine[1].id]
+        assert [(error.index, error.detail) for error in result.errors] == [
+            (1, "You can only delete expenses you paid for"),
+            (2, "Expense not found"),
+            (4, "Expense listed more than once"),
+        ]
+        assert await session.scalar(select(func.count()).select_from(ExpenseSplit)) == 2
+        assert await BalanceService(session).find_drift() == []
+
+    @pytest.mark.asyncio
+    async def test_atomic_delete_rejects_the_whole_batch(self, session, users, group):
+        service = ExpenseService(session)
+        mine = await service.create_expense(_expense(group.id, "10.00"), users[0].id)
+
+        with pytest.raises(ValueError, match="Item 1: Expense not found"):
+            await service.delete_expenses([mine.id, 999], users[0].id, atomic=True)
+
+        assert await service.get_expense(mine.id) is not None
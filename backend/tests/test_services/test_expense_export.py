@@ -0,0 +1,99 @@
+import csv
+import io
+import json
+import pytest
+import pytest_asyncio
+from decimal import Decimal
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+import app.models  # noqa: F401 - register tables on Base.metadata
+from app.core.expense_import import iter_rows
+from app.db.session import Base
+from app.models.user import User
+from app.schemas.expense import ExpenseCreate
+from app.schemas.group import GroupCreate
+from app.services.expense_service import ExpenseService
+from app.services.group_service import GroupService
+
+
+@pytest_asyncio.fixture
+async def engine(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'export.sqlite3'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def session(engine):
+    async with async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)() as session:
+        yield session
+
+
+@pytest_asyncio.fixture
+async def seeded(session):
+    users = [User(email=f"user{i}@example.com", full_name=f"User {i}", hashed_password="hashed") for i in range(2)]
+    session.add_all(users)
+    await session.flush()
+    group = await GroupService(session).create_group(GroupCreate(name="Trip"), users[0].id)
+    service = ExpenseService(session)
+    for amount, description in (("12.50", 'Dinner, "late"\nnight'), ("3.00", None)):
+        await service.create_expense(
+            ExpenseCreate(group_id=group.id, amount=Decimal(amount), description=description, metadata={"a": 1}),
+            users[0].id,
+        )
+    await session.commit()
+    return group, users
+
+
+async def _export(engine, group_id: int, user_id: int, format: str) -> bytes:
+    # Like the route: the stream outlives the session it was started from
+    async with AsyncSession(bind=engine) as session:
+        chunks = await ExpenseService(session).export_group_expenses(group_id, user_id, format)
+    return b"".join([chunk async for chunk in chunks])
+
+
+class TestExpenseExport:
+    """Test cases for the streaming expense export."""
+
+    @pytest.mark.asyncio
+    async def test_csv_export(self, engine, seeded):
+        group, users = seeded
+
+        rows = list(csv.DictReader(io.StringIO((await _export(engine, group.id, users[0].id, "csv")).decode())))
+
+        assert [(row["amount"], row["description"], row["paid_by"]) for row in rows] == [
+            ("12.50", 'Dinner, "late"\nnight', "User 0"),
+            ("3.00", "", "User 0"),
+        ]
+        assert json.loads(rows[0]["metadata"]) == {"a": 1}
+
+    @pytest.mark.asyncio
+    async def test_ndjson_export(self, engine, seeded):
+        group, users = seeded
+
+        lines = (await _export(engine, group.id, users[0].id, "ndjson")).decode().splitlines()
+
+        assert [json.loads(line)["amount"] for line in lines] == ["12.50", "3.00"]
+        assert json.loads(lines[0])["metadata"] == {"a": 1}
+
+    @pytest.mark.asyncio
+    async def test_export_can_be_imported(self, engine, session, seeded):
+        group, users = seeded
+        exported = await _export(engine, group.id, users[0].id, "csv")
+        copy = await GroupService(session).create_group(GroupCreate(name="Copy"), users[0].id)
+
+        async def body():
+            yield exported
+
+        result = await ExpenseService(session).import_expenses(copy.id, users[0].id, iter_rows(body(), "csv"))
+
+        assert (result.imported, result.failed) == (2, 0)
+
+    @pytest.mark.asyncio
+    async def test_only_members_can_export(self, engine, seeded):
+        group, users = seeded
+
+        with pytest.raises(ValueError, match="must be a member of the group to export expenses"):
+            await _export(engine, group.id, users[1].id, "csv")
@@ -0,0 +1,97 @@
+import pytest
+import pytest_asyncio
+from decimal import Decimal
+from unittest.mock import patch
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+import app.models  # noqa: F401 - register tables on Base.metadata
+from app.core.expense_import import iter_rows
+from app.db.session import Base
+from app.models.expense import Expense
+from app.models.user import User
+from app.schemas.group import GroupCreate, GroupMemberCreate
+from app.services.balance_service import BalanceService
+from app.services.expense_service import ExpenseService
+from app.services.group_service import GroupService
+
+
+@pytest_asyncio.fixture
+async def session(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'import.sqlite3'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)() as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def users(session):
+    users = [User(email=f"user{i}@example.com", full_name=f"User {i}", hashed_password="hashed") for i in range(3)]
+    session.add_all(users)
+    await session.flush()
+    return users
+
+
+@pytest_asyncio.fixture
+async def group(session, users):
+    groups = GroupService(session)
+    group = await groups.create_group(GroupCreate(name="Trip"), users[0].id)
+    await groups.add_member(group.id, GroupMemberCreate(user_id=users[1].id), users[0].id)
+    return group
+
+
+async def _body(text: str):
+    yield text.encode()
+
+
+class TestExpenseImport:
+    """Test cases for importing expenses from CSV and NDJSON (SQLite path)."""
+
+    @pytest.mark.asyncio
+    async def test_csv_import_in_batches(self, session, users, group):
+        service = ExpenseService(session)
+        csv = "amount,description,metadata\n" + "".join(f'{n}.00,Row {n},"{{""n"": {n}}}"\n' for n in range(1, 8))
+        csv += "-1,Refund,\n2.00,Bad,{oops\n"
+        before = await service.group_repo.get_version(group.id)
+
+        with patch("app.services.expense_service.settings.expense_import_batch_rows", 3):
+            result = await service.import_expenses(group.id, users[0].id, iter_rows(_body(csv), "csv"))
+
+        assert (result.imported, result.failed) == (7, 2)
+        assert [(error.line, error.detail) for error in result.errors] == [
+            (9, "amount: Input should be greater than 0"),
+            (10, "metadata must be a JSON object"),
+        ]
+        assert await session.scalar(select(func.sum(Expense.amount))) == Decimal("28.00")
+        assert await service.group_repo.get_version(group.id) == before + 1
+        assert await BalanceService(session).find_drift() == []
+
+    @pytest.mark.asyncio
+    async def test_ndjson_rows_can_carry_splits(self, session, users, group):
+        service = ExpenseService(session)
+        ndjson = (
+            f'{{"amount": "9.00", "split_mode": "weight", "splits": [{{"user_id": {users[0].id}, "weight": 1}}, {{"user_id": {users[1].id}, "weight": 2}}]}}\n'
+            f'{{"amount": "1.00", "splits": [{{"user_id": {users[2].id}}}]}}\n'
+        )
+
+        result = await service.import_expenses(group.id, users[0].id, iter_rows(_body(ndjson), "ndjson"))
+
+        assert (result.imported, result.failed) == (1, 1)
+        assert result.errors[0].detail == "Expenses can only be split between members of the group"
+        expense_id = await session.scalar(select(Expense.id))
+        assert await service.repo.get_splits(expense_id) == {users[0].id: 300, users[1].id: 600}
+        assert await BalanceService(session).find_drift() == []
+
+    @pytest.mark.asyncio
+    async def test_atomic_import_stops_at_the_first_bad_row(self, session, users, group):
+        with pytest.raises(ValueError, match="Line 3: amount"):
+            await ExpenseService(session).import_expenses(
+                group.id, users[0].id, iter_rows(_body("amount\n1.00\nnope\n"), "csv"), atomic=True
+            )
+
+    @pytest.mark.asyncio
+    async def test_only_members_can_import(self, session, users, group):
+        with pytest.raises(ValueError, match="must be a member"):
+            await ExpenseService(session).import_expenses(group.id, users[2].id, iter_rows(_body("amount\n1\n"), "csv"))
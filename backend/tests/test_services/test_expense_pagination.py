@@ -0,0 +1,114 @@
+import pytest
+import pytest_asyncio
+from datetime import datetime, timedelta
+from decimal import Decimal
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+import app.models  # noqa: F401 - register tables on Base.metadata
+from app.core.pagination import decode_cursor, encode_cursor
+from app.db.session import Base
+from app.models.expense import Expense
+from app.models.group import Group, GroupMember
+from app.models.user import User
+from app.repositories.expense_repository import ExpenseRepository
+from app.services.expense_service import ExpenseService
+
+BASE_TIME = datetime(2024, 1, 1, 12, 0, 0)
+
+
+@pytest_asyncio.fixture
+async def session(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'pages.sqlite3'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)() as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def group(session):
+    user = User(email="test@example.com", full_name="Test User", hashed_password="hashed")
+    session.add(user)
+    await session.flush()
+    group = Group(name="Trip", created_by_user_id=user.id, members=[GroupMember(user_id=user.id)])
+    session.add(group)
+    await session.flush()
+    # Three expenses share each timestamp, so the id tie-break matters
+    for i in range(25):
+        session.add(_expense(group, BASE_TIME - timedelta(minutes=i // 3)))
+    await session.commit()
+    return group
+
+
+def _expense(group: Group, created_at: datetime) -> Expense:
+    return Expense(
+        group_id=group.id,
+        paid_by_user_id=group.created_by_user_id,
+        amount=Decimal("10.00"),
+        created_at=created_at,
+        updated_at=created_at,
+    )
+
+
+async def _walk(service, group, limit, between_pages=None):
+    ids, cursor = [], ""
+    while True:
+        page = await service.get_group_expenses_page(group.id, group.created_by_user_id, limit, cursor)
+        ids.extend(expense.id for expense in page.items)
+        if page.next_cursor is None:
+            return ids
+        cursor = page.next_cursor
+        if between_pages:
+            await between_pages()
+
+
+class TestExpensePagination:
+    """Test cases for keyset pagination of expense lists."""
+
+    def test_cursor_round_trip(self):
+        cursor = encode_cursor(BASE_TIME, 42)
+        assert decode_cursor(cursor) == (BASE_TIME, 42)
+
+    def test_garbled_cursor_is_rejected(self):
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            decode_cursor("not-a-cursor")
+
+    @pytest.mark.asyncio
+    async def test_pages_match_offset_order(self, session, group):
+        service = ExpenseService(session)
+
+        expected = [e.id for e in await service.get_group_expenses(group.id, group.created_by_user_id, 100)]
+        paged = await _walk(service, group, limit=7)
+
+        assert len(expected) == 25
+        assert paged == expected
+
+    @pytest.mark.asyncio
+    async def test_inserts_during_paging_do_not_shift_pages(self, session, group):
+        service = ExpenseService(session)
+        expected = [e.id for e in await service.get_group_expenses(group.id, group.created_by_user_id, 100)]
+
+        async def add_newest_expense():
+            session.add(_expense(group, BASE_TIME + timedelta(hours=1)))
+            await session.flush()
+
+        paged = await _walk(service, group, limit=5, between_pages=add_newest_expense)
+
+        assert paged == expected
+
+    @pytest.mark.asyncio
+    async def test_user_expenses_page(self, session, group):
+        service = ExpenseService(session)
+
+        page = await service.get_user_expenses_page(group.created_by_user_id, limit=30, cursor="")
+
+        assert len(page.items) == 25
+        assert page.next_cursor is None
+
+    def test_keyset_predicate_has_a_range_bound(self):
+        # PostgreSQL cannot seek the index on the OR alone (SQLite works the bound out itself)
+        query = ExpenseRepository._page(select(Expense.id).where(Expense.group_id == 1), 10, 0, (BASE_TIME, 5))
+
+        assert "expenses.created_at <= :created_at_1 AND (expenses.created_at <" in str(query)
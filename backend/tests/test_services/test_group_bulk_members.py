@@ -0,0 +1,81 @@
+import pytest
+import pytest_asyncio
+from unittest.mock import AsyncMock, patch
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+import app.models  # noqa: F401 - register tables on Base.metadata
+from app.db.session import Base
+from app.models.user import User
+from app.schemas.group import GroupCreate, GroupMemberCreate
+from app.services.group_service import GroupService
+
+
+@pytest_asyncio.fixture
+async def session(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'members.sqlite3'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)() as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def users(session):
+    users = [User(email=f"user{i}@example.com", full_name=f"User {i}", hashed_password="hashed") for i in range(4)]
+    session.add_all(users)
+    await session.flush()
+    return users
+
+
+@pytest_asyncio.fixture
+async def group(session, users):
+    groups = GroupService(session)
+    group = await groups.create_group(GroupCreate(name="Trip"), users[0].id)
+    await groups.add_member(group.id, GroupMemberCreate(user_id=users[1].id), users[0].id)
+    return group
+
+
+class TestBulkAddMembers:
+    """Test cases for adding several group members at once."""
+
+    @pytest.mark.asyncio
+    async def test_reports_added_existing_and_unknown_ids(self, session, users, group):
+        service = GroupService(session)
+        before = await service.repo.get_version(group.id)
+        ids = [users[1].id, users[2].id, 999, users[3].id, users[2].id]
+
+        result = await service.add_members(group.id, ids, users[0].id)
+
+        assert result.added == [users[2].id, users[3].id]
+        assert result.already_members == [users[1].id]
+        assert result.unknown == [999]
+        assert await service.repo.get_member_ids(group.id) == {user.id for user in users}
+        assert await service.repo.get_version(group.id) == before + 1
+
+    @pytest.mark.asyncio
+    async def test_nothing_new_leaves_the_version_alone(self, session, users, group):
+        service = GroupService(session)
+        before = await service.repo.get_version(group.id)
+
+        result = await service.add_members(group.id, [users[1].id, 999], users[0].id)
+
+        assert result.added == []
+        assert await service.repo.get_version(group.id) == before
+
+    @pytest.mark.asyncio
+    async def test_membership_created_meanwhile_is_skipped(self, session, users, group):
+        service = GroupService(session)
+        # As if another request added users[1] after the check
+        stale = AsyncMock(return_value={users[1].id: False, users[2].id: False})
+
+        with patch.object(service.repo, "get_memberships", stale):
+            result = await service.add_members(group.id, [users[1].id, users[2].id], users[0].id)
+
+        assert result.added == [users[2].id]
+        assert result.already_members == [users[1].id]
+
+    @pytest.mark.asyncio
+    async def test_only_members_can_add(self, session, users, group):
+        with pytest.raises(ValueError, match="must be a member of the group to add other members"):
+            await GroupService(session).add_members(group.id, [users[3].id], users[2].id)
@@ -0,0 +1,92 @@
+import pytest
+import pytest_asyncio
+from decimal import Decimal
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+import app.models  # noqa: F401 - register tables on Base.metadata
+from app.core.read_cache import group_read_cache
+from app.db.session import Base
+from app.models.user import User
+from app.schemas.expense import ExpenseCreate, ExpenseUpdate
+from app.schemas.group import GroupCreate, GroupMemberCreate, GroupUpdate
+from app.schemas.user import UserUpdate
+from app.services.expense_service import ExpenseService
+from app.services.group_service import GroupService
+from app.services.user_service import UserService
+
+
+@pytest_asyncio.fixture
+async def session(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'versions.sqlite3'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)() as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def users(session):
+    users = [User(email=f"user{i}@example.com", full_name=f"User {i}", hashed_password="hashed") for i in range(2)]
+    session.add_all(users)
+    await session.flush()
+    return users
+
+
+@pytest_asyncio.fixture
+async def group(session, users):
+    return await GroupService(session).create_group(GroupCreate(name="Trip"), users[0].id)
+
+
+class TestGroupVersions:
+    """Test cases for group versions and the cached group reads they key."""
+
+    @pytest.mark.asyncio
+    async def test_every_write_bumps_the_version(self, session, users, group):
+        groups, expenses = GroupService(session), ExpenseService(session)
+        owner, other = users
+
+        async def version():
+            return await groups.repo.get_version(group.id, owner.id)
+
+        writes = [
+            lambda: groups.update_group(group.id, GroupUpdate(name="Renamed"), owner.id),
+            lambda: groups.add_member(group.id, GroupMemberCreate(user_id=other.id), owner.id),
+            lambda: expenses.create_expense(ExpenseCreate(group_id=group.id, amount=Decimal("5.00")), owner.id),
+            lambda: expenses.update_expense(1, ExpenseUpdate(description="Lunch"), owner.id),
+            lambda: expenses.delete_expense(1, owner.id),
+            lambda: UserService(session).update_user(other.id, UserUpdate(full_name="Renamed User")),
+            lambda: groups.remove_member(group.id, other.id, owner.id),
+        ]
+        for write in writes:
+            before = await version()
+            await write()
+            assert await version() == before + 1
+
+    @pytest.mark.asyncio
+    async def test_non_member_gets_no_version(self, session, users, group):
+        assert await GroupService(session).repo.get_version(group.id, users[1].id) is None
+
+    @pytest.mark.asyncio
+    async def test_cached_balance_follows_writes(self, session, users, group):
+        expenses = ExpenseService(session)
+        first = await expenses.get_group_balance_summary(group.id, users[0].id)
+
+        assert await expenses.get_group_balance_summary(group.id, users[0].id) is first
+        assert group_read_cache.stats()["hits"] == 1
+
+        await expenses.create_expense(ExpenseCreate(group_id=group.id, amount=Decimal("7.00")), users[0].id)
+        summary = await expenses.get_group_balance_summary(group.id, users[0].id, allow_stale=False)
+
+        assert summary.total_expenses == Decimal("7.00")
+
+    @pytest.mark.asyncio
+    async def test_renamed_member_shows_up_in_cached_summary(self, session, users, group):
+        expenses = ExpenseService(session)
+        await expenses.create_expense(ExpenseCreate(group_id=group.id, amount=Decimal("7.00")), users[0].id)
+        await expenses.get_group_expense_summary(group.id, users[0].id)
+
+        await UserService(session).update_user(users[0].id, UserUpdate(full_name="New Name"))
+        summary = await expenses.get_group_expense_summary(group.id, users[0].id, allow_stale=False)
+
+        assert summary.user_names == {str(users[0].id): "New Name"}
@@ -0,0 +1,119 @@
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.security import hash_refresh_token, verify_token
+from app.db.session import Base
+from app.models.refresh_token import RefreshToken
+from app.models.user import User
+from app.services.user_service import UserService
+
+
+def _stored(**overrides) -> RefreshToken:
+    values = dict(
+        id=1,
+        user_id=7,
+        token_hash=hash_refresh_token("refresh-token"),
+        expires_at=datetime.utcnow() + timedelta(days=1),
+        revoked_at=None,
+    )
+    values.update(overrides)
+    return RefreshToken(**values)
+
+
+class TestRefreshTokens:
+    """Test cases for refresh token rotation and revocation in UserService."""
+
+    @pytest.mark.asyncio
+    async def test_refresh_rotates_token(self):
+        mock_session = AsyncMock()
+        mock_refresh_repo = AsyncMock()
+        mock_refresh_repo.claim.return_value = (1, 7)
+        mock_refresh_repo.create.return_value = _stored(id=2, token_hash="new")
+
+        with patch('app.services.user_service.RefreshTokenRepository', return_value=mock_refresh_repo):
+            service = UserService(mock_session)
+            token = await service.refresh_access_token("refresh-token")
+
+        assert token is not None
+        assert token.refresh_token != "refresh-token"
+        assert verify_token(token.access_token)["sub"] == "7"
+        mock_refresh_repo.claim.assert_awaited_once_with(hash_refresh_token("refresh-token"))
+        mock_refresh_repo.get_by_hash.assert_not_awaited()
+        mock_refresh_repo.set_replaced_by.assert_awaited_once_with(1, 2)
+        # Committed by the request-scoped unit of work, not the service
+        mock_session.commit.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_reused_token_revokes_all_user_tokens(self):
+        mock_session = AsyncMock()
+        mock_refresh_repo = AsyncMock()
+        mock_refresh_repo.claim.return_value = None
+        mock_refresh_repo.get_by_hash.return_value = _stored(revoked_at=datetime.utcnow())
+
+        with patch('app.services.user_service.RefreshTokenRepository', return_value=mock_refresh_repo):
+            service = UserService(mock_session)
+            token = await service.refresh_access_token("refresh-token")
+
+        assert token is None
+        mock_refresh_repo.revoke_all_for_user.assert_awaited_once_with(7)
+        mock_refresh_repo.create.assert_not_awaited()
+        # Must survive the rollback of the failed (401) request
+        mock_session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_expired_or_unknown_token_is_rejected(self):
+        mock_session = AsyncMock()
+        mock_refresh_repo = AsyncMock()
+        mock_refresh_repo.claim.return_value = None
+        mock_refresh_repo.get_by_hash.side_effect = [None, _stored(expires_at=datetime.utcnow() - timedelta(seconds=1))]
+
+        with patch('app.services.user_service.RefreshTokenRepository', return_value=mock_refresh_repo):
+            service = UserService(mock_session)
+            assert await service.refresh_access_token("unknown") is None
+            assert await service.refresh_access_token("refresh-token") is None
+
+        mock_refresh_repo.create.assert_not_awaited()
+        mock_session.commit.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_revoke_refresh_token(self):
+        mock_session = AsyncMock()
+        mock_refresh_repo = AsyncMock()
+        stored = _stored()
+        mock_refresh_repo.get_by_hash.return_value = stored
+
+        with patch('app.services.user_service.RefreshTokenRepository', return_value=mock_refresh_repo):
+            service = UserService(mock_session)
+            assert await service.revoke_refresh_token("refresh-token")
+
+        mock_refresh_repo.revoke.assert_awaited_once_with(stored)
+        mock_session.commit.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_second_rotation_of_one_token_is_reuse(self, tmp_path):
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'refresh.sqlite3'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        sessions = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+        async with sessions() as session:
+            session.add(User(id=7, email="test@example.com", hashed_password="x"))
+            await session.flush()
+            token = await UserService(session)._issue_tokens(7)
+            await session.commit()
+
+        try:
+            async with sessions() as first, sessions() as second:
+                rotated = await UserService(first).refresh_access_token(token.refresh_token)
+                await first.commit()
+                assert rotated is not None
+                assert await UserService(second).refresh_access_token(token.refresh_token) is None
+
+            async with sessions() as session:
+                tokens = (await session.execute(select(RefreshToken).order_by(RefreshToken.id))).scalars().all()
+            assert tokens[0].replaced_by_id == tokens[1].id
+            assert all(stored.revoked_at is not None for stored in tokens)
+        finally:
+            await engine.dispose()
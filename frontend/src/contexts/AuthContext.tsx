@@ -17,6 +17,7 @@ export const AuthProvider: React.FC<AuthProviderProps> = ({ children }) => {
     setToken(null);
     setUser(null);
     localStorage.removeItem('token');
+    localStorage.removeItem('refreshToken');
     localStorage.removeItem('user');
   };
 
@@ -56,6 +57,9 @@ export const AuthProvider: React.FC<AuthProviderProps> = ({ children }) => {
       
       // Store token in localStorage BEFORE making getCurrentUser call
       localStorage.setItem('token', tokenData.access_token);
+      if (tokenData.refresh_token) {
+        localStorage.setItem('refreshToken', tokenData.refresh_token);
+      }
       setToken(tokenData.access_token);
       console.log('[Auth] Token stored in localStorage and state');
       
@@ -82,6 +86,10 @@ export const AuthProvider: React.FC<AuthProviderProps> = ({ children }) => {
   };
 
   const logout = () => {
+    if (localStorage.getItem('token')) {
+      // Revokes the access token and every refresh token server-side
+      apiClient.logout().catch(() => undefined);
+    }
     resetAuth();
   };
 
@@ -56,7 +56,31 @@ class ApiClient {
     // Add response interceptor to handle auth errors
     this.client.interceptors.response.use(
       (response) => response,
-      (error) => {
+      async (error) => {
+        // Renew an expired access token once with the refresh token instead of re-posting the password
+        const originalRequest = error.config;
+        const refreshToken = localStorage.getItem('refreshToken');
+        if (
+          error.response?.status === 401 &&
+          refreshToken &&
+          originalRequest &&
+          !originalRequest._retry &&
+          !originalRequest.url?.startsWith('/users/token/')
+        ) {
+          originalRequest._retry = true;
+          try {
+            const tokenData = await this.refreshToken(refreshToken);
+            localStorage.setItem('token', tokenData.access_token);
+            if (tokenData.refresh_token) {
+              localStorage.setItem('refreshToken', tokenData.refresh_token);
+            }
+            originalRequest.headers.Authorization = `Bearer ${tokenData.access_token}`;
+            return this.client(originalRequest);
+          } catch (refreshError) {
+            localStorage.removeItem('refreshToken');
+          }
+        }
+
         // Only redirect to login for 401 errors on protected routes
         // Don't redirect if we're already on login/signup pages
         if (error.response?.status === 401) {
@@ -88,6 +112,15 @@ class ApiClient {
     return response.data;
   }
 
+  async refreshToken(refreshToken: string): Promise<Token> {
+    const response: AxiosResponse<Token> = await this.client.post('/users/token/refresh', { refresh_token: refreshToken });
+    return response.data;
+  }
+
+  async logout(): Promise<void> {
+    await this.client.post('/users/logout');
+  }
+
   async getCurrentUser(): Promise<User> {
     const response: AxiosResponse<User> = await this.client.get('/users/me');
     return response.data;
@@ -26,6 +26,7 @@ export interface UserLogin {
 export interface Token {
   access_token: string;
   token_type: string;
+  refresh_token?: string;
 }
 
 // Group types
@@ -64,6 +65,16 @@ export interface GroupMemberCreate {
   user_id: number;
 }
 
+export interface GroupMembersAdd {
+  user_ids: number[];
+}
+
+export interface GroupMembersAddResult {
+  added: number[];
+  already_members: number[];
+  unknown: number[]; // no such user
+}
+
 // Expense types
 export interface Expense {
   id: number;
@@ -78,12 +89,22 @@ export interface Expense {
   paid_by_user: User;
 }
 
+export type SplitMode = 'equal' | 'weight' | 'exact';
+
+export interface SplitShare {
+  user_id: number;
+  weight?: number; // split_mode 'weight'
+  amount?: number; // split_mode 'exact'
+}
+
 export interface ExpenseCreate {
   group_id: number;
   amount: number;
   description?: string;
   category?: string;
   metadata?: Record<string, any>;
+  split_mode?: SplitMode; // defaults to 'equal'
+  splits?: SplitShare[]; // omitted: all current members
 }
 
 export interface ExpenseUpdate {
@@ -91,23 +112,54 @@ export interface ExpenseUpdate {
   description?: string;
   category?: string;
   metadata?: Record<string, any>;
+  split_mode?: SplitMode;
+  splits?: SplitShare[];
+}
+
+export interface BulkItemError {
+  index: number; // position of the item in the request
+  detail: string;
+}
+
+export interface ExpenseBulkCreateResult {
+  created: Expense[]; // request order, failed items left out
+  errors: BulkItemError[];
+}
+
+export interface ExpenseBulkDeleteResult {
+  deleted: number[];
+  errors: BulkItemError[];
 }
 
 export interface ExpenseSummary {
   total_amount: string; // API returns as string
   expense_count: number;
   by_category: Record<string, string>; // API returns as string
-  by_user: Record<string, string>; // API returns as string
+  by_user: Record<string, string>; // user id -> amount; API returns as string
+  user_names: Record<string, string>; // user id -> display name
 }
 
 export interface BalanceSummary {
   group_id: number;
   group_name: string;
   total_expenses: string; // API returns as string
-  member_count: number;
+  member_count: number; // current members
+  /** @deprecated total_expenses / member_count, not what anyone owes; use net_balances */
   equal_share: string; // API returns as string
-  balances: Record<string, string>; // API returns as string
-  net_balances: Record<string, string>; // API returns as string
+  balances: Record<string, string>; // user id -> paid; API returns as string
+  net_balances: Record<string, string>; // user id -> paid minus owed; API returns as string
+  former_member_ids: number[]; // ex-members still on the ledger
+}
+
+export interface Settlement {
+  from_user_id: number;
+  to_user_id: number;
+  amount: string; // API returns as string
+}
+
+export interface SettlementPlan {
+  group_id: number;
+  transfers: Settlement[];
 }
 
 // API Response types